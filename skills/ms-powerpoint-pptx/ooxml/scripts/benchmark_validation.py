@@ -0,0 +1,733 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the OOXML validation pipeline.
+
+Usage:
+    python benchmark_validation.py preprocess <dir|file.docx|file.pptx> [--repeat N]
+    python benchmark_validation.py scaling [--sizes 10,100,1000] [--repeat N]
+        [--dimensions slides,paragraphs,...] [--output FILE]
+        [--baseline FILE] [--tolerance 1.5]
+    python benchmark_validation.py names [--runs 50000] [--repeat N]
+
+preprocess: Compares the single-walk XSD preprocessing with the previous
+serialize/reparse pipeline on every part that has a schema, checks that both
+produce identical trees, and reports the time per part.
+
+scaling: Generates synthetic packages with N slides, paragraphs, comments,
+tracked changes or images, validates each one as an unpacked directory against
+its original, and reports the time of every check per size with its scaling
+exponent (the slope of log(time) over log(N): 1 is linear, 2 quadratic).
+Results are written as JSON. With --baseline, checks that got slower than the
+baseline by more than --tolerance are reported and the exit code is 1.
+
+names: Compares the per-element cost of the shared Clark-name constants,
+precompiled XPath expressions and string whitespace checks with the f-string
+names, ad-hoc XPath strings and regexes they replaced, on a synthetic document
+with --runs runs.
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import json
+import math
+import platform
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+from validation import BaseSchemaValidator
+from validation.docx import _has_edge_whitespace
+from validation.redlining import ORIGINAL_TEXT_CACHE
+from validation.report import ValidationReport
+from validation.xml_names import DELTEXT_TAG, T_TAG, claude_changes
+from verify_ooxml import get_validators, run_validators
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+WP_NAMESPACE = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+A_NAMESPACE = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PIC_NAMESPACE = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+P_NAMESPACE = "http://schemas.openxmlformats.org/presentationml/2006/main"
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+R_NAMESPACE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Content types of the generated parts
+DOCUMENT_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+STYLES_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"
+SETTINGS_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"
+COMMENTS_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"
+PRESENTATION_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+SLIDE_MASTER_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"
+SLIDE_LAYOUT_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+THEME_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.theme+xml"
+
+# A 1x1 pixel PNG used for every generated image
+PNG_IMAGE = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+# Checks slower than the baseline by less than this many seconds are noise
+REGRESSION_NOISE_FLOOR = 0.005
+
+
+def legacy_preprocess(validator, xml_doc, clean_namespaces):
+    """Previous XSD preprocessing: up to two serialize/reparse copies and a recursive prune."""
+    template_pattern = re.compile(r"\{\{[^}]*\}\}")
+
+    # Remove template tags from a reparsed copy
+    xml_copy = lxml.etree.fromstring(lxml.etree.tostring(xml_doc, encoding="unicode"))
+    for elem in xml_copy.iter():
+        if not hasattr(elem, "tag") or callable(elem.tag):
+            continue
+        tag_str = str(elem.tag)
+        if tag_str.endswith("}t") or tag_str == "t":
+            continue
+        if elem.text:
+            elem.text = template_pattern.sub("", elem.text)
+        if elem.tail:
+            elem.tail = template_pattern.sub("", elem.tail)
+
+    # Remove mc:Ignorable from the root
+    ignorable = f"{{{validator.MC_NAMESPACE}}}Ignorable"
+    if ignorable in xml_copy.attrib:
+        del xml_copy.attrib[ignorable]
+
+    if not clean_namespaces:
+        return lxml.etree.ElementTree(xml_copy)
+
+    # Remove foreign attributes, then foreign elements, from a second reparsed copy
+    xml_copy = lxml.etree.fromstring(lxml.etree.tostring(xml_copy, encoding="unicode"))
+    for elem in xml_copy.iter():
+        for attr in [a for a in elem.attrib if "{" in a]:
+            if attr.split("}")[0][1:] not in validator.OOXML_NAMESPACES:
+                del elem.attrib[attr]
+
+    def remove_foreign_elements(root):
+        to_remove = []
+        for elem in list(root):
+            if not hasattr(elem, "tag") or callable(elem.tag):
+                continue
+            tag_str = str(elem.tag)
+            if tag_str.startswith("{"):
+                if tag_str.split("}")[0][1:] not in validator.OOXML_NAMESPACES:
+                    to_remove.append(elem)
+                    continue
+            remove_foreign_elements(elem)
+        for elem in to_remove:
+            root.remove(elem)
+
+    remove_foreign_elements(xml_copy)
+    return lxml.etree.ElementTree(xml_copy)
+
+
+def time_call(function, repeat):
+    """Get the fastest of repeat runs of a function, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_preprocess(args):
+    validator = BaseSchemaValidator(args.path, None)
+    total_legacy = total_new = 0.0
+    mismatches = []
+
+    print(f"{'Part':<40} {'Legacy ms':>10} {'New ms':>10} {'Speedup':>8}")
+    for xml_file in validator.xml_files:
+        if not validator._get_schema_path(xml_file):
+            continue
+        part_name = validator._get_part_name(xml_file)
+        try:
+            xml_doc = validator._parse_part(xml_file)
+        except lxml.etree.XMLSyntaxError:
+            continue
+        clean = validator._needs_namespace_cleaning(Path(part_name))
+
+        legacy = legacy_preprocess(validator, xml_doc, clean)
+        new = validator._preprocess_for_xsd(xml_doc, clean)
+        if lxml.etree.tostring(legacy) != lxml.etree.tostring(new):
+            mismatches.append(part_name)
+
+        legacy_time = time_call(
+            lambda: legacy_preprocess(validator, xml_doc, clean), args.repeat
+        )
+        new_time = time_call(
+            lambda: validator._preprocess_for_xsd(xml_doc, clean), args.repeat
+        )
+        total_legacy += legacy_time
+        total_new += new_time
+        print(
+            f"{part_name:<40} {legacy_time * 1000:>10.2f} {new_time * 1000:>10.2f} "
+            f"{legacy_time / new_time if new_time else 0:>7.1f}x"
+        )
+
+    print(
+        f"{'Total':<40} {total_legacy * 1000:>10.2f} {total_new * 1000:>10.2f} "
+        f"{total_legacy / total_new if total_new else 0:>7.1f}x"
+    )
+    if mismatches:
+        print(f"MISMATCH - Preprocessed trees differ for: {', '.join(mismatches)}")
+        return False
+    print("All preprocessed trees are identical")
+    return True
+
+
+def content_types(overrides, defaults=()):
+    """Build [Content_Types].xml from (part name, content type) overrides and (extension, content type) defaults."""
+    defaults = [
+        ("rels", "application/vnd.openxmlformats-package.relationships+xml"),
+        ("xml", "application/xml"),
+        *defaults,
+    ]
+    return (
+        f'{XML_DECLARATION}<Types xmlns="{CONTENT_TYPES_NAMESPACE}">'
+        + "".join(
+            f'<Default Extension="{extension}" ContentType="{content_type}"/>'
+            for extension, content_type in defaults
+        )
+        + "".join(
+            f'<Override PartName="/{part_name}" ContentType="{content_type}"/>'
+            for part_name, content_type in overrides
+        )
+        + "</Types>"
+    )
+
+
+def relationships(targets):
+    """Build a .rels part from (id, type, target), with the type's last segment only."""
+    return (
+        f'{XML_DECLARATION}<Relationships xmlns="{PACKAGE_RELATIONSHIPS_NAMESPACE}">'
+        + "".join(
+            f'<Relationship Id="{rel_id}" Type="{R_NAMESPACE}/{rel_type}" Target="{target}"/>'
+            for rel_id, rel_type, target in targets
+        )
+        + "</Relationships>"
+    )
+
+
+def synthetic_paragraph(
+    i, comment=False, tracked_change=False, image=False, original=False
+):
+    """Build paragraph i of a synthetic document.
+
+    A tracked change is Claude's deletion of "old" and insertion of "new". In
+    the original version of the paragraph, "old" is plain text.
+    """
+    runs = [
+        f'<w:r><w:t xml:space="preserve">Paragraph {i} of the document, </w:t></w:r>'
+    ]
+    if tracked_change and original:
+        runs.append("<w:r><w:t>old</w:t></w:r>")
+    elif tracked_change:
+        runs.append(
+            f'<w:del w:id="{2 * i + 1}" w:author="Claude" w:date="2025-01-01T00:00:00Z">'
+            "<w:r><w:delText>old</w:delText></w:r></w:del>"
+            f'<w:ins w:id="{2 * i + 2}" w:author="Claude" w:date="2025-01-01T00:00:00Z">'
+            "<w:r><w:t>new</w:t></w:r></w:ins>"
+        )
+    runs.append('<w:r><w:t xml:space="preserve"> text.</w:t></w:r>')
+    if comment:
+        runs = [
+            f'<w:commentRangeStart w:id="{i}"/>',
+            *runs,
+            f'<w:commentRangeEnd w:id="{i}"/>',
+            f'<w:r><w:commentReference w:id="{i}"/></w:r>',
+        ]
+    if image:
+        runs.append(
+            '<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+            f'<wp:extent cx="9525" cy="9525"/><wp:docPr id="{i + 1}" name="Picture {i + 1}"/>'
+            f'<a:graphic><a:graphicData uri="{PIC_NAMESPACE}"><pic:pic>'
+            f'<pic:nvPicPr><pic:cNvPr id="{i + 1}" name="image{i + 1}.png"/><pic:cNvPicPr/></pic:nvPicPr>'
+            f'<pic:blipFill><a:blip r:embed="rIdImage{i + 1}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+            '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="9525" cy="9525"/></a:xfrm>'
+            '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+            "</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r>"
+        )
+    return f'<w:p w14:paraId="{i + 1:08X}">{"".join(runs)}</w:p>'
+
+
+def synthetic_docx(paragraphs, comments=0, tracked_changes=0, images=0):
+    """Generate a Word package whose first paragraphs have a comment, tracked change or image each.
+
+    Returns:
+        tuple: (original parts, modified parts), each a dict of part name ->
+            content. Only word/document.xml differs, by the tracked changes.
+    """
+    paragraphs = max(paragraphs, comments, tracked_changes, images)
+    overrides = [
+        ("word/document.xml", DOCUMENT_CONTENT_TYPE),
+        ("word/styles.xml", STYLES_CONTENT_TYPE),
+        ("word/settings.xml", SETTINGS_CONTENT_TYPE),
+    ]
+    document_rels = [
+        ("rId1", "styles", "styles.xml"),
+        ("rId2", "settings", "settings.xml"),
+    ]
+    parts = {
+        "_rels/.rels": relationships([("rId1", "officeDocument", "word/document.xml")]),
+        "word/styles.xml": (
+            f'{XML_DECLARATION}<w:styles xmlns:w="{W_NAMESPACE}">'
+            '<w:style w:type="paragraph" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+            "</w:styles>"
+        ),
+        "word/settings.xml": (
+            f'{XML_DECLARATION}<w:settings xmlns:w="{W_NAMESPACE}">'
+            '<w:defaultTabStop w:val="720"/><w:compat/></w:settings>'
+        ),
+    }
+
+    if comments:
+        overrides.append(("word/comments.xml", COMMENTS_CONTENT_TYPE))
+        document_rels.append(("rId3", "comments", "comments.xml"))
+        parts["word/comments.xml"] = (
+            f'{XML_DECLARATION}<w:comments xmlns:w="{W_NAMESPACE}">'
+            + "".join(
+                f'<w:comment w:id="{i}" w:author="Reviewer" w:date="2025-01-01T00:00:00Z" w:initials="R">'
+                f"<w:p><w:r><w:t>Comment {i}</w:t></w:r></w:p></w:comment>"
+                for i in range(comments)
+            )
+            + "</w:comments>"
+        )
+
+    for i in range(images):
+        document_rels.append((f"rIdImage{i + 1}", "image", f"media/image{i + 1}.png"))
+        parts[f"word/media/image{i + 1}.png"] = PNG_IMAGE
+
+    parts["[Content_Types].xml"] = content_types(
+        overrides, [("png", "image/png")] if images else []
+    )
+    parts["word/_rels/document.xml.rels"] = relationships(document_rels)
+
+    def document(original):
+        body = "".join(
+            synthetic_paragraph(
+                i,
+                comment=i < comments,
+                tracked_change=i < tracked_changes,
+                image=i < images,
+                original=original,
+            )
+            for i in range(paragraphs)
+        )
+        return (
+            f'{XML_DECLARATION}<w:document xmlns:w="{W_NAMESPACE}" xmlns:r="{R_NAMESPACE}" '
+            f'xmlns:w14="{W14_NAMESPACE}" xmlns:wp="{WP_NAMESPACE}" xmlns:a="{A_NAMESPACE}" '
+            f'xmlns:pic="{PIC_NAMESPACE}" xmlns:mc="{MC_NAMESPACE}" mc:Ignorable="w14">'
+            f"<w:body>{body}<w:sectPr/></w:body></w:document>"
+        )
+
+    original_parts = {**parts, "word/document.xml": document(original=True)}
+    modified_parts = {**parts, "word/document.xml": document(original=False)}
+    return original_parts, modified_parts
+
+
+def synthetic_pptx(slides):
+    """Generate a PowerPoint package with one master, layout and theme and N slides.
+
+    Returns:
+        tuple: (original parts, modified parts), which are identical
+    """
+    namespaces = (
+        f'xmlns:a="{A_NAMESPACE}" xmlns:r="{R_NAMESPACE}" xmlns:p="{P_NAMESPACE}"'
+    )
+    shape_tree = (
+        '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        "</p:nvGrpSpPr><p:grpSpPr/><p:sp><p:nvSpPr>"
+        '<p:cNvPr id="2" name="Title"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr><p:spPr/>'
+        "<p:txBody><a:bodyPr/><a:p><a:r><a:t>Title</a:t></a:r></a:p></p:txBody>"
+        "</p:sp></p:spTree></p:cSld>"
+    )
+    overrides = [
+        ("ppt/presentation.xml", PRESENTATION_CONTENT_TYPE),
+        ("ppt/slideMasters/slideMaster1.xml", SLIDE_MASTER_CONTENT_TYPE),
+        ("ppt/slideLayouts/slideLayout1.xml", SLIDE_LAYOUT_CONTENT_TYPE),
+        ("ppt/theme/theme1.xml", THEME_CONTENT_TYPE),
+    ]
+    presentation_rels = [
+        ("rId1", "slideMaster", "slideMasters/slideMaster1.xml"),
+        ("rId2", "theme", "theme/theme1.xml"),
+    ]
+    parts = {}
+    slide_ids = []
+    for i in range(1, slides + 1):
+        overrides.append((f"ppt/slides/slide{i}.xml", SLIDE_CONTENT_TYPE))
+        presentation_rels.append((f"rId{i + 2}", "slide", f"slides/slide{i}.xml"))
+        slide_ids.append(f'<p:sldId id="{255 + i}" r:id="rId{i + 2}"/>')
+        parts[f"ppt/slides/slide{i}.xml"] = (
+            f"{XML_DECLARATION}<p:sld {namespaces}>{shape_tree}</p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{i}.xml.rels"] = relationships(
+            [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml")]
+        )
+
+    parts.update(
+        {
+            "[Content_Types].xml": content_types(overrides),
+            "_rels/.rels": relationships(
+                [("rId1", "officeDocument", "ppt/presentation.xml")]
+            ),
+            "ppt/presentation.xml": (
+                f"{XML_DECLARATION}<p:presentation {namespaces}>"
+                '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+                f'<p:sldIdLst>{"".join(slide_ids)}</p:sldIdLst>'
+                '<p:sldSz cx="9144000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+                "</p:presentation>"
+            ),
+            "ppt/_rels/presentation.xml.rels": relationships(presentation_rels),
+            "ppt/slideMasters/slideMaster1.xml": (
+                f"{XML_DECLARATION}<p:sldMaster {namespaces}>{shape_tree}"
+                '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" '
+                'accent2="accent2" accent3="accent3" accent4="accent4" accent5="accent5" '
+                'accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+                '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+                "</p:sldMaster>"
+            ),
+            "ppt/slideMasters/_rels/slideMaster1.xml.rels": relationships(
+                [
+                    ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+                    ("rId2", "theme", "../theme/theme1.xml"),
+                ]
+            ),
+            "ppt/slideLayouts/slideLayout1.xml": (
+                f"{XML_DECLARATION}<p:sldLayout {namespaces}>{shape_tree}</p:sldLayout>"
+            ),
+            "ppt/slideLayouts/_rels/slideLayout1.xml.rels": relationships(
+                [("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")]
+            ),
+            "ppt/theme/theme1.xml": (
+                f'{XML_DECLARATION}<a:theme xmlns:a="{A_NAMESPACE}" name="Theme">'
+                "<a:themeElements/></a:theme>"
+            ),
+        }
+    )
+    return parts, parts
+
+
+# Dimension name -> (file extension, function generating packages of size N)
+DIMENSIONS = {
+    "slides": (".pptx", synthetic_pptx),
+    "paragraphs": (".docx", synthetic_docx),
+    "comments": (".docx", lambda n: synthetic_docx(n, comments=n)),
+    "tracked_changes": (".docx", lambda n: synthetic_docx(n, tracked_changes=n)),
+    "images": (".docx", lambda n: synthetic_docx(n, images=n)),
+}
+
+
+def write_package(parts, directory, original_file):
+    """Write parts unpacked to a directory and zipped to an original file."""
+    with zipfile.ZipFile(original_file, "w", zipfile.ZIP_DEFLATED) as package:
+        for part_name, content in parts[0].items():
+            package.writestr(part_name, content)
+    for part_name, content in parts[1].items():
+        path = directory / part_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+
+
+def time_checks(validators, unpacked_dir, original_file):
+    """Validate a package once and get the wall time of every check.
+
+    Results cached per document (original XSD errors, per-part results and
+    original text) are cleared first. Compiled schemas are kept, so the
+    first run of a process also pays for compiling them.
+
+    Returns:
+        tuple: (check name -> seconds, whether all checks passed)
+    """
+    BaseSchemaValidator._original_errors_cache.clear()
+    BaseSchemaValidator._part_results_cache.clear()
+    ORIGINAL_TEXT_CACHE.clear()
+
+    report = ValidationReport()
+    with contextlib.redirect_stdout(io.StringIO()):
+        passed = run_validators(validators, unpacked_dir, original_file, report=report)
+    return {check.name: check.wall_time for check in report.checks}, passed
+
+
+def scaling_exponent(sizes, times):
+    """Get the least-squares slope of log(time) over log(size), or None with fewer than two points."""
+    points = [
+        (math.log(size), math.log(seconds))
+        for size, seconds in zip(sizes, times)
+        if size > 0 and seconds > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return round(covariance / variance, 3)
+
+
+def benchmark_dimension(name, sizes, repeat):
+    """Time every check on packages of each size along one dimension.
+
+    Returns:
+        dict: {"sizes": [...], "passed": [...], "checks": {check name:
+            {"wall_time": [seconds per size], "exponent": float or None}}}
+    """
+    extension, generate = DIMENSIONS[name]
+    validators = get_validators(extension)
+    check_times = {}
+    passed = []
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            unpacked_dir = Path(temp_dir) / "unpacked"
+            original_file = Path(temp_dir) / f"original{extension}"
+            write_package(generate(size), unpacked_dir, original_file)
+
+            # Warm up (schema compilation), then keep the fastest run of each check
+            time_checks(validators, unpacked_dir, original_file)
+            best = {}
+            for _ in range(repeat):
+                times, size_passed = time_checks(
+                    validators, unpacked_dir, original_file
+                )
+                for check, seconds in times.items():
+                    best[check] = min(best.get(check, seconds), seconds)
+            passed.append(size_passed)
+
+        best["total"] = sum(best.values())
+        for check, seconds in best.items():
+            check_times.setdefault(check, []).append(round(seconds, 6))
+
+    return {
+        "sizes": sizes,
+        "passed": passed,
+        "checks": {
+            check: {"wall_time": times, "exponent": scaling_exponent(sizes, times)}
+            for check, times in check_times.items()
+        },
+    }
+
+
+def find_regressions(results, baseline, tolerance):
+    """Get (dimension, check, size, baseline seconds, seconds) for checks slower than tolerance x baseline."""
+    regressions = []
+    for name, dimension in results["dimensions"].items():
+        baseline_dimension = baseline.get("dimensions", {}).get(name)
+        if baseline_dimension is None:
+            continue
+        baseline_sizes = baseline_dimension["sizes"]
+        for check, result in dimension["checks"].items():
+            baseline_check = baseline_dimension["checks"].get(check)
+            if baseline_check is None:
+                continue
+            for size, seconds in zip(dimension["sizes"], result["wall_time"]):
+                if size not in baseline_sizes:
+                    continue
+                old = baseline_check["wall_time"][baseline_sizes.index(size)]
+                if seconds > old * tolerance and seconds - old > REGRESSION_NOISE_FLOOR:
+                    regressions.append((name, check, size, old, seconds))
+    return regressions
+
+
+def benchmark_scaling(args):
+    sizes = sorted({int(size) for size in args.sizes.split(",")})
+    names = args.dimensions.split(",")
+    for name in names:
+        if name not in DIMENSIONS:
+            print(
+                f"Error: Unknown dimension {name} "
+                f"(choose from {', '.join(DIMENSIONS)})"
+            )
+            return False
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "lxml": ".".join(map(str, lxml.etree.LXML_VERSION)),
+            "platform": platform.platform(),
+        },
+        "repeat": args.repeat,
+        "dimensions": {},
+    }
+    all_passed = True
+    for name in names:
+        dimension = results["dimensions"][name] = benchmark_dimension(
+            name, sizes, args.repeat
+        )
+        all_passed = all_passed and all(dimension["passed"])
+
+        print(f"\n{name}")
+        print(
+            f"{'Check':<28}"
+            + "".join(f"{f'N={size}':>12}" for size in sizes)
+            + f"{'Exponent':>10}"
+        )
+        for check, result in dimension["checks"].items():
+            exponent = result["exponent"]
+            print(
+                f"{check:<28}"
+                + "".join(
+                    f"{seconds * 1000:>10.2f}ms" for seconds in result["wall_time"]
+                )
+                + (f"{exponent:>10.2f}" if exponent is not None else f"{'-':>10}")
+            )
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")
+    if not all_passed:
+        print("WARNING - Some synthetic packages failed validation")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(
+                f"FAILED - {len(regressions)} checks are more than "
+                f"{args.tolerance}x slower than {args.baseline}:"
+            )
+            for name, check, size, old, seconds in regressions:
+                print(
+                    f"  {name} N={size} {check}: "
+                    f"{old * 1000:.2f}ms -> {seconds * 1000:.2f}ms"
+                )
+            return False
+        print(
+            f"PASSED - No check is more than {args.tolerance}x slower than the baseline"
+        )
+    return True
+
+
+def benchmark_names(args):
+    # Each paragraph has 4 runs: plain text, Claude's deletion and insertion, plain text
+    paragraphs = max(1, args.runs // 4)
+    document = synthetic_docx(paragraphs, tracked_changes=paragraphs)[1][
+        "word/document.xml"
+    ]
+    root = lxml.etree.fromstring(document.encode())
+    elements = list(root.iter(lxml.etree.Element))
+    texts = [elem.text for elem in root.iter(T_TAG, DELTEXT_TAG) if elem.text]
+    namespaces = {"w": W_NAMESPACE}
+    claude_changes_query = "//w:ins[@w:author='Claude'] | //w:del[@w:author='Claude']"
+    print(
+        f"{paragraphs * 4} runs, {len(elements)} elements, {len(texts)} texts "
+        f"(best of {args.repeat})"
+    )
+
+    # (name, items per run, previous code, current code)
+    cases = [
+        (
+            "Edge whitespace check per text",
+            len(texts),
+            lambda: [
+                re.match(r"^\s.*", text) or re.match(r".*\s$", text) for text in texts
+            ],
+            lambda: [_has_edge_whitespace(text) for text in texts],
+        ),
+        (
+            "Clark name comparison per element",
+            len(elements),
+            lambda: [elem.tag == f"{{{W_NAMESPACE}}}t" for elem in elements],
+            lambda: [elem.tag == T_TAG for elem in elements],
+        ),
+        (
+            "Claude's changes query per element",
+            len(elements),
+            lambda: root.xpath(claude_changes_query, namespaces=namespaces),
+            lambda: claude_changes(root),
+        ),
+    ]
+
+    print(f"{'Operation':<36} {'Before ns':>10} {'After ns':>10} {'Speedup':>8}")
+    for name, count, before, after in cases:
+        if len(before()) != len(after()):
+            print(f"MISMATCH - {name} gives different results")
+            return False
+        before_ns = time_call(before, args.repeat) / count * 1e9
+        after_ns = time_call(after, args.repeat) / count * 1e9
+        print(
+            f"{name:<36} {before_ns:>10.1f} {after_ns:>10.1f} "
+            f"{before_ns / after_ns if after_ns else 0:>7.1f}x"
+        )
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OOXML validation")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    preprocess = subparsers.add_parser(
+        "preprocess", help="Compare XSD preprocessing with the previous pipeline"
+    )
+    preprocess.add_argument("path", help="Unpacked document directory or Office file")
+    preprocess.add_argument(
+        "--repeat", type=int, default=5, help="Runs per part (fastest is reported)"
+    )
+    preprocess.set_defaults(run=benchmark_preprocess)
+
+    scaling = subparsers.add_parser(
+        "scaling", help="Time every check on synthetic packages of growing size"
+    )
+    scaling.add_argument(
+        "--sizes",
+        default="10,100,1000",
+        help="Comma-separated package sizes (default: 10,100,1000)",
+    )
+    scaling.add_argument(
+        "--dimensions",
+        default=",".join(DIMENSIONS),
+        help=f"Comma-separated dimensions to scale (default: {','.join(DIMENSIONS)})",
+    )
+    scaling.add_argument(
+        "--repeat", type=int, default=3, help="Runs per size (fastest is reported)"
+    )
+    scaling.add_argument(
+        "--output",
+        default="validation_benchmark.json",
+        help="JSON file for the results (default: validation_benchmark.json)",
+    )
+    scaling.add_argument(
+        "--baseline", help="JSON results of a previous run to compare against"
+    )
+    scaling.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Slowdown factor over the baseline reported as a regression "
+        + "(default: 1.5)",
+    )
+    scaling.set_defaults(run=benchmark_scaling)
+
+    names = subparsers.add_parser(
+        "names", help="Compare per-element costs of names, XPath and text checks"
+    )
+    names.add_argument(
+        "--runs", type=int, default=50000, help="Runs in the synthetic document"
+    )
+    names.add_argument(
+        "--repeat", type=int, default=5, help="Runs per operation (fastest is reported)"
+    )
+    names.set_defaults(run=benchmark_names)
+
+    args = parser.parse_args()
+    sys.exit(0 if args.run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
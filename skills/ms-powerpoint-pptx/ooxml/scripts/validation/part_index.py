@@ -0,0 +1,102 @@
+"""
+Single-pass index of the IDs and relationship references in an XML part.
+"""
+
+import lxml.etree
+
+from .xml_names import (
+    ALTERNATE_CONTENT_TAG,
+    R_ID_ATTR,
+    RELATIONSHIP_TAG,
+    local_name,
+    lower_local_name,
+)
+
+
+class PartIndex:
+    """IDs, r:id references and relationships of one XML part, in document order.
+
+    Attributes:
+        unique_ids: (tag, attr_name, id_value, sourceline) for elements with an
+            ID uniqueness requirement, outside mc:AlternateContent. tag and
+            attr_name are lowercased local names.
+        id_attrs: (value, sourceline) for every attribute whose local name ends
+            with "id" (case-insensitive), if requested when building
+        rid_refs: (element_local_name, r_id, sourceline, id_attr) for every
+            element with an r:id attribute. id_attr is the element's unqualified
+            "id" attribute, or None.
+        relationships: (id, type, target, sourceline) for every Relationship
+            element (.rels parts)
+    """
+
+    __slots__ = ("unique_ids", "id_attrs", "rid_refs", "relationships")
+
+    def __init__(self):
+        self.unique_ids = []
+        self.id_attrs = []
+        self.rid_refs = []
+        self.relationships = []
+
+    @classmethod
+    def build(cls, tree, unique_id_requirements, collect_id_attrs=True):
+        """Index a parsed part in one walk over its elements.
+
+        Args:
+            tree: Parsed lxml tree or root element (not modified)
+            unique_id_requirements: Mapping of lowercased element local name to
+                (lowercased attribute local name, scope)
+            collect_id_attrs: Whether to fill id_attrs, which requires looking
+                at every attribute
+
+        Returns:
+            PartIndex: The index
+        """
+        index = cls()
+        unique_ids = index.unique_ids
+        id_attrs = index.id_attrs
+        rid_refs = index.rid_refs
+        relationships = index.relationships
+
+        # IDs inside mc:AlternateContent duplicate their fallback content. lxml
+        # returns the same proxy for an element while it is referenced, so the
+        # set can be checked by membership during the walk.
+        alternate_content = set()
+        for elem in tree.iter(ALTERNATE_CONTENT_TAG):
+            alternate_content.update(elem.iter())
+
+        for elem in tree.iter(lxml.etree.Element):
+            tag = elem.tag
+
+            r_id = elem.get(R_ID_ATTR)
+            if r_id:
+                rid_refs.append((local_name(tag), r_id, elem.sourceline, elem.get("id")))
+
+            if tag == RELATIONSHIP_TAG:
+                relationships.append(
+                    (
+                        elem.get("Id"),
+                        elem.get("Type", ""),
+                        elem.get("Target"),
+                        elem.sourceline,
+                    )
+                )
+
+            lower_tag = lower_local_name(tag)
+            requirement = unique_id_requirements.get(lower_tag)
+            if requirement is not None and elem not in alternate_content:
+                attr_name = requirement[0]
+                for attr, value in elem.items():
+                    if lower_local_name(attr) == attr_name:
+                        unique_ids.append((lower_tag, attr_name, value, elem.sourceline))
+                        break
+
+            if collect_id_attrs:
+                for attr, value in elem.items():
+                    if lower_local_name(attr).endswith("id"):
+                        id_attrs.append((value, elem.sourceline))
+
+        return index
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
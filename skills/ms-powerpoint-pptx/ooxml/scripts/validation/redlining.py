@@ -2,117 +2,296 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import collections
+import hashlib
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from .report import ValidationIssue, ValidationReport
+from .word_diff import word_diff
+from .xml_names import (
+    DELTEXT_TAG,
+    INS_TAG,
+    P_TAG,
+    PARA_ID_ATTR,
+    T_TAG,
+    claude_changes,
+)
+
+
+class OriginalText:
+    """Paragraph texts of an original document with Claude's changes removed.
+
+    Attributes:
+        text: Non-empty paragraph texts joined by newlines, as compared by a
+            full validation
+        paragraphs: (w14:paraId or None, text) for every paragraph, in
+            document order
+        para_ids: paraIds of the paragraphs that have one, in document order
+        positions: Index in paragraphs of each paraId used once
+        duplicate_para_ids: paraIds used by more than one paragraph
+    """
+
+    __slots__ = ("text", "paragraphs", "para_ids", "positions", "duplicate_para_ids")
+
+    def __init__(self, paragraphs):
+        self.paragraphs = paragraphs
+        self.text = "\n".join(text for _, text in paragraphs if text)
+        self.para_ids = [para_id for para_id, _ in paragraphs if para_id]
+        counts = collections.Counter(self.para_ids)
+        self.duplicate_para_ids = {
+            para_id for para_id, count in counts.items() if count > 1
+        }
+        self.positions = {
+            para_id: i
+            for i, (para_id, _) in enumerate(paragraphs)
+            if para_id and para_id not in self.duplicate_para_ids
+        }
+
+
+class OriginalTextCache:
+    """In-process LRU cache of an original document's text with Claude's changes removed.
+
+    Keyed by the SHA-256 of the original word/document.xml, so validating
+    several edits of the same original (or the same edit repeatedly) parses
+    the original only once per process.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._texts = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, document_sha256):
+        """Get the cached OriginalText for a document hash, or None on a miss."""
+        text = self._texts.get(document_sha256)
+        if text is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._texts.move_to_end(document_sha256)
+        return text
+
+    def put(self, document_sha256, text):
+        """Cache the OriginalText for a document hash, evicting the least recently used entry."""
+        self._texts[document_sha256] = text
+        self._texts.move_to_end(document_sha256)
+        while len(self._texts) > self.max_entries:
+            self._texts.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached texts and reset the hit/miss counters."""
+        self._texts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._texts)
+
+
+# Shared by all validator instances in this process
+ORIGINAL_TEXT_CACHE = OriginalTextCache()
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(self, unpacked_dir, original_docx, verbose=False, dirty_para_ids=None):
+        # unpacked_dir may also be a .docx file, read without extracting it
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
-        self.namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
+        # w14:paraIds of the only paragraphs whose text can differ from the
+        # original (as recorded by DocxXMLEditor), or None to compare the
+        # whole document
+        self.dirty_para_ids = (
+            set(dirty_para_ids) if dirty_para_ids is not None else None
+        )
+        # Structured result of validate(), as a single "redlining" check
+        self.report = ValidationReport()
+        self._issues = []
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
+        with self.report.check("redlining") as check:
+            self._issues = check.issues
+            passed = self._validate_tracked_changes()
+            check.status = "passed" if passed else "failed"
+        return passed
+
+    def _add_issue(self, code, message):
+        """Record a redlining error in the report."""
+        self._issues.append(ValidationIssue(code, message, "word/document.xml"))
+
+    def _validate_tracked_changes(self):
+        """Check that all changes by Claude are tracked. Returns True if valid."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
+        modified_xml = self._read_modified_document()
+        if modified_xml is None:
+            self._add_issue("missing-document", "Modified document.xml not found")
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_root = lxml.etree.fromstring(modified_xml)
+        except lxml.etree.XMLSyntaxError as e:
+            self._add_issue("parse-error", f"Error parsing XML files: {e}")
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        changes = claude_changes(modified_root)
+        if not changes:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
+        # Read only word/document.xml from the original docx
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                original_xml = zip_ref.read("word/document.xml")
+        except KeyError:
+            self._add_issue("missing-document", "Original document.xml not found")
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+        except Exception as e:
+            self._add_issue("unpack-error", f"Error unpacking original docx: {e}")
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        original = self._get_original_text(original_xml)
+        if original is None:
+            return False
+
+        # Remove Claude's tracked changes and compare text content, only of
+        # the edited paragraphs if they are known and unambiguous
+        self._remove_claude_tracked_changes(modified_root, changes)
+        scoped = self._get_dirty_paragraph_texts(original, modified_root)
+        if scoped is not None:
+            original_text, modified_text = scoped
+        else:
+            original_text = original.text
+            modified_text = "\n".join(
+                text for _, text in self._extract_paragraphs(modified_root) if text
+            )
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            self._add_issue(
+                "untracked-change",
+                "Document text doesn't match after removing Claude's tracked changes"
+                + error_message.partition("============")[2],
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            if scoped is not None:
+                print(
+                    "PASSED - All changes by Claude are properly tracked "
+                    f"({len(self.dirty_para_ids)} edited paragraphs checked)"
+                )
+            else:
+                print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _get_dirty_paragraph_texts(self, original, modified_root):
+        """Get the original and modified text of only the dirty paragraphs.
+
+        Only the dirty paragraphs' text is extracted. The paraIds of all other
+        paragraphs must still be in their original order, so that a paragraph
+        moved without tracking is found by comparing the whole document.
+
+        Args:
+            original: OriginalText of the original document
+            modified_root: Modified document root with Claude's changes removed
+
+        Returns:
+            tuple or None: (original_text, modified_text) of the dirty
+                paragraphs, or None if the whole document must be compared
+                because no dirty paraIds were given, one of them is used by
+                several paragraphs, or paragraphs were reordered
+        """
+        dirty = self.dirty_para_ids
+        if dirty is None or dirty & original.duplicate_para_ids:
+            return None
+
+        modified_para_ids = []
+        modified_paragraphs = []
+        for p_elem in modified_root.iter(P_TAG):
+            para_id = p_elem.get(PARA_ID_ATTR)
+            if not para_id:
+                continue
+            modified_para_ids.append(para_id)
+            if para_id in dirty:
+                modified_paragraphs.append((para_id, self._get_paragraph_text(p_elem)))
+        dirty_found = [para_id for para_id, _ in modified_paragraphs]
+        if len(set(dirty_found)) != len(dirty_found):
+            return None
+
+        # Paragraphs kept from the original must keep their order
+        original_para_ids = set(original.para_ids)
+        modified_para_id_set = set(modified_para_ids)
+        if [p for p in modified_para_ids if p in original_para_ids] != [
+            p for p in original.para_ids if p in modified_para_id_set
+        ]:
+            return None
+
+        positions = sorted(
+            original.positions[para_id]
+            for para_id in dirty
+            if para_id in original.positions
+        )
+        original_text = "\n".join(
+            text for text in (original.paragraphs[i][1] for i in positions) if text
+        )
+        modified_text = "\n".join(text for _, text in modified_paragraphs if text)
+        return original_text, modified_text
+
+    def _get_original_text(self, original_xml):
+        """Get the original's OriginalText without Claude's changes, or None on a parse error.
+
+        The paragraph texts are cached per document hash, so an original that
+        was already seen in this process is not parsed again.
+        """
+        document_sha256 = hashlib.sha256(original_xml).hexdigest()
+        original = ORIGINAL_TEXT_CACHE.get(document_sha256)
+        if original is not None:
+            return original
+
+        try:
+            original_root = lxml.etree.fromstring(original_xml)
+        except lxml.etree.XMLSyntaxError as e:
+            self._add_issue("parse-error", f"Error parsing XML files: {e}")
+            print(f"FAILED - Error parsing XML files: {e}")
+            return None
+
+        self._remove_claude_tracked_changes(original_root)
+        original = OriginalText(self._extract_paragraphs(original_root))
+        ORIGINAL_TEXT_CACHE.put(document_sha256, original)
+        return original
+
+    def _read_modified_document(self):
+        """Read word/document.xml from the unpacked directory or .docx file, or None if missing."""
+        if self.unpacked_dir.is_file():
+            with zipfile.ZipFile(self.unpacked_dir, "r") as zip_ref:
+                try:
+                    return zip_ref.read("word/document.xml")
+                except KeyError:
+                    return None
+
+        modified_file = self.unpacked_dir / "word" / "document.xml"
+        if not modified_file.exists():
+            return None
+        return modified_file.read_bytes()
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences of the changed paragraphs."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +306,66 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        # Show word diff of the changed paragraphs
+        diff = word_diff(original_text, modified_text)
+        if diff:
+            error_parts.extend(["Differences:", "============", diff])
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _remove_claude_tracked_changes(self, root, changes=None):
+        """Remove tracked changes authored by Claude from the XML root.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+        Claude's insertions are removed and Claude's deletions are unwrapped,
+        with their w:delText turned back into w:t.
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        Args:
+            root: Root element, modified in place
+            changes: Result of claude_changes for root, if already computed
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        if changes is None:
+            changes = claude_changes(root)
+
+        # Remove insertions before unwrapping deletions, so deletions inside
+        # a removed insertion go with it
+        deletions = []
+        for elem in changes:
+            if elem.tag == INS_TAG:
+                parent = elem.getparent()
+                if parent is not None:
+                    parent.remove(elem)
+            else:
+                deletions.append(elem)
+
+        for del_elem in deletions:
+            for elem in del_elem.iter(DELTEXT_TAG):
+                elem.tag = T_TAG
+
+            # Move all children of w:del before it, then drop the empty w:del
+            parent = del_elem.getparent()
+            if parent is None:
+                continue
+            for child in list(del_elem):
+                del_elem.addprevious(child)
+            parent.remove(del_elem)
+
+    def _extract_paragraphs(self, root):
+        """Extract the text of each paragraph with its w14:paraId.
+
+        Args:
+            root: Document root
+
+        Returns:
+            list: (paraId or None, text) for each paragraph, in document order
+        """
+        return [
+            (p_elem.get(PARA_ID_ATTR), self._get_paragraph_text(p_elem))
+            for p_elem in root.iter(P_TAG)
+        ]
+
+    def _get_paragraph_text(self, p_elem):
+        """Get the text of a paragraph, from all its w:t elements."""
+        return "".join(t_elem.text for t_elem in p_elem.iter(T_TAG) if t_elem.text)
 
 
 if __name__ == "__main__":
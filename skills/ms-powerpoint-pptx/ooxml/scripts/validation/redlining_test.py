@@ -0,0 +1,137 @@
+import contextlib
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from validation.redlining import RedliningValidator
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">
+<w:body>{}</w:body>
+</w:document>"""
+
+INSERTION = '<w:ins w:id="1" w:author="Claude"><w:r><w:t> added</w:t></w:r></w:ins>'
+
+
+def paragraph(para_id, text, extra=""):
+    return f'<w:p w14:paraId="{para_id}"><w:r><w:t>{text}</w:t></w:r>{extra}</w:p>'
+
+
+# Currently not executed automatically in CI; run from ooxml/scripts with
+# python -m unittest validation.redlining_test
+class TestDirtyParagraphs(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.original_docx = Path(self.temp_dir.name) / "original.docx"
+        with zipfile.ZipFile(self.original_docx, "w") as zip_ref:
+            zip_ref.writestr(
+                "word/document.xml",
+                DOCUMENT.format(
+                    paragraph("00000001", "Paragraph one")
+                    + paragraph("00000002", "Paragraph two")
+                ),
+            )
+
+    def validate(self, body, dirty_para_ids):
+        """Validate a modified document.xml, returning the result and the report."""
+        unpacked = Path(self.temp_dir.name) / "unpacked"
+        (unpacked / "word").mkdir(parents=True, exist_ok=True)
+        (unpacked / "word" / "document.xml").write_text(
+            DOCUMENT.format(body), encoding="utf-8"
+        )
+        validator = RedliningValidator(
+            unpacked, self.original_docx, dirty_para_ids=dirty_para_ids
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            passed = validator.validate()
+        messages = [issue.message for issue in validator.report.checks[0].issues]
+        return passed, messages
+
+    def test_recorded_tracked_change_passes(self):
+        """Test a tracked insertion in the only edited paragraph"""
+        passed, _ = self.validate(
+            paragraph("00000001", "Paragraph one")
+            + paragraph("00000002", "Paragraph two", INSERTION),
+            dirty_para_ids={"00000002"},
+        )
+        self.assertTrue(passed)
+
+    def test_only_recorded_paragraphs_are_compared(self):
+        """Test that a paragraph not recorded as edited is not compared"""
+        body = paragraph("00000001", "TOTALLY one") + paragraph(
+            "00000002", "Paragraph two", INSERTION
+        )
+        self.assertEqual(self.validate(body, dirty_para_ids={"00000002"}), (True, []))
+
+        passed, messages = self.validate(body, dirty_para_ids=None)
+        self.assertFalse(passed)
+        self.assertTrue(any("TOTALLY" in message for message in messages))
+
+    def test_duplicate_original_para_id_compares_whole_document(self):
+        """Test a recorded paraId used by two paragraphs of the original"""
+        with zipfile.ZipFile(self.original_docx, "w") as zip_ref:
+            zip_ref.writestr(
+                "word/document.xml",
+                DOCUMENT.format(
+                    paragraph("00000001", "Paragraph one")
+                    + paragraph("00000002", "Paragraph two")
+                    + paragraph("00000002", "Paragraph three")
+                ),
+            )
+        passed, messages = self.validate(
+            paragraph("00000001", "TOTALLY one")
+            + paragraph("00000002", "Paragraph two", INSERTION)
+            + paragraph("00000002", "Paragraph three"),
+            dirty_para_ids={"00000002"},
+        )
+        self.assertFalse(passed)
+        self.assertTrue(any("TOTALLY" in message for message in messages))
+
+    def test_duplicate_modified_para_id_compares_whole_document(self):
+        """Test a recorded new paraId used by two inserted paragraphs"""
+        passed, messages = self.validate(
+            paragraph("00000001", "TOTALLY one")
+            + paragraph("0000000A", "", INSERTION)
+            + paragraph("0000000A", "", INSERTION)
+            + paragraph("00000002", "Paragraph two"),
+            dirty_para_ids={"0000000A"},
+        )
+        self.assertFalse(passed)
+        self.assertTrue(any("TOTALLY" in message for message in messages))
+
+    def test_moved_recorded_paragraph_fails(self):
+        """Test an untracked move of the recorded paragraph"""
+        passed, _ = self.validate(
+            paragraph("00000002", "Paragraph two", INSERTION)
+            + paragraph("00000001", "Paragraph one"),
+            dirty_para_ids={"00000002"},
+        )
+        self.assertFalse(passed)
+
+    def test_recorded_untracked_edit_shows_only_its_paragraph(self):
+        """Test an untracked edit in the recorded paragraph"""
+        passed, messages = self.validate(
+            paragraph("00000001", "Paragraph one")
+            + paragraph("00000002", "Paragraph CHANGED", INSERTION),
+            dirty_para_ids={"00000002"},
+        )
+        self.assertFalse(passed)
+        self.assertTrue(any("CHANGED" in message for message in messages))
+        self.assertFalse(any("Paragraph one" in message for message in messages))
+
+    def test_new_recorded_paragraph_passes(self):
+        """Test a tracked insertion of a paragraph with a new paraId"""
+        passed, _ = self.validate(
+            paragraph("00000001", "Paragraph one")
+            + paragraph("0000000A", "", INSERTION)
+            + paragraph("00000002", "Paragraph two"),
+            dirty_para_ids={"0000000A"},
+        )
+        self.assertTrue(passed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Persistent on-disk cache of XSD validation results.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import lxml.etree
+
+# Elements of an XSD that load other schema files
+XSD_REFERENCE_XPATH = lxml.etree.XPath(
+    "/xs:schema/xs:import/@schemaLocation | /xs:schema/xs:include/@schemaLocation"
+    " | /xs:schema/xs:redefine/@schemaLocation",
+    namespaces={"xs": "http://www.w3.org/2001/XMLSchema"},
+)
+
+
+class XSDResultCache:
+    """SQLite-backed cache mapping (schema, schema set fingerprint, part SHA-256) to XSD errors.
+
+    The fingerprint covers the modification times of the schema and of every
+    XSD it imports or includes, directly or not, and FORMAT_VERSION, so
+    results are not reused after any of them changes.
+
+    Entries are evicted least-recently-used first once the cache holds more
+    than max_entries results. A single cache file can be shared by concurrent
+    processes. Access times of hits are kept in memory and written in the
+    transaction of the next put() or evict(), so a hit does not commit.
+    """
+
+    FILENAME = "xsd_results.sqlite"
+
+    # Version of the cached results. Bump it when a change to XSD validation
+    # or to part preprocessing (BaseSchemaValidator._preprocess_for_xsd) can
+    # change the errors found for a part. Results of other versions are
+    # dropped when the cache is opened.
+    FORMAT_VERSION = 2
+
+    def __init__(self, cache_dir, max_entries=100_000):
+        """
+        Args:
+            cache_dir: Directory holding the cache file (created if missing)
+            max_entries: Maximum number of cached results kept after eviction
+        """
+        self.path = Path(cache_dir) / self.FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._schema_fingerprints = {}
+        # Access times of hits not yet written to the database
+        # Format: key -> last access time
+        self._accessed = {}
+
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != self.FORMAT_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS xsd_results")
+            self._conn.execute(f"PRAGMA user_version = {self.FORMAT_VERSION:d}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS xsd_results (
+                schema_path TEXT NOT NULL,
+                schema_fingerprint TEXT NOT NULL,
+                part_sha256 TEXT NOT NULL,
+                cleaned INTEGER NOT NULL,
+                errors TEXT NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (schema_path, schema_fingerprint, part_sha256, cleaned)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS xsd_results_last_access "
+            "ON xsd_results (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, schema_path, part_sha256, cleaned):
+        """Look up cached errors for a part.
+
+        Args:
+            schema_path: Path to the XSD the part was validated against
+            part_sha256: SHA-256 hex digest of the part's bytes
+            cleaned: Whether foreign namespaces were removed before validation
+
+        Returns:
+            set or None: Error messages (empty if valid), or None on a cache miss
+        """
+        key = self._key(schema_path, part_sha256, cleaned)
+        row = self._conn.execute(
+            "SELECT errors FROM xsd_results WHERE schema_path = ? "
+            "AND schema_fingerprint = ? AND part_sha256 = ? AND cleaned = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._accessed[key] = time.time()
+        return set(json.loads(row[0]))
+
+    def put(self, schema_path, part_sha256, cleaned, errors):
+        """Store the errors (empty if valid) found for a part."""
+        self._write_access_times()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO xsd_results VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                *self._key(schema_path, part_sha256, cleaned),
+                json.dumps(sorted(errors)),
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def evict(self):
+        """Write pending access times and drop least recently used results beyond max_entries."""
+        self._write_access_times()
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM xsd_results").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM xsd_results WHERE rowid IN ("
+                "SELECT rowid FROM xsd_results ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+        self._conn.commit()
+
+    def close(self):
+        """Write pending access times, evict old results and close the database connection."""
+        if self._conn is not None:
+            self.evict()
+            self._conn.close()
+            self._conn = None
+
+    def _write_access_times(self):
+        """Update last_access of the hits since the last write, without committing."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE xsd_results SET last_access = ? WHERE schema_path = ? "
+                "AND schema_fingerprint = ? AND part_sha256 = ? AND cleaned = ?",
+                [(accessed, *key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _key(self, schema_path, part_sha256, cleaned):
+        schema_path = str(Path(schema_path).resolve())
+        if schema_path not in self._schema_fingerprints:
+            self._schema_fingerprints[schema_path] = self._fingerprint(schema_path)
+        return (
+            schema_path,
+            self._schema_fingerprints[schema_path],
+            part_sha256,
+            int(cleaned),
+        )
+
+    def _fingerprint(self, schema_path):
+        """Hash FORMAT_VERSION and the paths and mtimes of a schema and all XSDs it loads."""
+        mtimes = {}
+        pending = [schema_path]
+        while pending:
+            path = pending.pop()
+            if path in mtimes:
+                continue
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                # Reported by schema compilation, not here
+                mtimes[path] = None
+                continue
+            for location in XSD_REFERENCE_XPATH(lxml.etree.parse(path)):
+                if "://" not in location:
+                    pending.append(
+                        os.path.normpath(os.path.join(os.path.dirname(path), location))
+                    )
+
+        digest = hashlib.sha256(str(self.FORMAT_VERSION).encode())
+        for path in sorted(mtimes):
+            digest.update(f"\n{path}\t{mtimes[path]}".encode())
+        return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
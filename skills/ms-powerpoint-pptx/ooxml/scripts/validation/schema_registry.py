@@ -0,0 +1,56 @@
+"""
+Process-wide registry of compiled XSD schemas.
+"""
+
+from pathlib import Path
+
+import lxml.etree
+
+
+class SchemaRegistry:
+    """Compiles each XSD schema once and shares it across files and validators."""
+
+    def __init__(self):
+        self._schemas = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, schema_path):
+        """Get the compiled schema for a path, compiling it on first use.
+
+        Args:
+            schema_path: Path to the XSD file
+
+        Returns:
+            lxml.etree.XMLSchema: The compiled schema
+        """
+        key = Path(schema_path).resolve()
+        schema = self._schemas.get(key)
+        if schema is not None:
+            self.hits += 1
+            return schema
+
+        self.misses += 1
+        with open(key, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(key))
+        schema = lxml.etree.XMLSchema(xsd_doc)
+        self._schemas[key] = schema
+        return schema
+
+    def clear(self):
+        """Drop all compiled schemas and reset the hit/miss counters."""
+        self._schemas.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._schemas)
+
+
+# Shared by all validator instances in this process
+SCHEMA_REGISTRY = SchemaRegistry()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -3,26 +3,90 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python verify_ooxml.py <dir> --original <original_file>
+    python verify_ooxml.py <dir> --original <original_file> [--jobs N]
+        [--incremental] [--cache-dir DIR]
+    python verify_ooxml.py <file.docx|file.pptx> [--original <original_file>]
+    python verify_ooxml.py ... --format json
+    python verify_ooxml.py ... [--fail-fast] [--time-budget SECONDS]
+
+A .docx/.pptx file is validated straight from the zip without unpacking it.
+Without --original, all XSD errors are reported and the redlining check is
+skipped.
+
+With --format json, a report with the status, errors (file, line, code,
+message) and wall/CPU time of every check and part is printed instead of text.
+
+--fail-fast runs the cheapest checks first and stops at the first failure,
+for callers that only need to know whether the document is valid.
+--time-budget always runs the structural checks, and schema-validates as many
+parts as fit in the budget, most recently modified first.
 """
 
 import argparse
+import contextlib
+import io
+import json
 import sys
 from pathlib import Path
 
 from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation.report import ValidationReport
+
+
+def get_validators(file_extension, has_original=True):
+    """Get the validator classes for a file type, or None if it is not supported."""
+    match file_extension:
+        case ".docx":
+            validators = [DOCXSchemaValidator]
+            if has_original:
+                validators.append(RedliningValidator)
+            return validators
+        case ".pptx":
+            return [PPTXSchemaValidator]
+        case _:
+            return None
+
+
+def run_validators(
+    validators, unpacked_dir, original_file, verbose=False, report=None, **options
+):
+    """Run validators on a document and return True if all pass.
+
+    Options (jobs, incremental, cache_dir, fail_fast, time_budget) are passed
+    to the schema validators. With fail_fast, no further validators run after
+    one fails. If a ValidationReport is given, the checks of all validators
+    are added to it.
+    """
+    success = True
+    for ValidatorClass in validators:
+        if ValidatorClass is RedliningValidator:
+            validator = ValidatorClass(unpacked_dir, original_file, verbose=verbose)
+        else:
+            validator = ValidatorClass(
+                unpacked_dir, original_file, verbose=verbose, **options
+            )
+        try:
+            if not validator.validate():
+                success = False
+        finally:
+            if hasattr(validator, "close"):
+                validator.close()
+            if report is not None:
+                report.extend(validator.report)
+        if not success and options.get("fail_fast"):
+            break
+    return success
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory, or an Office file to validate without unpacking",
     )
     parser.add_argument(
         "--original",
-        required=True,
-        help="Path to original file (.docx/.pptx/.xlsx)",
+        help="Path to original file (.docx/.pptx/.xlsx), required for directories",
     )
     parser.add_argument(
         "-v",
@@ -30,36 +94,88 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-file checks (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only run per-file checks on files that differ from the original",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for a persistent XSD result cache reused across runs",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Run the cheapest checks first and stop at the first failure",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Seconds for validation; XSD checks stop when it runs out, "
+        + "most recently modified files first",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (json prints a structured report with timings)",
+    )
     args = parser.parse_args()
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
-    original_file = Path(args.original)
-    file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
-    assert original_file.is_file(), f"Error: {original_file} is not a file"
+    original_file = Path(args.original) if args.original else None
+    assert unpacked_dir.is_dir() or unpacked_dir.is_file(), (
+        f"Error: {unpacked_dir} is not a directory or file"
+    )
+    if original_file is not None:
+        assert original_file.is_file(), f"Error: {original_file} is not a file"
+    else:
+        assert unpacked_dir.is_file(), (
+            "Error: --original is required when validating an unpacked directory"
+        )
+    file_extension = (original_file or unpacked_dir).suffix.lower()
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
-        f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
+        f"Error: {original_file or unpacked_dir} must be a .docx, .pptx, or .xlsx file"
     )
 
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+    validators = get_validators(file_extension, original_file is not None)
+    if validators is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
 
-    # Run validators
-    success = True
-    for ValidatorClass in validators:
-        validator = ValidatorClass(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    report = ValidationReport()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output if args.format == "json" else sys.stdout):
+        success = run_validators(
+            validators,
+            unpacked_dir,
+            original_file,
+            verbose=args.verbose,
+            report=report,
+            jobs=args.jobs,
+            incremental=args.incremental,
+            cache_dir=args.cache_dir,
+            fail_fast=args.fail_fast,
+            time_budget=args.time_budget,
+        )
 
-    if success:
+    if args.format == "json":
+        result = {
+            "path": str(unpacked_dir),
+            "original": str(original_file) if original_file else None,
+            **report.to_dict(),
+        }
+        print(json.dumps(result, indent=2))
+    elif success:
         print("All validations PASSED!")
 
     sys.exit(0 if success else 1)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Validate many Office documents on a pool of warm worker processes.
+
+Usage:
+    python batch_verify_ooxml.py <manifest.jsonl|dir> [--jobs N] [--output FILE]
+        [--cache-dir DIR]
+
+The manifest has one JSON object per line: {"path": ..., "original": ...}, where
+path is an unpacked directory or a .docx/.pptx file and original is optional for
+files. Relative paths are resolved against the manifest's directory. A directory
+argument validates every .docx/.pptx file below it without an original.
+
+Each worker compiles the XSD schemas once and keeps them for all documents it
+validates. One JSON line (status, latency, validator output and the per-check
+report of verify_ooxml.py --format json) is written per document as it
+finishes, and a throughput summary (docs/sec, p50/p95 latency) is printed to
+stderr.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from validation import BaseSchemaValidator
+from validation.report import ValidationReport
+from validation.schema_registry import SCHEMA_REGISTRY
+from verify_ooxml import get_validators, run_validators
+
+SCHEMAS_DIR = Path(__file__).parent.parent / "schemas"
+
+
+def load_manifest(manifest_path):
+    """Read (path, original) pairs from a JSON-lines manifest."""
+    base_dir = manifest_path.parent
+    documents = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            original = entry.get("original")
+            documents.append(
+                (
+                    str(base_dir / entry["path"]),
+                    str(base_dir / original) if original else None,
+                )
+            )
+    return documents
+
+
+def find_packages(directory):
+    """Find all .docx and .pptx files below a directory, validated without an original."""
+    return [
+        (str(path), None)
+        for path in sorted(directory.rglob("*"))
+        if path.suffix.lower() in {".docx", ".pptx"} and path.is_file()
+    ]
+
+
+def warm_worker():
+    """Compile all mapped XSD schemas once so every document in this worker reuses them."""
+    for schema in set(BaseSchemaValidator.SCHEMA_MAPPINGS.values()):
+        try:
+            SCHEMA_REGISTRY.get(SCHEMAS_DIR / schema)
+        except Exception:
+            pass  # Reported by the validator for the documents that need it
+
+
+def validate_document(path, original, cache_dir=None):
+    """Validate one document and return its JSON-serializable result."""
+    start = time.perf_counter()
+    result = {"path": path, "original": original}
+    output = io.StringIO()
+    report = ValidationReport()
+
+    try:
+        file_extension = Path(original or path).suffix.lower()
+        validators = get_validators(file_extension, original is not None)
+        if validators is None:
+            raise ValueError(f"Validation not supported for file type {file_extension}")
+
+        with contextlib.redirect_stdout(output):
+            passed = run_validators(
+                validators, Path(path), original, report=report, cache_dir=cache_dir
+            )
+        result["status"] = "passed" if passed else "failed"
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    result["output"] = output.getvalue().strip().splitlines()
+    result["checks"] = report.to_dict()["checks"]
+    return result
+
+
+def percentile(values, pct):
+    """Get the nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # Ceiling division
+    return ordered[int(rank) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate many Office documents with a warm worker pool"
+    )
+    parser.add_argument(
+        "source",
+        help="JSON-lines manifest of documents, or a directory of .docx/.pptx files",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write JSON-lines results to this file instead of stdout",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for a persistent XSD result cache shared by all workers",
+    )
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    assert source.exists(), f"Error: {source} does not exist"
+    documents = find_packages(source) if source.is_dir() else load_manifest(source)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    latencies = []
+    failed = 0
+    start = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=warm_worker) as executor:
+            futures = [
+                executor.submit(validate_document, path, original, args.cache_dir)
+                for path, original in documents
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                latencies.append(result["seconds"])
+                if result["status"] != "passed":
+                    failed += 1
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Validated {len(documents)} documents in {elapsed:.2f}s "
+        f"({len(documents) / elapsed if elapsed else 0:.1f} docs/sec) with {jobs} workers",
+        file=sys.stderr,
+    )
+    print(
+        f"Latency: p50 {percentile(latencies, 50):.3f}s, "
+        f"p95 {percentile(latencies, 95):.3f}s",
+        file=sys.stderr,
+    )
+    print(f"Passed: {len(documents) - failed}, failed: {failed}", file=sys.stderr)
+
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,77 @@
 Base validator with common validation logic for document files.
 """
 
+import collections
+import copy
+import hashlib
+import itertools
+import os
+import posixpath
 import re
-from pathlib import Path
+import time
+import weakref
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+from .package_graph import PackageGraph, resolve_target
+from .part_index import PartIndex
+from .report import ValidationIssue, ValidationReport
+from .result_cache import XSDResultCache
+from .schema_registry import SCHEMA_REGISTRY
+from .xml_names import (
+    CONTENT_TYPE_DEFAULTS_XPATH,
+    CONTENT_TYPE_OVERRIDES_XPATH,
+    CONTENT_TYPES_NAMESPACE,
+    IGNORABLE_ATTR,
+    MC_NAMESPACE,
+    OFFICE_RELATIONSHIPS_NAMESPACE,
+    PACKAGE_RELATIONSHIPS_NAMESPACE,
+    XML_NAMESPACE,
+    local_name,
+    namespace,
+)
+
+# Template placeholders removed from text before XSD validation
+TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+
+
+class LRUCache:
+    """In-process mapping that keeps only its most recently used entries.
+
+    Used for the results shared by all validator instances, so a long-lived
+    process validating many documents keeps a bounded number of them.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        value = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Store an entry, evicting the least recently used entries over the limit."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -37,10 +103,35 @@ class BaseSchemaValidator:
         "grpsp": ("id", "file"),  # Group shape IDs
     }
 
+    # Whether part indexes collect every ID-like attribute (see PartIndex.id_attrs)
+    INDEX_ID_ATTRIBUTES = False
+
     # Mapping of element names to expected relationship types
     # Subclasses should override this with format-specific mappings
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    # Relative cost of each check, used to run the cheapest first in fail-fast mode
+    # Format: check name -> rank (lower runs first, unknown checks run last)
+    CHECK_COSTS = {
+        # Package structure: .rels parts, [Content_Types].xml and the file index
+        "file_references": 1,
+        "content_types": 1,
+        "slide_layout_ids": 1,
+        "notes_slide_references": 1,
+        "no_duplicate_slide_layouts": 1,
+        # Root elements of all parts
+        "namespaces": 2,
+        # One walk over every part (IDs, r:id references) or over document.xml
+        "unique_ids": 3,
+        "uuid_ids": 3,
+        "all_relationship_ids": 3,
+        "whitespace_preservation": 3,
+        "deletions": 3,
+        "insertions": 3,
+        # Schema validation of every part
+        "against_xsd": 4,
+    }
+
     # Unified schema mappings for all Office document types
     SCHEMA_MAPPINGS = {
         # Document type specific schemas
@@ -67,23 +158,26 @@ class BaseSchemaValidator:
     }
 
     # Unified namespace constants
-    MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
-    XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+    MC_NAMESPACE = MC_NAMESPACE
+    XML_NAMESPACE = XML_NAMESPACE
 
     # Common OOXML namespaces used across validators
-    PACKAGE_RELATIONSHIPS_NAMESPACE = (
-        "http://schemas.openxmlformats.org/package/2006/relationships"
-    )
-    OFFICE_RELATIONSHIPS_NAMESPACE = (
-        "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-    )
-    CONTENT_TYPES_NAMESPACE = (
-        "http://schemas.openxmlformats.org/package/2006/content-types"
-    )
+    PACKAGE_RELATIONSHIPS_NAMESPACE = PACKAGE_RELATIONSHIPS_NAMESPACE
+    OFFICE_RELATIONSHIPS_NAMESPACE = OFFICE_RELATIONSHIPS_NAMESPACE
+    CONTENT_TYPES_NAMESPACE = CONTENT_TYPES_NAMESPACE
 
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
+    # XSD errors of parts in original files, shared by all validator instances
+    # Format: (original_file_sha256, part_path) -> frozenset of error messages
+    _original_errors_cache = LRUCache(max_entries=4096)
+
+    # Per-part check results for parts identical to their original, shared by all
+    # validator instances so repeated incremental runs only re-check changed parts
+    # Format: (validator_class, method_name, original_file_sha256, part_path) -> result
+    _part_results_cache = LRUCache(max_entries=16384)
+
     # All allowed OOXML namespaces (superset of all document types)
     OOXML_NAMESPACES = {
         "http://schemas.openxmlformats.org/officeDocument/2006/math",
@@ -103,46 +197,493 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        changed_parts=None,
+        incremental=False,
+        cache_dir=None,
+        fail_fast=False,
+        time_budget=None,
+    ):
+        """
+        Args:
+            unpacked_dir: Path to the unpacked document directory, or to a
+                .docx/.pptx/.xlsx package whose parts are read straight from
+                the zip without extracting it
+            original_file: Path to the original document (.docx/.pptx/.xlsx),
+                or None to report all XSD errors instead of only new ones
+            verbose: Enable verbose output
+            jobs: Number of worker processes for per-part checks (<= 0 uses all CPUs)
+            changed_parts: Optional part paths relative to unpacked_dir (e.g.
+                "word/document.xml") that may differ from the original. Implies
+                incremental validation.
+            incremental: Only run per-part checks on parts that differ from the
+                original. Without changed_parts, changes are detected by
+                comparing each part's size and CRC-32 with the original package.
+            cache_dir: Optional directory for a persistent XSD result cache,
+                reused across runs for parts with identical content
+            fail_fast: Run the checks cheapest first (CHECK_COSTS) and stop at
+                the first failing check
+            time_budget: Optional seconds from construction after which XSD
+                validation stops. All other checks still run; parts are
+                schema-validated most recently modified first.
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+        self._unpacked_dir_prefix = os.path.join(self.unpacked_dir, "")
+        self.original_file = Path(original_file) if original_file is not None else None
         self.verbose = verbose
+        self.fail_fast = fail_fast
+        self.time_budget = time_budget
+        self._deadline = (
+            time.perf_counter() + time_budget if time_budget is not None else None
+        )
+        self.incremental = incremental or changed_parts is not None
+        self._changed_parts = (
+            {Path(part).as_posix() for part in changed_parts}
+            if changed_parts is not None
+            else None
+        )
+
+        # Number of worker processes for per-part checks (<= 0 uses all CPUs)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._executor = None
+
+        # Persistent XSD result cache, opened on first use
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._result_cache = None
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Zipped package read in place, if unpacked_dir is a file. Its parts are
+        # addressed by paths under unpacked_dir (e.g. doc.docx/word/document.xml)
+        # so checks and messages are the same as for an unpacked directory.
+        self._package = None
+        if self.unpacked_dir.is_file():
+            self._package = zipfile.ZipFile(self.unpacked_dir, "r")
+            weakref.finalize(self, self._package.close)
+
+        # Index of all files in the package, built once so that listing files
+        # and checking whether a part exists are dictionary operations
+        # Format: part name -> zipfile.ZipInfo (zipped package) or os.stat_result
+        if self._package is not None:
+            self._file_index = {
+                info.filename: info
+                for info in self._package.infolist()
+                if not info.is_dir()
+            }
+        else:
+            self._file_index = _index_directory(self.unpacked_dir)
+
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.unpacked_dir / name
+            for extension in [".xml", ".rels"]
+            for name in self._file_index
+            if name.endswith(extension)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed XML parts shared by all validation passes, filled on first use
+        # Format: path -> lxml.etree._ElementTree or the exception raised by parsing
+        self._parsed_parts = {}
+
+        # ID and relationship indexes of parsed parts, filled on first use
+        # Format: path -> PartIndex
+        self._part_indexes = {}
+
+        # Relationship graph of the package, built on first use
+        self._package_graph = None
+
+        # Structured results of the checks run by validate()
+        self.report = ValidationReport()
+        self._current_check = None
+
+        # Original package contents, loaded on first use
+        self._original_file_hash = None
+        self._original_parts = None
+        self._original_part_info = None
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
-    def validate_xml(self):
-        """Validate that all XML files are well-formed."""
-        errors = []
+    def _run_checks(self, checks):
+        """Run validate_* methods as checks of the report and return True if all pass.
 
-        for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
+        The first check (XML well-formedness) gates the others, which only run
+        if it passes. With fail_fast, the others run cheapest first and stop
+        at the first failure.
+        """
+        first, *rest = checks
+        if not self._run_check(first):
+            return False
+
+        if self.fail_fast:
+            rest.sort(
+                key=lambda method: self.CHECK_COSTS.get(
+                    self._get_check_name(method), len(self.CHECK_COSTS)
                 )
+            )
+
+        all_valid = True
+        for method in rest:
+            if not self._run_check(method):
+                all_valid = False
+                if self.fail_fast:
+                    break
+        return all_valid
+
+    def _get_check_name(self, method):
+        """Get the name of the check run by a method (its name without "validate_")."""
+        return method.__name__.removeprefix("validate_")
+
+    def _run_check(self, method):
+        """Run a validate_* method as a check of the report, timing it.
+
+        The check is named after the method without its "validate_" prefix.
+
+        Returns:
+            bool: The method's result
+        """
+        name = self._get_check_name(method)
+        with self.report.check(name) as check:
+            self._current_check = check
+            try:
+                passed = method()
+            finally:
+                self._current_check = None
+            check.status = "passed" if passed else "failed"
+        return passed
+
+    def _add_issues(self, errors):
+        """Add the ValidationIssue objects among errors to the running check's report."""
+        if self._current_check is not None:
+            self._current_check.issues.extend(
+                error for error in errors if isinstance(error, ValidationIssue)
+            )
+
+    def _parse_part(self, xml_file):
+        """Parse an XML part once and return the tree shared by all validation passes.
+
+        The returned tree must not be modified. Passes that need to change it
+        must work on a deep copy.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the part is not well-formed (re-raised
+                on every call for the same part)
+        """
+        key = Path(xml_file)
+        if key not in self._parsed_parts:
+            try:
+                if self._package is not None:
+                    with self._package.open(self._get_part_name(key)) as f:
+                        self._parsed_parts[key] = lxml.etree.parse(f)
+                else:
+                    self._parsed_parts[key] = lxml.etree.parse(str(key))
             except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
+                self._parsed_parts[key] = e
+
+        result = self._parsed_parts[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _index_part(self, xml_file):
+        """Get the ID and relationship index of a part, built in one pass on first use.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        key = Path(xml_file)
+        index = self._part_indexes.get(key)
+        if index is None:
+            index = self._part_indexes[key] = PartIndex.build(
+                self._parse_part(key),
+                self.UNIQUE_ID_REQUIREMENTS,
+                collect_id_attrs=self.INDEX_ID_ATTRIBUTES,
+            )
+        return index
+
+    def _get_package_graph(self):
+        """Get the relationship graph of the package, built from all .rels parts on first use.
+
+        .rels parts that cannot be parsed are recorded in the graph's errors.
+        """
+        if self._package_graph is None:
+            graph = PackageGraph(self._list_part_names())
+            for rels_file in self.xml_files:
+                if not rels_file.name.endswith(".rels"):
+                    continue
+                rels_part = self._get_part_name(rels_file)
+                try:
+                    relationships = self._index_part(rels_file).relationships
+                except Exception as e:
+                    graph.add_error(rels_part, e)
+                else:
+                    graph.add_relationships(rels_part, relationships)
+            self._package_graph = graph
+        return self._package_graph
+
+    def _read_part(self, path):
+        """Read the bytes of a file in the package."""
+        if self._package is not None:
+            return self._package.read(self._get_part_name(path))
+        return Path(path).read_bytes()
+
+    def _part_exists(self, path):
+        """Check whether a file exists in the package."""
+        return self._get_part_name(path) in self._file_index
+
+    def _list_files(self):
+        """Get the paths of all files in the package."""
+        return [self.unpacked_dir / name for name in self._file_index]
+
+    def _list_part_names(self):
+        """Get the names of all files in the package, relative to its root."""
+        return list(self._file_index)
+
+    def _glob_parts(self, pattern):
+        """Get the paths of files in the package matching a pattern relative to its root."""
+        depth = pattern.count("/")
+        return [
+            self.unpacked_dir / name
+            for name in self._file_index
+            if name.count("/") == depth and PurePosixPath(name).match(pattern)
+        ]
+
+    def _resolve_target(self, rels_file, target):
+        """Resolve a relationship target to a part path relative to the package root.
+
+        Targets are relative to the directory of the source part (the parent
+        of the _rels directory), or to the package root if they start with "/".
+        The result is normalized as a zip member name, so it may start with
+        "../" if the target points outside the package.
+        """
+        return resolve_target(self._get_part_name(rels_file), target)
+
+    def _map_parts(self, method_name, xml_files, related_files=None):
+        """Run a per-part check method over XML files.
+
+        With jobs > 1 the files are fanned out to a process pool. Results are
+        always returned in the order of xml_files, so output matches a
+        sequential run. In incremental mode, results for parts identical to the
+        original are served from the shared part results cache.
+
+        Args:
+            method_name: Name of a method taking a single file path and
+                returning a picklable result
+            xml_files: Paths of the files to check
+            related_files: Optional function returning other files a result
+                depends on; a cached result is only used if these are also
+                unchanged
+
+        Returns:
+            list: One result per file
+        """
+        results = [None] * len(xml_files)
+        cache_keys = {}
+        pending = []
+
+        for i, xml_file in enumerate(xml_files):
+            dependencies = [xml_file]
+            if related_files is not None:
+                dependencies.extend(related_files(xml_file))
+
+            if all(self._is_part_unchanged(f) for f in dependencies):
+                key = (
+                    type(self).__name__,
+                    method_name,
+                    self._get_original_file_hash(),
+                    self._get_part_name(xml_file),
                 )
+                if key in self._part_results_cache:
+                    results[i] = self._part_results_cache[key]
+                    continue
+                cache_keys[i] = key
+            pending.append(i)
+
+        pending_files = [xml_files[i] for i in pending]
+        for i, result in zip(pending, self._run_parts(method_name, pending_files)):
+            results[i] = result
+            if i in cache_keys:
+                self._part_results_cache[cache_keys[i]] = result
+
+        return results
+
+    def _map_parts_within_budget(self, method_name, xml_files):
+        """Run _map_parts on as many files as the time budget allows.
+
+        Files are checked most recently modified first, in batches of one per
+        worker, until the deadline passes. Without a time budget, all files are
+        checked.
+
+        Returns:
+            list: One result per file, None for files left unchecked
+        """
+        if self._deadline is None:
+            return self._map_parts(method_name, xml_files)
+
+        # sorted() keeps the package order of files with the same time
+        order = sorted(
+            range(len(xml_files)),
+            key=lambda i: self._get_part_mtime(xml_files[i]),
+            reverse=True,
+        )
+        results = [None] * len(xml_files)
+        for start in range(0, len(order), self.jobs):
+            if time.perf_counter() >= self._deadline:
+                break
+            batch = order[start : start + self.jobs]
+            batch_results = self._map_parts(method_name, [xml_files[i] for i in batch])
+            for i, result in zip(batch, batch_results):
+                results[i] = result
+        return results
+
+    def _get_part_mtime(self, xml_file):
+        """Get the modification time of a file in the package, in seconds since the epoch."""
+        info = self._file_index[self._get_part_name(xml_file)]
+        if self._package is not None:
+            return time.mktime(info.date_time + (0, 0, -1))
+        return info.st_mtime
+
+    def _run_parts(self, method_name, xml_files):
+        """Run a per-part check method over XML files, in a process pool if jobs > 1."""
+        if self.jobs <= 1 or len(xml_files) < 2:
+            results = []
+            for xml_file in xml_files:
+                result, wall_time, cpu_time = _timed_call(
+                    getattr(self, method_name), xml_file
+                )
+                self._add_part_time(xml_file, wall_time, cpu_time)
+                results.append(result)
+            return results
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(
+                    type(self),
+                    self.unpacked_dir,
+                    self.original_file,
+                    self._get_worker_options(),
+                ),
+            )
+            weakref.finalize(self, self._executor.shutdown)
+
+        chunksize = max(1, len(xml_files) // (self.jobs * 4))
+        results = []
+        for xml_file, (result, wall_time, cpu_time) in zip(
+            xml_files,
+            self._executor.map(
+                _run_in_worker,
+                itertools.repeat(method_name),
+                xml_files,
+                chunksize=chunksize,
+            ),
+        ):
+            self._add_part_time(xml_file, wall_time, cpu_time)
+            results.append(result)
+        return results
+
+    def _get_worker_options(self):
+        """Get the constructor options of worker validators.
+
+        Per-part checks run in a worker as they would in this validator. In
+        incremental mode the changed parts are detected once here and passed
+        on, so workers skip unchanged parts without comparing them again.
+        """
+        options = {"verbose": self.verbose, "cache_dir": self.cache_dir}
+        if self.incremental:
+            options["changed_parts"] = self._get_changed_parts()
+        return options
+
+    def _add_part_time(self, xml_file, wall_time, cpu_time):
+        """Add time spent on a part to the running check's report."""
+        if self._current_check is not None:
+            self._current_check.add_part_time(
+                self._get_part_name(xml_file), wall_time, cpu_time
+            )
 
+    def _get_part_name(self, xml_file):
+        """Get the part path of a file relative to unpacked_dir, with forward slashes."""
+        path = os.fspath(xml_file)
+        if path.startswith(self._unpacked_dir_prefix):
+            # Paths built from unpacked_dir are already normalized
+            return path[len(self._unpacked_dir_prefix) :].replace(os.sep, "/")
+        return Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+
+    def _is_part_unchanged(self, xml_file):
+        """Check whether a part is known to be identical to the original (incremental mode only)."""
+        if not self.incremental:
+            return False
+        part_name = self._get_part_name(xml_file)
+        return (
+            part_name in self._get_original_part_info()
+            and part_name not in self._get_changed_parts()
+        )
+
+    def _get_changed_parts(self):
+        """Get the part paths that differ from the original.
+
+        Uses changed_parts if given, otherwise compares the size and CRC-32 of
+        each XML part with the original package's zip directory.
+        """
+        if self._changed_parts is None:
+            original_info = self._get_original_part_info()
+            changed = set()
+            for xml_file in self.xml_files:
+                part_name = self._get_part_name(xml_file)
+                info = self._file_index[part_name]
+                original = original_info.get(part_name)
+                if self._package is not None:
+                    # The package's zip directory already has both values
+                    part_info = (info.file_size, info.CRC)
+                elif original is None or original[0] != info.st_size:
+                    # The indexed size tells the part changed without reading it
+                    changed.add(part_name)
+                    continue
+                else:
+                    content = xml_file.read_bytes()
+                    part_info = (len(content), zlib.crc32(content))
+                if original != part_info:
+                    changed.add(part_name)
+            self._changed_parts = changed
+        return self._changed_parts
+
+    def close(self):
+        """Shut down the worker pool and close the result cache and package, if opened."""
+        if self._package is not None:
+            self._package.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._result_cache is not None:
+            self._result_cache.close()
+            self._result_cache = None
+
+    def _get_result_cache(self):
+        """Get the persistent XSD result cache, or None if no cache_dir is set."""
+        if self._result_cache is None and self.cache_dir is not None:
+            self._result_cache = XSDResultCache(self.cache_dir)
+            weakref.finalize(self, self._result_cache.close)
+        return self._result_cache
+
+    def validate_xml(self):
+        """Validate that all XML files are well-formed."""
+        errors = []
+
+        for file_errors in self._map_parts("_check_xml_file", self.xml_files):
+            errors.extend(file_errors)
+
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
@@ -153,27 +694,38 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_xml_file(self, xml_file):
+        """Check that a single XML file is well-formed. Returns a list of errors."""
+        try:
+            # Try to parse the XML file
+            self._parse_part(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                ValidationIssue(
+                    "xml-syntax",
+                    e.msg,
+                    xml_file.relative_to(self.unpacked_dir),
+                    e.lineno,
+                )
+            ]
+        except Exception as e:
+            return [
+                ValidationIssue(
+                    "xml-error",
+                    f"Unexpected error: {str(e)}",
+                    xml_file.relative_to(self.unpacked_dir),
+                )
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        for file_errors in self._map_parts("_check_file_namespaces", self.xml_files):
+            errors.extend(file_errors)
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
             for error in errors:
@@ -183,87 +735,60 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _check_file_namespaces(self, xml_file):
+        """Check Ignorable namespace declarations in a single XML file. Returns a list of errors."""
+        try:
+            root = self._parse_part(xml_file).getroot()
+        except lxml.etree.XMLSyntaxError:
+            return []
+
+        declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+        errors = []
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            undeclared = set(attr_val.split()) - declared
+            errors.extend(
+                ValidationIssue(
+                    "undeclared-namespace",
+                    f"Namespace '{ns}' in Ignorable but not declared",
+                    xml_file.relative_to(self.unpacked_dir),
+                )
+                for ns in undeclared
+            )
+        return errors
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+        results = self._map_parts("_check_file_unique_ids", self.xml_files)
+        for xml_file, findings in zip(self.xml_files, results):
+            for finding in findings:
+                if isinstance(finding, str):
+                    errors.append(finding)
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                id_value, sourceline, tag = finding
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        ValidationIssue(
+                            "duplicate-global-id",
+                            f"Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                            xml_file.relative_to(self.unpacked_dir),
+                            sourceline,
+                        )
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        sourceline,
+                        tag,
                     )
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
             for error in errors:
@@ -274,6 +799,50 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _check_file_unique_ids(self, xml_file):
+        """Check file-scoped ID uniqueness within a single XML file.
+
+        Returns:
+            list: Findings in document order, either error strings for
+                file-scoped duplicates or (id_value, sourceline, tag) tuples
+                for globally scoped IDs that still need a cross-file check
+        """
+        findings = []
+
+        try:
+            # The index leaves out IDs inside mc:AlternateContent
+            unique_ids = self._index_part(xml_file).unique_ids
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            findings.append(
+                ValidationIssue(
+                    "parse-error", f"Error: {e}", xml_file.relative_to(self.unpacked_dir)
+                )
+            )
+            return findings
+
+        file_ids = {}  # Track IDs that must be unique within this file
+        for tag, attr_name, id_value, sourceline in unique_ids:
+            scope = self.UNIQUE_ID_REQUIREMENTS[tag][1]
+            if scope == "global":
+                findings.append((id_value, sourceline, tag))
+            elif scope == "file":
+                # Check file-level uniqueness
+                seen = file_ids.setdefault((tag, attr_name), {})
+                if id_value in seen:
+                    findings.append(
+                        ValidationIssue(
+                            "duplicate-id",
+                            f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {seen[id_value]})",
+                            xml_file.relative_to(self.unpacked_dir),
+                            sourceline,
+                        )
+                    )
+                else:
+                    seen[id_value] = sourceline
+
+        return findings
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -281,93 +850,68 @@ class BaseSchemaValidator:
         errors = []
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = [f for f in self.xml_files if f.name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # Get all part paths in the package (excluding reference files)
+        graph = self._get_package_graph()
+        all_files = [
+            part_name
+            for part_name in graph.parts
+            if posixpath.basename(part_name) != "[Content_Types].xml"
+            and not part_name.endswith(".rels")
+        ]  # These files are not referenced by .rels
 
         if self.verbose:
             print(
                 f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
             )
 
-        # Check each .rels file
+        # Report broken references of each .rels file
         for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+            rel_path = rels_file.relative_to(self.unpacked_dir)
+            rels_part = rel_path.as_posix()
+            error = graph.errors.get(rels_part)
+            if error is not None:
+                errors.append(
+                    ValidationIssue(
+                        "parse-error",
+                        f"Error parsing {rel_path}: {error}",
+                        rel_path,
+                        text=f"  Error parsing {rel_path}: {error}",
+                    )
+                )
+                continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+            for relationship in graph.broken(rels_part):
+                errors.append(
+                    ValidationIssue(
+                        "broken-reference",
+                        f"Broken reference to {relationship.target}",
+                        rel_path,
+                        relationship.line,
+                    )
+                )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
+        unreferenced_files = set(all_files) - graph.referenced_parts
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(unreferenced_files, key=PurePosixPath):
+                errors.append(
+                    ValidationIssue(
+                        "unreferenced-file",
+                        "Unreferenced file",
+                        unref_file,
+                        text=f"  Unreferenced file: {Path(unref_file)}",
+                    )
+                )
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
             for error in errors:
@@ -390,98 +934,113 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
+        # (skip .rels files themselves)
+        xml_files = [f for f in self.xml_files if f.suffix != ".rels"]
+        for file_errors in self._map_parts(
+            "_check_file_relationship_ids",
+            xml_files,
+            related_files=lambda xml_file: [self._get_rels_file(xml_file)],
+        ):
+            errors.extend(file_errors)
+
+        self._add_issues(errors)
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
+            for error in errors:
+                print(error)
+            print("\nThese ID mismatches will cause the document to appear corrupt!")
+            return False
+        else:
+            if self.verbose:
+                print("PASSED - All relationship ID references are valid")
+            return True
 
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+    def _get_rels_file(self, xml_file):
+        """Get the .rels file for an XML file (dir/file.xml -> dir/_rels/file.xml.rels)."""
+        return xml_file.parent / "_rels" / f"{xml_file.name}.rels"
 
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
+    def _check_file_relationship_ids(self, xml_file):
+        """Check the r:id references of a single XML file. Returns a list of errors."""
+        errors = []
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+        # Determine the corresponding .rels file
+        rels_file = self._get_rels_file(xml_file)
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+        # Skip if there's no corresponding .rels file (that's okay)
+        if not self._part_exists(rels_file):
+            return errors
+
+        try:
+            # Get valid relationship IDs and their types from the .rels index
+            rid_to_type = {}
+
+            for rid, rel_type, _, sourceline in self._index_part(
+                rels_file
+            ).relationships:
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                        errors.append(
+                            ValidationIssue(
+                                "duplicate-relationship-id",
+                                f"Duplicate relationship ID '{rid}' (IDs must be unique)",
+                                rels_rel_path,
+                                sourceline,
                             )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
                         )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    # Extract just the type name from the full URL
+                    type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    rid_to_type[rid] = type_name
+
+            # Check all r:id references of the XML file
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            for elem_name, rid_attr, sourceline, _ in self._index_part(
+                xml_file
+            ).rid_refs:
+                # Check if the ID exists
+                if rid_attr not in rid_to_type:
+                    errors.append(
+                        ValidationIssue(
+                            "missing-relationship",
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                            xml_rel_path,
+                            sourceline,
                         )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
+                    )
+                # Check if we have type expectations for this element
+                elif self.ELEMENT_RELATIONSHIP_TYPES:
+                    expected_type = self._get_expected_relationship_type(elem_name)
+                    if expected_type:
+                        actual_type = rid_to_type[rid_attr]
+                        # Check if the actual type matches or contains the expected type
+                        if expected_type not in actual_type.lower():
                             errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
+                                ValidationIssue(
+                                    "relationship-type-mismatch",
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship",
+                                    xml_rel_path,
+                                    sourceline,
+                                )
                             )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
 
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(
+                ValidationIssue(
+                    "parse-error",
+                    f"Error processing {xml_rel_path}: {e}",
+                    xml_rel_path,
+                    text=f"  Error processing {xml_rel_path}: {e}",
+                )
+            )
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
-            print("\nThese ID mismatches will cause the document to appear corrupt!")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All relationship ID references are valid")
-            return True
+        return errors
 
     def _get_expected_relationship_type(self, element_name):
         """
@@ -525,31 +1084,33 @@ class BaseSchemaValidator:
 
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if not self._part_exists(content_types_file):
+            self._add_issues(
+                [
+                    ValidationIssue(
+                        "missing-content-types",
+                        "[Content_Types].xml file not found",
+                        "[Content_Types].xml",
+                    )
+                ]
+            )
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
+            root = self._parse_part(content_types_file).getroot()
 
             # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
+            declared_parts = {
+                part_name.lstrip("/")
+                for part_name in CONTENT_TYPE_OVERRIDES_XPATH(root)
+            }
 
             # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            declared_extensions = {
+                extension.lower() for extension in CONTENT_TYPE_DEFAULTS_XPATH(root)
+            }
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,15 +1136,18 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # Get all files in the package
+            all_files = self._list_part_names()
 
             # Check all XML files for Override declarations
-            for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
+            root_names = dict(
+                zip(
+                    self.xml_files,
+                    self._map_parts("_get_part_root_name", self.xml_files),
                 )
+            )
+            for xml_file in self.xml_files:
+                path_str = self._get_part_name(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -592,40 +1156,54 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                root_name = root_names[xml_file]
+                if root_name is None:
+                    continue  # Skip unparseable files
 
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        ValidationIssue(
+                            "undeclared-part",
+                            f"File with <{root_name}> root not declared in [Content_Types].xml",
+                            path_str,
                         )
-
-                except Exception:
-                    continue  # Skip unparseable files
+                    )
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part_name in all_files:
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
+                directories, _, file_name = part_name.rpartition("/")
+                suffix = posixpath.splitext(file_name)[1].lower()
+                if suffix in {".xml", ".rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
+                if file_name == "[Content_Types].xml":
                     continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                if {"_rels", "docProps"}.intersection(directories.split("/")):
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
+                extension = suffix.lstrip(".")
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            ValidationIssue(
+                                "undeclared-extension",
+                                f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                                part_name,
+                            )
                         )
 
         except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
+            errors.append(
+                ValidationIssue(
+                    "parse-error",
+                    f"Error parsing [Content_Types].xml: {e}",
+                    "[Content_Types].xml",
+                    text=f"  Error parsing [Content_Types].xml: {e}",
+                )
+            )
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
             for error in errors:
@@ -638,6 +1216,14 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _get_part_root_name(self, xml_file):
+        """Get the local name of a part's root element, or None if it can't be parsed."""
+        try:
+            root_tag = self._parse_part(xml_file).getroot().tag
+        except Exception:
+            return None
+        return local_name(root_tag)
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -648,9 +1234,14 @@ class BaseSchemaValidator:
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = Path(xml_file)
+        unpacked_dir = self.unpacked_dir
+
+        # A part identical to the original can't have new errors
+        if self._is_part_unchanged(xml_file):
+            if not self._get_schema_path(xml_file):
+                return None, set()  # Skipped
+            return True, set()
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
@@ -673,7 +1264,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -691,13 +1282,22 @@ class BaseSchemaValidator:
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
+        unchecked_count = 0
 
-        for xml_file in self.xml_files:
+        results = self._map_parts_within_budget(
+            "validate_file_against_xsd", self.xml_files
+        )
+        for xml_file, result in zip(self.xml_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
+            if result is None:
+                # Left unchecked by the time budget
+                if self._get_schema_path(xml_file):
+                    unchecked_count += 1
+                else:
+                    skipped_count += 1
+                continue
+            is_valid, new_file_errors = result
             if is_valid is None:
                 skipped_count += 1
                 continue
@@ -711,8 +1311,12 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            self._add_issues(
+                ValidationIssue("xsd", error, relative_path, text=f"    - {error}")
+                for error in sorted(new_file_errors)
+            )
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -722,11 +1326,29 @@ class BaseSchemaValidator:
             print(f"Validated {len(self.xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
+            if unchecked_count:
+                print(f"  - Not checked (time budget): {unchecked_count}")
             if original_error_count:
                 print(f"  - With original errors (ignored): {original_error_count}")
             print(
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
+            if self.jobs <= 1:
+                print(
+                    f"Schema cache: {SCHEMA_REGISTRY.hits} hits, "
+                    f"{SCHEMA_REGISTRY.misses} misses ({len(SCHEMA_REGISTRY)} compiled)"
+                )
+                if self._result_cache is not None:
+                    print(
+                        f"Result cache: {self._result_cache.hits} hits, "
+                        f"{self._result_cache.misses} misses"
+                    )
+
+        if unchecked_count and not self.verbose:
+            print(
+                f"Time budget of {self.time_budget}s exhausted - "
+                f"{unchecked_count} files not schema-validated"
+            )
 
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
@@ -762,66 +1384,59 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
-
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
-
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
+    def _preprocess_for_xsd(self, xml_doc, clean_namespaces):
+        """Prepare a copy of a parsed part for XSD validation in one walk.
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
-        elements_to_remove = []
+        Removes template tags ({{ ... }}) from text outside w:t elements and
+        the root's mc:Ignorable attribute. With clean_namespaces, also prunes
+        attributes and elements (with their subtrees) outside OOXML_NAMESPACES.
+        The input tree is not modified. Changes to what this removes must bump
+        XSDResultCache.FORMAT_VERSION, as cached results depend on it.
 
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
+        Args:
+            xml_doc: Parsed lxml tree of the part
+            clean_namespaces: Whether to remove foreign-namespace content
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
+        Returns:
+            lxml.etree._ElementTree: The preprocessed copy
+        """
+        root = copy.deepcopy(xml_doc.getroot())
+        root.attrib.pop(IGNORABLE_ATTR, None)
+
+        allowed = self.OOXML_NAMESPACES
+        foreign_elements = []
+        for elem in root.iter(lxml.etree.Element):
+            tag = elem.tag
+
+            # Template tags are kept in w:t content, and in the tail of w:t
+            if local_name(tag) != "t":
+                text = elem.text
+                if text and "{{" in text:
+                    elem.text = TEMPLATE_TAG_PATTERN.sub("", text)
+                tail = elem.tail
+                if tail and "{{" in tail:
+                    elem.tail = TEMPLATE_TAG_PATTERN.sub("", tail)
+
+            if clean_namespaces:
+                if tag[0] == "{" and namespace(tag) not in allowed:
+                    foreign_elements.append(elem)
                     continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
-
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
-
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
-
-        return xml_doc
+                foreign_attrs = [
+                    attr
+                    for attr in elem.keys()
+                    if attr[0] == "{" and namespace(attr) not in allowed
+                ]
+                for attr in foreign_attrs:
+                    del elem.attrib[attr]
+
+        # Removing an element also drops everything below it, including nested
+        # foreign elements collected above
+        for elem in foreign_elements:
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+
+        return lxml.etree.ElementTree(root)
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
@@ -830,28 +1445,57 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            return self._validate_content_xsd(
+                lambda: self._read_part(xml_file),
+                lambda: self._parse_part(xml_file),
+                schema_path,
+                xml_file.relative_to(base_path),
+            )
+
+        except Exception as e:
+            return False, {str(e)}
+
+    def _validate_content_xsd(self, read_content, parse, schema_path, relative_path):
+        """Validate a part against XSD schema, using the persistent result cache if enabled.
+
+        Args:
+            read_content: Function returning the part's bytes (only called if the
+                cache is enabled)
+            parse: Function returning the parsed part (skipped on a cache hit)
+            schema_path: Path to the XSD schema
+            relative_path: Path of the part relative to the package root
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        cache = self._get_result_cache()
+        if cache is None:
+            return self._validate_xml_doc_xsd(parse(), schema_path, relative_path)
+
+        part_sha256 = hashlib.sha256(read_content()).hexdigest()
+        cleaned = self._needs_namespace_cleaning(relative_path)
+        errors = cache.get(schema_path, part_sha256, cleaned)
+        if errors is None:
+            _, errors = self._validate_xml_doc_xsd(parse(), schema_path, relative_path)
+            cache.put(schema_path, part_sha256, cleaned, errors)
+        return not errors, errors
+
+    def _needs_namespace_cleaning(self, relative_path):
+        """Check if a part is in a main content folder, where ignorable namespaces are removed."""
+        return bool(
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        )
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+    def _validate_xml_doc_xsd(self, xml_doc, schema_path, relative_path):
+        """Validate a parsed XML document against XSD schema. Returns (is_valid, errors_set)."""
+        try:
+            # Load schema (compiled once per process)
+            schema = SCHEMA_REGISTRY.get(schema_path)
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+            # Preprocess a copy of the XML, cleaning ignorable namespaces if needed
+            xml_doc = self._preprocess_for_xsd(
+                xml_doc, self._needs_namespace_cleaning(relative_path)
+            )
 
             # Validate
             if schema.validate(xml_doc):
@@ -869,82 +1513,138 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are cached by original file hash and part path, so the original
+        package is read at most once per validator and each part is validated
+        at most once per process.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        if self.original_file is None:
+            return set()
+        relative_path = Path(self._get_part_name(xml_file))
+
+        cache_key = (self._get_original_file_hash(), relative_path.as_posix())
+        if cache_key not in self._original_errors_cache:
+            self._original_errors_cache[cache_key] = frozenset(
+                self._validate_original_part_xsd(relative_path)
+            )
+        return set(self._original_errors_cache[cache_key])
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+    def _validate_original_part_xsd(self, relative_path):
+        """Validate a part of the original document in memory. Returns errors_set."""
+        content = self._get_original_parts().get(relative_path.as_posix())
+        if content is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+        try:
+            is_valid, errors = self._validate_content_xsd(
+                lambda: content,
+                lambda: lxml.etree.ElementTree(lxml.etree.fromstring(content)),
+                schema_path,
+                relative_path,
             )
-            return errors if errors else set()
+        except Exception as e:
+            return {str(e)}
+
+        return errors if errors else set()
+
+    def _get_original_file_hash(self):
+        """Get the SHA-256 hash of the original file."""
+        if self._original_file_hash is None:
+            digest = hashlib.sha256()
+            with open(self.original_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._original_file_hash = digest.hexdigest()
+        return self._original_file_hash
+
+    def _get_original_part_info(self):
+        """Map part paths of the original file to (size, CRC-32) from its zip directory."""
+        if self._original_part_info is None:
+            if self.original_file is None:
+                return {}
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                self._original_part_info = {
+                    info.filename: (info.file_size, info.CRC)
+                    for info in zip_ref.infolist()
+                    if not info.is_dir()
+                }
+        return self._original_part_info
+
+    def _get_original_parts(self):
+        """Read XML and .rels parts of the original file into memory (once)."""
+        if self._original_parts is None:
+            self._original_parts = {}
+            if self.original_file is None:
+                return self._original_parts
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                for name in zip_ref.namelist():
+                    if name.endswith((".xml", ".rels")):
+                        self._original_parts[name] = zip_ref.read(name)
+        return self._original_parts
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+# Validator used by worker processes of the per-part process pool
+_worker_validator = None
 
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
+def _index_directory(root):
+    """Stat all files under a directory in one walk.
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
+    Files are listed in the order Path.rglob would yield them: each
+    directory's files, then its subdirectories (not following symlinks).
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+    Returns:
+        dict: Part name relative to root (forward slashes) -> os.stat_result
+    """
+    index = {}
+    directories = [(os.fspath(root), "")]
+    while directories:
+        path, prefix = directories.pop()
+        subdirectories = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        index[f"{prefix}{entry.name}"] = entry.stat()
+        except OSError:
+            continue
+        directories.extend(reversed(subdirectories))
+    return index
+
+
+def _init_worker(validator_class, unpacked_dir, original_file, kwargs):
+    """Create the validator used by a worker process."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file, **kwargs)
+
+
+def _run_in_worker(method_name, xml_file):
+    """Run a per-part check method in a worker process. Returns (result, wall_time, cpu_time)."""
+    return _timed_call(getattr(_worker_validator, method_name), xml_file)
+
+
+def _timed_call(function, *args):
+    """Call a function and return (result, wall_time, cpu_time)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = function(*args)
+    return (
+        result,
+        time.perf_counter() - wall_start,
+        time.process_time() - cpu_start,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from validation.base import BaseSchemaValidator
+from validation.docx import DOCXSchemaValidator
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>'
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        "<w:body><w:p><w:r><w:t>Some text</w:t></w:r></w:p></w:body></w:document>"
+    ),
+    "word/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+    ),
+}
+
+
+class RecordingValidator(DOCXSchemaValidator):
+    """Validator recording the parts checked for well-formedness."""
+
+    checked = []
+
+    def _check_xml_file(self, xml_file):
+        self.checked.append(self._get_part_name(xml_file))
+        return super()._check_xml_file(xml_file)
+
+
+# Currently not executed automatically in CI; run from ooxml/scripts with
+# python -m unittest validation.base_test
+class TestIncrementalValidation(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.original_docx = Path(temp_dir.name) / "original.docx"
+        self.unpacked = Path(temp_dir.name) / "unpacked"
+        with zipfile.ZipFile(self.original_docx, "w") as zip_ref:
+            for name, content in PARTS.items():
+                zip_ref.writestr(name, content)
+                (self.unpacked / name).parent.mkdir(parents=True, exist_ok=True)
+                (self.unpacked / name).write_text(content, encoding="utf-8")
+
+        # Results of unchanged parts are shared by all validators in the process
+        BaseSchemaValidator._part_results_cache.clear()
+        self.addCleanup(BaseSchemaValidator._part_results_cache.clear)
+
+    def validate_xml(self, **kwargs):
+        """Run the well-formedness check, returning its result and the checked parts."""
+        RecordingValidator.checked = []
+        validator = RecordingValidator(
+            self.unpacked, self.original_docx, incremental=True, **kwargs
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            passed = validator.validate_xml()
+        validator.close()
+        return passed, sorted(RecordingValidator.checked)
+
+    def test_unchanged_parts_are_reused(self):
+        """Test that a second validation of an unchanged package checks no part"""
+        self.assertEqual(self.validate_xml(), (True, sorted(PARTS)))
+        self.assertEqual(self.validate_xml(), (True, []))
+
+    def test_edited_part_is_rechecked(self):
+        """Test that only a part edited between two validations is checked again"""
+        self.validate_xml()
+
+        # Same size, so the edit is only found by its CRC-32
+        document = self.unpacked / "word" / "document.xml"
+        content = document.read_text(encoding="utf-8")
+        document.write_text(content.replace("Some", "<ome"), encoding="utf-8")
+
+        passed, checked = self.validate_xml()
+        self.assertFalse(passed)
+        self.assertEqual(checked, ["word/document.xml"])
+
+    def test_changed_parts_are_rechecked(self):
+        """Test that parts given as changed are checked again"""
+        self.validate_xml()
+        passed, checked = self.validate_xml(changed_parts=["word/styles.xml"])
+        self.assertTrue(passed)
+        self.assertEqual(checked, ["word/styles.xml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
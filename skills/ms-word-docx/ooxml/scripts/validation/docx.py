@@ -2,72 +2,96 @@
 Validator for Word document XML files against XSD schemas.
 """
 
-import re
-import tempfile
 import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .report import ValidationIssue
+from .xml_names import (
+    DEL_TAG,
+    DELTEXT_TAG,
+    INS_TAG,
+    P_TAG,
+    T_TAG,
+    W_NAMESPACE,
+    XML_SPACE_ATTR,
+)
+
+
+def _has_edge_whitespace(text):
+    """Check if a non-empty text starts or ends with whitespace.
+
+    Text with newlines only counts if they all come at its end, as "\n" or
+    "\n\n", which is what the regex ".*\\s$" this replaces matched.
+    """
+    if text[0].isspace():
+        return True
+    newline = text.find("\n")
+    if newline == -1:
+        return text[-1].isspace()
+    return text[-1] == "\n" and newline >= len(text) - 2
+
+
+def _is_descendant(elem, ancestor):
+    """Check if an element is inside another one."""
+    parent = elem.getparent()
+    while parent is not None:
+        if parent is ancestor:
+            return True
+        parent = parent.getparent()
+    return False
+
+
+def _text_preview(text):
+    """Get the repr of a text, shortened to 50 characters."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
     """Validator for Word document XML files against XSD schemas."""
 
     # Word-specific namespace
-    WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    WORD_2006_NAMESPACE = W_NAMESPACE
 
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Results of _scan_document_part for each document.xml, shared by the
+        # checks that report them
+        self._document_scans = None
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
-        # Test 0: XML well-formedness
-        if not self.validate_xml():
-            return False
-
-        # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
-
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
-
-        # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
-
-        # Test 4: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
-
-        # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
-
-        # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
-            all_valid = False
-
-        # Test 7: Deletion validation
-        if not self.validate_deletions():
-            all_valid = False
-
-        # Test 8: Insertion validation
-        if not self.validate_insertions():
-            all_valid = False
-
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
-        # Count and compare paragraphs
-        self.compare_paragraph_counts()
-
-        return all_valid
+        return self._run_checks(
+            [
+                # Test 0: XML well-formedness
+                self.validate_xml,
+                # Test 1: Namespace declarations
+                self.validate_namespaces,
+                # Test 2: Unique IDs
+                self.validate_unique_ids,
+                # Test 3: Relationship and file reference validation
+                self.validate_file_references,
+                # Test 4: Content type declarations
+                self.validate_content_types,
+                # Test 5: XSD schema validation
+                self.validate_against_xsd,
+                # Test 6: Whitespace preservation
+                self.validate_whitespace_preservation,
+                # Test 7: Deletion validation
+                self.validate_deletions,
+                # Test 8: Insertion validation
+                self.validate_insertions,
+                # Test 9: Relationship ID reference validation
+                self.validate_all_relationship_ids,
+                # Count and compare paragraphs (informational, always passes)
+                self.compare_paragraph_counts,
+            ]
+        )
 
     def validate_whitespace_preservation(self):
         """
@@ -75,42 +99,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for scan in self._get_document_scans():
+            errors.extend(scan["whitespace"])
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
             for error in errors:
@@ -128,38 +120,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for scan in self._get_document_scans():
+            errors.extend(scan["deletions"])
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
             for error in errors:
@@ -173,40 +137,27 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
-
+        for scan in self._get_document_scans():
+            count = scan["paragraphs"]
         return count
 
     def count_paragraphs_in_original(self):
-        """Count the number of paragraphs in the original docx file."""
+        """Count the number of paragraphs in the original docx file.
+
+        word/document.xml is streamed from the zip, so no full tree is built.
+        """
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                with zip_ref.open("word/document.xml") as f:
+                    # Count all w:p elements, freeing each one (and the
+                    # paragraphs before it) once counted
+                    for _, elem in lxml.etree.iterparse(f, events=("end",), tag=P_TAG):
+                        count += 1
+                        elem.clear(keep_tail=True)
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -220,36 +171,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for scan in self._get_document_scans():
+            errors.extend(scan["insertions"])
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
             for error in errors:
@@ -260,14 +185,111 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    def _get_document_scans(self):
+        """Scan each document.xml once and return the results for all Word-specific checks."""
+        if self._document_scans is None:
+            # Only check document.xml files
+            document_files = [f for f in self.xml_files if f.name == "document.xml"]
+            self._document_scans = self._map_parts(
+                "_scan_document_part", document_files
+            )
+        return self._document_scans
+
+    def _scan_document_part(self, xml_file):
+        """Run the Word-specific checks on a document.xml in one walk over its elements.
+
+        Only paragraphs, text and tracked changes are visited, keeping track of
+        the w:del and w:ins elements the walk is inside.
+
+        Returns:
+            dict: Errors for "whitespace" (w:t with edge whitespace but no
+                xml:space="preserve"), "deletions" (w:t with text inside
+                w:del) and "insertions" (w:delText inside w:ins but not
+                w:del), and the number of "paragraphs"
+        """
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        scan = {"whitespace": [], "deletions": [], "insertions": [], "paragraphs": 0}
+
+        try:
+            tree = self._parse_part(xml_file)
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            error = ValidationIssue("parse-error", f"Error: {e}", relative_path)
+            scan["whitespace"].append(error)
+            scan["deletions"].append(error)
+            scan["insertions"].append(error)
+            return scan
+
+        # Tracked changes containing the current element, outermost first. The
+        # walk is in document order, so a change is closed as soon as an
+        # element outside it is reached.
+        open_changes = []
+        paragraphs = 0
+        for elem in tree.iter(P_TAG, T_TAG, DEL_TAG, INS_TAG, DELTEXT_TAG):
+            while open_changes and not _is_descendant(elem, open_changes[-1]):
+                open_changes.pop()
+
+            tag = elem.tag
+            if tag == P_TAG:
+                paragraphs += 1
+            elif tag == T_TAG:
+                text = elem.text
+                if text:
+                    if (
+                        _has_edge_whitespace(text)
+                        and elem.get(XML_SPACE_ATTR) != "preserve"
+                    ):
+                        scan["whitespace"].append(
+                            ValidationIssue(
+                                "missing-space-preserve",
+                                "w:t element with whitespace missing "
+                                f"xml:space='preserve': {_text_preview(text)}",
+                                relative_path,
+                                elem.sourceline,
+                            )
+                        )
+                    if open_changes and any(c.tag == DEL_TAG for c in open_changes):
+                        scan["deletions"].append(
+                            ValidationIssue(
+                                "text-in-deletion",
+                                f"<w:t> found within <w:del>: {_text_preview(text)}",
+                                relative_path,
+                                elem.sourceline,
+                            )
+                        )
+            elif tag == DELTEXT_TAG:
+                # w:delText in w:ins is only allowed when nested within a w:del
+                tags = {c.tag for c in open_changes}
+                if INS_TAG in tags and DEL_TAG not in tags:
+                    scan["insertions"].append(
+                        ValidationIssue(
+                            "deltext-in-insertion",
+                            "<w:delText> within <w:ins>: "
+                            f"{_text_preview(elem.text or '')}",
+                            relative_path,
+                            elem.sourceline,
+                        )
+                    )
+            else:
+                open_changes.append(elem)
+
+        scan["paragraphs"] = paragraphs
+        return scan
+
     def compare_paragraph_counts(self):
-        """Compare paragraph counts between original and new document."""
+        """Compare paragraph counts between original and new document.
+
+        The counts are informational, so this always returns True.
+        """
+        if self.original_file is None:
+            return True
+
         original_count = self.count_paragraphs_in_original()
         new_count = self.count_paragraphs_in_unpacked()
 
         diff = new_count - original_count
         diff_str = f"+{diff}" if diff > 0 else str(diff)
         print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
+        return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+"""
+Relationship graph of an OOXML package, built once from all of its .rels parts.
+"""
+
+import collections
+import posixpath
+
+# One edge of the graph. source is the part the relationship belongs to ("" for
+# the package itself), kind is the last segment of the relationship type (e.g.
+# "slideLayout") and part is the resolved target part name, or None for
+# external targets.
+Relationship = collections.namedtuple(
+    "Relationship", "source rels_part id type kind target part line"
+)
+
+
+def get_source_part(rels_part):
+    """Get the part a .rels part describes ("ppt/_rels/a.xml.rels" -> "ppt/a.xml", "_rels/.rels" -> "")."""
+    rels_dir, rels_name = posixpath.split(rels_part)
+    return posixpath.join(posixpath.dirname(rels_dir), rels_name.removesuffix(".rels"))
+
+
+def get_rels_part(source_part):
+    """Get the .rels part of a part ("ppt/a.xml" -> "ppt/_rels/a.xml.rels")."""
+    source_dir, source_name = posixpath.split(source_part)
+    return posixpath.join(source_dir, "_rels", f"{source_name}.rels")
+
+
+def resolve_target(rels_part, target):
+    """Resolve a relationship target to a part name relative to the package root.
+
+    Targets are relative to the directory of the source part (the parent of
+    the _rels directory), or to the package root if they start with "/". The
+    result is normalized as a zip member name, so it may start with "../" if
+    the target points outside the package.
+    """
+    if target.startswith("/"):
+        return posixpath.normpath(target.lstrip("/"))
+    source_dir = posixpath.dirname(posixpath.dirname(rels_part))
+    return posixpath.normpath(posixpath.join(source_dir, target))
+
+
+def is_external_target(target):
+    """Check if a relationship target is outside the package (or missing)."""
+    return not target or target.startswith(("http", "mailto:"))
+
+
+class PackageGraph:
+    """Parts of a package and the typed relationships between them.
+
+    Every query is a dictionary lookup, so checks over all parts take time
+    linear in the number of relationships.
+
+    Attributes:
+        parts: Names of all files in the package
+        rels_parts: Names of the .rels parts added, in the order they were added
+        errors: .rels part name -> exception raised while reading it
+    """
+
+    def __init__(self, parts):
+        """
+        Args:
+            parts: Names of all files in the package, relative to its root
+        """
+        self.parts = set(parts)
+        self.rels_parts = []
+        self.errors = {}
+        self._by_rels_part = {}
+        self._outgoing = collections.defaultdict(list)
+        self._incoming = collections.defaultdict(list)
+
+    def add_relationships(self, rels_part, relationships):
+        """Add the relationships of a .rels part.
+
+        Args:
+            rels_part: Name of the .rels part
+            relationships: (id, type, target, sourceline) in document order
+        """
+        source = get_source_part(rels_part)
+        self.rels_parts.append(rels_part)
+        edges = self._by_rels_part.setdefault(rels_part, [])
+        for rel_id, rel_type, target, line in relationships:
+            part = None if is_external_target(target) else resolve_target(rels_part, target)
+            edge = Relationship(
+                source,
+                rels_part,
+                rel_id,
+                rel_type,
+                rel_type.rpartition("/")[2],
+                target,
+                part,
+                line,
+            )
+            edges.append(edge)
+            self._outgoing[source].append(edge)
+            if part is not None:
+                self._incoming[part].append(edge)
+
+    def add_error(self, rels_part, error):
+        """Record that a .rels part could not be read."""
+        self.rels_parts.append(rels_part)
+        self.errors[rels_part] = error
+
+    def rels_parts_in(self, directory):
+        """Get the .rels parts directly inside a directory (e.g. "ppt/slides/_rels")."""
+        return [
+            rels_part
+            for rels_part in self.rels_parts
+            if posixpath.dirname(rels_part) == directory
+        ]
+
+    def relationships_in(self, rels_part):
+        """Get the relationships declared in a .rels part, in document order."""
+        return self._by_rels_part.get(rels_part, [])
+
+    def outgoing(self, source, kind=None):
+        """Get the relationships of a part, optionally only those of one kind (e.g. "slideLayout")."""
+        edges = self._outgoing.get(source, [])
+        if kind is None:
+            return list(edges)
+        return [edge for edge in edges if edge.kind == kind]
+
+    def incoming(self, part, kind=None):
+        """Get the relationships targeting a part, optionally only those of one kind."""
+        edges = self._incoming.get(part, [])
+        if kind is None:
+            return list(edges)
+        return [edge for edge in edges if edge.kind == kind]
+
+    def broken(self, rels_part):
+        """Get the relationships of a .rels part whose internal target does not exist."""
+        return [
+            edge
+            for edge in self.relationships_in(rels_part)
+            if edge.part is not None and edge.part not in self.parts
+        ]
+
+    @property
+    def referenced_parts(self):
+        """Names of the existing parts that are the target of at least one relationship."""
+        return {part for part in self._incoming if part in self.parts}
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,18 +2,28 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
+import posixpath
 import re
 
 from .base import BaseSchemaValidator
+from .package_graph import get_rels_part, get_source_part
+from .report import ValidationIssue
+from .xml_names import P_NAMESPACE
+
+# UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+UUID_PATTERN = re.compile(
+    r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+)
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
     """Validator for PowerPoint presentation XML files against XSD schemas."""
 
     # PowerPoint presentation namespace
-    PRESENTATIONML_NAMESPACE = (
-        "http://schemas.openxmlformats.org/presentationml/2006/main"
-    )
+    PRESENTATIONML_NAMESPACE = P_NAMESPACE
+
+    # Part indexes collect ID-like attributes for the UUID check
+    INDEX_ID_ATTRIBUTES = True
 
     # PowerPoint-specific element to relationship type mappings
     ELEMENT_RELATIONSHIP_TYPES = {
@@ -27,87 +37,41 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate(self):
         """Run all validation checks and return True if all pass."""
-        # Test 0: XML well-formedness
-        if not self.validate_xml():
-            return False
-
-        # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
-
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
-
-        # Test 3: UUID ID validation
-        if not self.validate_uuid_ids():
-            all_valid = False
-
-        # Test 4: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
-
-        # Test 5: Slide layout ID validation
-        if not self.validate_slide_layout_ids():
-            all_valid = False
-
-        # Test 6: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
-
-        # Test 7: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
-
-        # Test 8: Notes slide reference validation
-        if not self.validate_notes_slide_references():
-            all_valid = False
-
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
-        # Test 10: Duplicate slide layout references validation
-        if not self.validate_no_duplicate_slide_layouts():
-            all_valid = False
-
-        return all_valid
+        return self._run_checks(
+            [
+                # Test 0: XML well-formedness
+                self.validate_xml,
+                # Test 1: Namespace declarations
+                self.validate_namespaces,
+                # Test 2: Unique IDs
+                self.validate_unique_ids,
+                # Test 3: UUID ID validation
+                self.validate_uuid_ids,
+                # Test 4: Relationship and file reference validation
+                self.validate_file_references,
+                # Test 5: Slide layout ID validation
+                self.validate_slide_layout_ids,
+                # Test 6: Content type declarations
+                self.validate_content_types,
+                # Test 7: XSD schema validation
+                self.validate_against_xsd,
+                # Test 8: Notes slide reference validation
+                self.validate_notes_slide_references,
+                # Test 9: Relationship ID reference validation
+                self.validate_all_relationship_ids,
+                # Test 10: Duplicate slide layout references validation
+                self.validate_no_duplicate_slide_layouts,
+            ]
+        )
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for file_errors in self._map_parts("_check_file_uuid_ids", self.xml_files):
+            errors.extend(file_errors)
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
             for error in errors:
@@ -118,8 +82,42 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _check_file_uuid_ids(self, xml_file):
+        """Check UUID-like ID attributes in a single XML file. Returns a list of errors."""
+        import lxml.etree
+
+        errors = []
+
+        try:
+            # Check all ID attributes (local name ending in "id")
+            for value, sourceline in self._index_part(xml_file).id_attrs:
+                # Check if value looks like a UUID (has the right length and pattern structure)
+                if self._looks_like_uuid(value):
+                    # Validate that it contains only hex characters in the right positions
+                    if not UUID_PATTERN.match(value):
+                        errors.append(
+                            ValidationIssue(
+                                "invalid-uuid",
+                                f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                                xml_file.relative_to(self.unpacked_dir),
+                                sourceline,
+                            )
+                        )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                ValidationIssue(
+                    "parse-error", f"Error: {e}", xml_file.relative_to(self.unpacked_dir)
+                )
+            )
+
+        return errors
+
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
+        # 32 characters plus at most two braces and four hyphens
+        if not 32 <= len(value) <= 38:
+            return False
         # Remove common UUID delimiters
         clean_value = value.strip("{}()").replace("-", "")
         # Check if it's 32 hex-like characters (could include invalid hex chars)
@@ -132,61 +130,67 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = self._glob_parts("ppt/slideMasters/*.xml")
 
         if not slide_masters:
             if self.verbose:
                 print("PASSED - No slide masters found")
             return True
 
+        graph = self._get_package_graph()
         for slide_master in slide_masters:
             try:
-                # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                # Index the slide master file
+                index = self._index_part(slide_master)
+                master_part = self._get_part_name(slide_master)
 
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = get_rels_part(master_part)
 
-                if not rels_file.exists():
+                if rels_part not in graph.parts:
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        ValidationIssue(
+                            "missing-relationships-file",
+                            f"Missing relationships file: {rels_part}",
+                            slide_master.relative_to(self.unpacked_dir),
+                        )
                     )
                     continue
-
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_part in graph.errors:
+                    raise graph.errors[rels_part]
 
                 # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
-
-                # Find all sldLayoutId elements in the slide master
-                for sld_layout_id in root.findall(
-                    f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"
-                ):
-                    r_id = sld_layout_id.get(
-                        f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
-                    )
-                    layout_id = sld_layout_id.get("id")
+                valid_layout_rids = {
+                    relationship.id
+                    for relationship in graph.outgoing(master_part, "slideLayout")
+                }
 
-                    if r_id and r_id not in valid_layout_rids:
+                # Find all sldLayoutId elements with an r:id in the slide master
+                for elem_name, r_id, sourceline, layout_id in index.rid_refs:
+                    if elem_name != "sldLayoutId":
+                        continue
+
+                    if r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            ValidationIssue(
+                                "invalid-slide-layout-id",
+                                f"sldLayoutId with id='{layout_id}' "
+                                f"references r:id='{r_id}' which is not found in slide layout relationships",
+                                slide_master.relative_to(self.unpacked_dir),
+                                sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationIssue(
+                        "parse-error",
+                        f"Error: {e}",
+                        slide_master.relative_to(self.unpacked_dir),
+                    )
                 )
 
+        self._add_issues(errors)
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
             for error in errors:
@@ -202,34 +206,31 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
-
-        for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+        graph = self._get_package_graph()
 
-                # Find all slideLayout relationships
-                layout_rels = [
-                    rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        for rels_part in self._get_slide_rels_parts(graph):
+            if rels_part in graph.errors:
+                errors.append(
+                    ValidationIssue(
+                        "parse-error", f"Error: {graph.errors[rels_part]}", rels_part
                     )
-                    if "slideLayout" in rel.get("Type", "")
-                ]
+                )
+                continue
 
-                if len(layout_rels) > 1:
-                    errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
-                    )
+            # Find all slideLayout relationships
+            layout_rels = graph.outgoing(get_source_part(rels_part), "slideLayout")
 
-            except Exception as e:
+            if len(layout_rels) > 1:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationIssue(
+                        "duplicate-slide-layout",
+                        f"has {len(layout_rels)} slideLayout references",
+                        rels_part,
+                    )
                 )
 
+        self._add_issues(errors)
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
             for error in errors:
@@ -240,63 +241,72 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    def _get_slide_rels_parts(self, graph):
+        """Get the names of the slides' .rels parts (ppt/slides/_rels/*.xml.rels)."""
+        return [
+            rels_part
+            for rels_part in graph.rels_parts_in("ppt/slides/_rels")
+            if rels_part.endswith(".xml.rels")
+        ]
+
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        graph = self._get_package_graph()
+        slide_rels_parts = self._get_slide_rels_parts(graph)
 
-        if not slide_rels_files:
+        if not slide_rels_parts:
             if self.verbose:
                 print("PASSED - No slide relationship files found")
             return True
 
-        for rels_file in slide_rels_files:
-            try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            # Normalize the target path to handle relative paths
-                            normalized_target = target.replace("../", "")
-
-                            # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
-                            )  # e.g., "slide1"
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append(
-                                (slide_name, rels_file)
-                            )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
+        for rels_part in slide_rels_parts:
+            if rels_part in graph.errors:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationIssue(
+                        "parse-error", f"Error: {graph.errors[rels_part]}", rels_part
+                    )
+                )
+                continue
+
+            # Find all notesSlide relationships, keyed by the resolved notes part
+            for relationship in graph.outgoing(
+                get_source_part(rels_part), "notesSlide"
+            ):
+                if relationship.part is None:
+                    continue
+
+                # Track which slide references this notesSlide
+                slide_name = posixpath.basename(rels_part).removesuffix(
+                    ".xml.rels"
+                )  # e.g., "slide1"
+                notes_slide_references.setdefault(relationship.part, []).append(
+                    (slide_name, rels_part, relationship.target.replace("../", ""))
                 )
 
         # Check for duplicate references
-        for target, references in notes_slide_references.items():
+        for references in notes_slide_references.values():
             if len(references) > 1:
+                # Named by the first reference's target, without leading "../"
+                target = references[0][2]
                 slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
-                )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                message = f"Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                errors.append(f"  {message}")
+                # One issue per referencing slide, printed below the summary line
+                for _, rels_part, _ in references:
+                    errors.append(
+                        ValidationIssue(
+                            "shared-notes-slide",
+                            message,
+                            rels_part,
+                            text=f"    - {rels_part}",
+                        )
+                    )
 
+        self._add_issues(errors)
         if errors:
             print(
                 f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
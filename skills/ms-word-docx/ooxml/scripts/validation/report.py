@@ -0,0 +1,150 @@
+"""
+Structured validation results: issues, per-check status and timings.
+"""
+
+import contextlib
+import time
+from pathlib import Path
+
+
+class ValidationIssue(str):
+    """A validation error with its location, usable wherever error strings are.
+
+    The string value is the line printed for the error, so checks can keep
+    collecting and printing issues as plain strings while the report keeps
+    the structured fields.
+
+    Attributes:
+        code: Short machine-readable error kind (e.g. "broken-reference")
+        message: Error message without file and line
+        file: Part path relative to the package root, or None
+        line: Line number in the part, or None
+    """
+
+    def __new__(cls, code, message, file=None, line=None, text=None):
+        """
+        Args:
+            code: Short machine-readable error kind
+            message: Error message without file and line
+            file: Part path relative to the package root (str or Path)
+            line: Line number in the part
+            text: Printed line, if it differs from the default
+                "  {file}: Line {line}: {message}"
+        """
+        if file is not None:
+            file = Path(file).as_posix()
+        if text is None:
+            text = "  "
+            if file is not None:
+                text += f"{file}: "
+            if line is not None:
+                text += f"Line {line}: "
+            text += message
+
+        issue = super().__new__(cls, text)
+        issue.code = code
+        issue.message = message
+        issue.file = file
+        issue.line = line
+        return issue
+
+    def __reduce__(self):
+        return (
+            ValidationIssue,
+            (self.code, self.message, self.file, self.line, str(self)),
+        )
+
+    def to_dict(self):
+        return {
+            "file": self.file,
+            "line": self.line,
+            "code": self.code,
+            "message": self.message,
+        }
+
+
+class CheckResult:
+    """Outcome and cost of one validation check.
+
+    Attributes:
+        name: Check name (e.g. "unique_ids")
+        status: "passed", "failed" or "error" (None while running)
+        issues: ValidationIssue objects found by the check
+        wall_time: Elapsed seconds
+        cpu_time: CPU seconds used by this process (worker time is in parts)
+        parts: Part path -> [wall_time, cpu_time] of per-part work in this check
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.status = None
+        self.issues = []
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.parts = {}
+
+    def add_part_time(self, part, wall_time, cpu_time):
+        """Add the time spent on one part, accumulating repeated work on the same part."""
+        times = self.parts.setdefault(part, [0.0, 0.0])
+        times[0] += wall_time
+        times[1] += cpu_time
+
+    def to_dict(self):
+        return {
+            "check": self.name,
+            "status": self.status,
+            "wall_time": round(self.wall_time, 6),
+            "cpu_time": round(self.cpu_time, 6),
+            "errors": [issue.to_dict() for issue in self.issues],
+            "parts": {
+                part: {"wall_time": round(wall, 6), "cpu_time": round(cpu, 6)}
+                for part, (wall, cpu) in self.parts.items()
+            },
+        }
+
+
+class ValidationReport:
+    """Results of all checks run on a document, in the order they ran."""
+
+    def __init__(self):
+        self.checks = []
+
+    @contextlib.contextmanager
+    def check(self, name):
+        """Time a check and add its result to the report.
+
+        The caller sets the yielded CheckResult's status. It is set to "error"
+        if the check raises.
+        """
+        result = CheckResult(name)
+        self.checks.append(result)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield result
+        except BaseException:
+            result.status = "error"
+            raise
+        finally:
+            result.wall_time = time.perf_counter() - wall_start
+            result.cpu_time = time.process_time() - cpu_start
+
+    def extend(self, other):
+        """Append the checks of another report."""
+        self.checks.extend(other.checks)
+
+    @property
+    def passed(self):
+        return all(check.status == "passed" for check in self.checks)
+
+    def to_dict(self):
+        return {
+            "passed": self.passed,
+            "wall_time": round(sum(c.wall_time for c in self.checks), 6),
+            "cpu_time": round(sum(c.cpu_time for c in self.checks), 6),
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
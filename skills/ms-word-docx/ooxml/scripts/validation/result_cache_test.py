@@ -0,0 +1,106 @@
+import itertools
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from validation.result_cache import XSDResultCache
+
+SCHEMA = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:include schemaLocation="types/{}"/>
+</xs:schema>"""
+
+INCLUDED_SCHEMA = '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"/>'
+
+
+# Currently not executed automatically in CI; run from ooxml/scripts with
+# python -m unittest validation.result_cache_test
+class TestXSDResultCache(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name) / "cache"
+        self.schema = Path(temp_dir.name) / "main.xsd"
+        self.schema.write_text(SCHEMA.format("types.xsd"))
+        self.included_schema = Path(temp_dir.name) / "types" / "types.xsd"
+        self.included_schema.parent.mkdir()
+        self.included_schema.write_text(INCLUDED_SCHEMA)
+
+    def open_cache(self, cache_class=XSDResultCache, **kwargs):
+        cache = cache_class(self.cache_dir, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_cached_errors_are_returned(self):
+        """Test a miss, then a hit from another cache instance"""
+        cache = self.open_cache()
+        self.assertIsNone(cache.get(self.schema, "part", True))
+        cache.put(self.schema, "part", True, {"error"})
+        cache.close()
+
+        cache = self.open_cache()
+        self.assertEqual(cache.get(self.schema, "part", True), {"error"})
+        self.assertIsNone(cache.get(self.schema, "part", False))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_included_schema_change_invalidates(self):
+        """Test that a newer XSD included by the schema makes results stale"""
+        cache = self.open_cache()
+        cache.put(self.schema, "part", True, set())
+        cache.close()
+
+        mtime = self.included_schema.stat().st_mtime + 10
+        os.utime(self.included_schema, (mtime, mtime))
+        self.assertIsNone(self.open_cache().get(self.schema, "part", True))
+
+    def test_format_version_change_invalidates(self):
+        """Test that results of another FORMAT_VERSION are not used"""
+
+        class NextVersionCache(XSDResultCache):
+            FORMAT_VERSION = XSDResultCache.FORMAT_VERSION + 1
+
+        cache = self.open_cache()
+        cache.put(self.schema, "part", True, set())
+        cache.close()
+
+        self.assertIsNone(
+            self.open_cache(NextVersionCache).get(self.schema, "part", True)
+        )
+
+    def test_old_cache_file_is_replaced(self):
+        """Test opening a cache file written with the previous table layout"""
+        self.cache_dir.mkdir()
+        conn = sqlite3.connect(self.cache_dir / XSDResultCache.FILENAME)
+        conn.execute(
+            "CREATE TABLE xsd_results (schema_path TEXT, schema_mtime REAL, "
+            "part_sha256 TEXT, cleaned INTEGER, errors TEXT, last_access REAL)"
+        )
+        conn.commit()
+        conn.close()
+
+        cache = self.open_cache()
+        self.assertIsNone(cache.get(self.schema, "part", True))
+        cache.put(self.schema, "part", True, set())
+        self.assertEqual(cache.get(self.schema, "part", True), set())
+
+    def test_hits_are_kept_by_eviction(self):
+        """Test that eviction keeps recently read results, written on close"""
+        cache = self.open_cache(max_entries=2)
+        with mock.patch("time.time", side_effect=itertools.count()):
+            cache.put(self.schema, "a", True, set())
+            cache.put(self.schema, "b", True, set())
+            cache.get(self.schema, "a", True)
+            cache.put(self.schema, "c", True, set())
+            cache.close()
+
+        cache = self.open_cache()
+        self.assertEqual(cache.get(self.schema, "a", True), set())
+        self.assertIsNone(cache.get(self.schema, "b", True))
+        self.assertEqual(cache.get(self.schema, "c", True), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
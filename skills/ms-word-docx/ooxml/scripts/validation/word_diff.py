@@ -0,0 +1,178 @@
+"""
+In-process word diff of document text in git's --word-diff=plain format.
+"""
+
+import bisect
+import collections
+import difflib
+import re
+
+# Words and single punctuation characters with their trailing whitespace, and
+# leading whitespace
+TOKEN_PATTERN = re.compile(r"\w+\s*|[^\w\s]\s*|\s+")
+
+# Changed token runs up to this many characters (old + new) are refined to a
+# character-level diff
+CHAR_DIFF_LIMIT = 200
+
+# Changed paragraphs reported before the rest are summarized
+MAX_HUNKS = 50
+
+
+def _mark(old, new):
+    """Format a changed span as [-old-]{+new+}."""
+    return (f"[-{old}-]" if old else "") + (f"{{+{new}+}}" if new else "")
+
+
+def _diff_spans(old, new, parts):
+    """Append a character-level diff of two short changed spans to parts."""
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            parts.append(old[i1:i2])
+        else:
+            parts.append(_mark(old[i1:i2], new[j1:j2]))
+
+
+def diff_paragraph(old, new):
+    """Diff two versions of a paragraph at word level, refining short changes to characters.
+
+    Returns:
+        str: The paragraph with removed text as [-...-] and added text as {+...+}
+    """
+    old_tokens = TOKEN_PATTERN.findall(old)
+    new_tokens = TOKEN_PATTERN.findall(new)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+
+    parts = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        old_span = "".join(old_tokens[i1:i2])
+        new_span = "".join(new_tokens[j1:j2])
+        if tag == "equal":
+            parts.append(old_span)
+        elif tag == "replace" and len(old_span) + len(new_span) <= CHAR_DIFF_LIMIT:
+            _diff_spans(old_span, new_span, parts)
+        else:
+            parts.append(_mark(old_span, new_span))
+    return "".join(parts)
+
+
+def _unique_anchors(original, modified):
+    """Get (i, j) pairs of paragraphs that occur exactly once in both texts, in order.
+
+    The pairs are the longest increasing run of such paragraphs (as in
+    patience diff), so they can be aligned without crossing.
+    """
+    original_counts = collections.Counter(original)
+    modified_counts = collections.Counter(modified)
+    modified_positions = {
+        line: j for j, line in enumerate(modified) if modified_counts[line] == 1
+    }
+    candidates = [
+        (i, modified_positions[line])
+        for i, line in enumerate(original)
+        if original_counts[line] == 1 and line in modified_positions
+    ]
+
+    # Longest increasing subsequence of j, with back-pointers
+    tails = []
+    tail_indexes = []
+    previous = [None] * len(candidates)
+    for k, (_, j) in enumerate(candidates):
+        pos = bisect.bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_indexes.append(k)
+        else:
+            tails[pos] = j
+            tail_indexes[pos] = k
+        previous[k] = tail_indexes[pos - 1] if pos else None
+
+    anchors = []
+    k = tail_indexes[-1] if tail_indexes else None
+    while k is not None:
+        anchors.append(candidates[k])
+        k = previous[k]
+    anchors.reverse()
+    return anchors
+
+
+def _align_paragraphs(original, modified):
+    """Yield difflib-style opcodes aligning two lists of paragraphs.
+
+    Paragraphs unique to both lists anchor the alignment, and only the gaps
+    between anchors are matched with difflib, which keeps large documents
+    with scattered changes fast.
+    """
+    i = j = 0
+    for anchor_i, anchor_j in _unique_anchors(original, modified) + [
+        (len(original), len(modified))
+    ]:
+        if i < anchor_i or j < anchor_j:
+            if i == anchor_i:
+                yield ("insert", i, i, j, anchor_j)
+            elif j == anchor_j:
+                yield ("delete", i, anchor_i, j, j)
+            else:
+                matcher = difflib.SequenceMatcher(
+                    None, original[i:anchor_i], modified[j:anchor_j], autojunk=False
+                )
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                    yield (tag, i + i1, i + i2, j + j1, j + j2)
+        i, j = anchor_i + 1, anchor_j + 1
+
+
+def word_diff(original_text, modified_text, max_hunks=MAX_HUNKS):
+    """Diff two texts paragraph by paragraph, showing only changed paragraphs.
+
+    Paragraphs (lines) are aligned by their content first, so only paragraphs
+    that actually changed are diffed at word and character level. Removed and
+    added paragraphs are shown whole.
+
+    Args:
+        original_text: Original text, one paragraph per line
+        modified_text: Modified text, one paragraph per line
+        max_hunks: Maximum number of changed paragraphs to show
+
+    Returns:
+        str: One line per changed paragraph, empty if the texts are equal
+    """
+    original = original_text.split("\n")
+    modified = modified_text.split("\n")
+
+    # Skip the unchanged start and end before aligning the rest
+    common = min(len(original), len(modified))
+    prefix = 0
+    while prefix < common and original[prefix] == modified[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < common - prefix and original[-1 - suffix] == modified[-1 - suffix]:
+        suffix += 1
+    original = original[prefix : len(original) - suffix]
+    modified = modified[prefix : len(modified) - suffix]
+
+    hunks = []
+    not_shown = 0
+    for tag, i1, i2, j1, j2 in _align_paragraphs(original, modified):
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        changes = [(original[i1 + k], modified[j1 + k]) for k in range(paired)]
+        changes.extend((line, "") for line in original[i1 + paired : i2] if line)
+        changes.extend(("", line) for line in modified[j1 + paired : j2] if line)
+        for old, new in changes:
+            # Paragraphs past the limit are only counted, not diffed
+            if len(hunks) == max_hunks:
+                not_shown += 1
+            elif old and new:
+                hunks.append(diff_paragraph(old, new))
+            else:
+                hunks.append(_mark(old, new))
+
+    if not_shown:
+        hunks.append(f"... {not_shown} more changed paragraphs not shown")
+    return "\n".join(hunks)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from validation import word_diff as word_diff_module
+from validation.word_diff import diff_paragraph, word_diff
+
+
+# Currently not executed automatically in CI; run from ooxml/scripts with
+# python -m unittest validation.word_diff_test
+class TestWordDiff(unittest.TestCase):
+    def test_equal_texts(self):
+        """Test that equal texts have no diff"""
+        self.assertEqual(word_diff("One\nTwo", "One\nTwo"), "")
+
+    def test_changed_paragraph(self):
+        """Test a changed word, refined to characters"""
+        self.assertEqual(
+            word_diff("One\nThe old text\nThree", "One\nThe new text\nThree"),
+            "The [-old-]{+new+} text",
+        )
+
+    def test_removed_and_added_paragraphs(self):
+        """Test that removed and added paragraphs are shown whole"""
+        self.assertEqual(word_diff("One\nTwo", "One"), "[-Two-]")
+        self.assertEqual(word_diff("One", "One\nTwo"), "{+Two+}")
+
+    def test_diff_paragraph_long_change(self):
+        """Test that long changed spans are not refined to characters"""
+        old = "x" * 150
+        new = "y" * 150
+        self.assertEqual(diff_paragraph(old, new), f"[-{old}-]{{+{new}+}}")
+
+    def test_hunks_past_the_limit_are_not_diffed(self):
+        """Test the limit on shown paragraphs and that the rest are only counted"""
+        original = "\n".join(f"Paragraph {i} text" for i in range(100))
+        modified = "\n".join(f"Paragraph {i} words" for i in range(100))
+        with mock.patch.object(
+            word_diff_module, "diff_paragraph", wraps=diff_paragraph
+        ) as diff:
+            lines = word_diff(original, modified, max_hunks=3).split("\n")
+
+        self.assertEqual(diff.call_count, 3)
+        self.assertEqual(
+            lines,
+            [
+                "Paragraph 0 [-text-]{+words+}",
+                "Paragraph 1 [-text-]{+words+}",
+                "Paragraph 2 [-text-]{+words+}",
+                "... 97 more changed paragraphs not shown",
+            ],
+        )
+
+    def test_empty_paragraphs_are_not_counted(self):
+        """Test that removed empty paragraphs are neither shown nor counted"""
+        self.assertEqual(
+            word_diff("One\n\n\nTwo\nThree", "Four", max_hunks=1),
+            "[-One-]{+Four+}\n... 2 more changed paragraphs not shown",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
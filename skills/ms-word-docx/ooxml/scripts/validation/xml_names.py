@@ -0,0 +1,96 @@
+"""
+Namespaces, Clark-notation names, precompiled XPath expressions and element
+queries shared by the validators.
+
+lxml reports element and attribute names in Clark notation ("{namespace}local"),
+so comparing them with these constants avoids building the names per element.
+"""
+
+import lxml.etree
+
+# Namespaces
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+P_NAMESPACE = "http://schemas.openxmlformats.org/presentationml/2006/main"
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+OFFICE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+# WordprocessingML elements and attributes
+P_TAG = f"{{{W_NAMESPACE}}}p"
+T_TAG = f"{{{W_NAMESPACE}}}t"
+DEL_TAG = f"{{{W_NAMESPACE}}}del"
+INS_TAG = f"{{{W_NAMESPACE}}}ins"
+DELTEXT_TAG = f"{{{W_NAMESPACE}}}delText"
+AUTHOR_ATTR = f"{{{W_NAMESPACE}}}author"
+PARA_ID_ATTR = f"{{{W14_NAMESPACE}}}paraId"
+XML_SPACE_ATTR = f"{{{XML_NAMESPACE}}}space"
+
+# Package and markup compatibility elements and attributes
+ALTERNATE_CONTENT_TAG = f"{{{MC_NAMESPACE}}}AlternateContent"
+IGNORABLE_ATTR = f"{{{MC_NAMESPACE}}}Ignorable"
+RELATIONSHIP_TAG = f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+R_ID_ATTR = f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+
+# Part names of the Override declarations and extensions of the Default
+# declarations in [Content_Types].xml
+CONTENT_TYPE_OVERRIDES_XPATH = lxml.etree.XPath(
+    "//ct:Override/@PartName", namespaces={"ct": CONTENT_TYPES_NAMESPACE}
+)
+CONTENT_TYPE_DEFAULTS_XPATH = lxml.etree.XPath(
+    "//ct:Default/@Extension", namespaces={"ct": CONTENT_TYPES_NAMESPACE}
+)
+
+# Clark-notation name -> local name, lowercased local name and namespace, filled
+# on first use
+_local_names = {}
+_lower_local_names = {}
+_namespaces = {}
+
+
+def claude_changes(root):
+    """Get all w:ins and w:del elements authored by Claude, in document order.
+
+    Equivalent to the XPath "//w:ins[@w:author='Claude'] |
+    //w:del[@w:author='Claude']", whose union libxml2 merges in quadratic
+    time (about 1s for 25k changes).
+    """
+    return [
+        elem
+        for elem in root.iter(INS_TAG, DEL_TAG)
+        if elem.get(AUTHOR_ATTR) == "Claude"
+    ]
+
+
+def local_name(name):
+    """Get the local part of a Clark-notation name ("{ns}sldId" -> "sldId")."""
+    local = _local_names.get(name)
+    if local is None:
+        local = _local_names[name] = name.rpartition("}")[2]
+    return local
+
+
+def namespace(name):
+    """Get the namespace of a Clark-notation name ("{ns}sldId" -> "ns", "id" -> "")."""
+    ns = _namespaces.get(name)
+    if ns is None:
+        ns = _namespaces[name] = name[1:].partition("}")[0] if name[0] == "{" else ""
+    return ns
+
+
+def lower_local_name(name):
+    """Get the lowercased local part of a Clark-notation name ("{ns}sldId" -> "sldid")."""
+    local = _lower_local_names.get(name)
+    if local is None:
+        local = _lower_local_names[name] = local_name(name).lower()
+    return local
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the XML editors used to edit unpacked Word documents.
+
+Usage:
+    python benchmark_editor.py lookups [--paragraphs 20000] [--lookups 200]
+    python benchmark_editor.py find [--paragraphs 20000] [--phrases 100]
+    python benchmark_editor.py comments [--paragraphs 20000] [--edits 300]
+    python benchmark_editor.py fragments [--comments 2000]
+
+lookups: Runs a simulated editing session on a synthetic document: --lookups
+get_node calls by attribute, line number and text, each followed by an
+insert_after, through XMLEditor's index and through a full DOM scan, and checks
+that both find the same elements.
+
+find: Finds --phrases phrases that span two runs ("Clause 12. The parties")
+with one get_node(contains=...) per phrase, as a full scan and through the
+index, and with a single DocxXMLEditor.find_text call, then checks that all
+three find the same paragraphs.
+
+comments: Adds --edits comments, replies and tracked deletions to a synthetic
+unpacked document, once through Document's methods and once through a
+Document.batch(), and checks that both produce the same comments.
+
+fragments: Parses the comment range and reference run fragments of --comments
+comments with XMLEditor's fragment cache and with a new cache per fragment (as
+parsing without templates), and checks that both give the same nodes.
+"""
+
+import argparse
+import collections
+import contextlib
+import html
+import io
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from utilities import XMLEditor, _FragmentCache
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+# The other parts of a minimal unpacked document for synthetic_package
+PACKAGE_PARTS = {
+    "[Content_Types].xml": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>
+""",
+    "_rels/.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>
+""",
+    "word/_rels/document.xml.rels": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>
+</Relationships>
+""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NAMESPACE}">
+  <w:defaultTabStop w:val="720"/>
+</w:settings>
+""",
+}
+
+# The fragments Document inserts into word/document.xml for a comment
+COMMENT_FRAGMENTS = [
+    '<w:commentRangeStart w:id="{id}"/>',
+    """<w:commentRangeEnd w:id="{id}"/>
+<w:r>
+  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
+  <w:commentReference w:id="{id}"/>
+</w:r>""",
+    """<w:r>
+  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
+  <w:commentReference w:id="{id}"/>
+</w:r>""",
+]
+
+
+def synthetic_document(paragraphs):
+    """Build a pretty-printed word/document.xml with numbered paragraphs of two runs each."""
+    body = "".join(
+        f"""
+    <w:p w14:paraId="{i:08X}" w14:textId="77777777" w:rsidR="00AB12CD" w:rsidRDefault="00AB12CD">
+      <w:pPr>
+        <w:pStyle w:val="BodyText"/>
+      </w:pPr>
+      <w:r>
+        <w:rPr>
+          <w:b/>
+        </w:rPr>
+        <w:t xml:space="preserve">Clause {i}. </w:t>
+      </w:r>
+      <w:r>
+        <w:t>The parties agree to the terms set out in paragraph {i} of this agreement.</w:t>
+      </w:r>
+    </w:p>"""
+        for i in range(paragraphs)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}" xmlns:w14="{W14_NAMESPACE}">
+  <w:body>{body}
+    <w:sectPr/>
+  </w:body>
+</w:document>
+"""
+
+
+def synthetic_package(path, paragraphs):
+    """Write an unpacked document with synthetic_document as word/document.xml."""
+    parts = dict(PACKAGE_PARTS, **{"word/document.xml": synthetic_document(paragraphs)})
+    for name, content in parts.items():
+        part = Path(path) / name
+        part.parent.mkdir(parents=True, exist_ok=True)
+        part.write_text(content, encoding="utf-8")
+
+
+def benchmark_lookups(args):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "document.xml"
+        path.write_text(synthetic_document(args.paragraphs), encoding="utf-8")
+        editor = XMLEditor(path)
+
+        # (kind, get_node filters) on paragraphs picked at random
+        queries = []
+        for _ in range(args.lookups):
+            paragraph = rng.randrange(args.paragraphs)
+            kind = rng.choice(["attrs", "line_number", "contains"])
+            if kind == "attrs":
+                filters = dict(tag="w:p", attrs={"w14:paraId": f"{paragraph:08X}"})
+            elif kind == "line_number":
+                filters = dict(tag="w:p", line_number=4 + 14 * paragraph)
+            else:
+                filters = dict(tag="w:p", contains=f"paragraph {paragraph} of")
+            queries.append((kind, filters))
+
+        scan_times = collections.Counter()
+        index_times = collections.Counter()
+        for kind, filters in queries:
+            start = time.perf_counter()
+            expected = editor._scan_for_nodes(
+                filters["tag"],
+                filters.get("attrs"),
+                filters.get("line_number"),
+                html.unescape(filters["contains"]) if "contains" in filters else None,
+            )
+            scan_times[kind] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            node = editor.get_node(**filters)
+            index_times[kind] += time.perf_counter() - start
+            if expected != [node]:
+                print(f"MISMATCH - get_node {filters} differs from a full scan")
+                return False
+
+            # Every lookup is followed by an edit, as in an editing session
+            editor.insert_after(node, "<w:p><w:r><w:t>Inserted</w:t></w:r></w:p>")
+
+    counts = collections.Counter(kind for kind, _ in queries)
+    print(
+        f"{args.paragraphs} paragraphs, {args.lookups} lookups each followed by an "
+        "edit (the first indexed lookup of each kind builds its table)"
+    )
+    print(f"{'Lookup':<14} {'Count':>6} {'Scan ms':>10} {'Index ms':>10} {'Speedup':>8}")
+    for kind, count in counts.items():
+        scan_ms = scan_times[kind] / count * 1000
+        index_ms = index_times[kind] / count * 1000
+        print(
+            f"{kind:<14} {count:>6} {scan_ms:>10.3f} {index_ms:>10.3f} "
+            f"{scan_ms / index_ms if index_ms else 0:>7.1f}x"
+        )
+    return True
+
+
+def benchmark_find(args):
+    # document.py imports the scripts package from the skill root
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from scripts.document import DocxXMLEditor
+
+    rng = random.Random(0)
+    paragraphs = rng.sample(range(args.paragraphs), args.phrases)
+    phrases = [f"Clause {paragraph}. The parties" for paragraph in paragraphs]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "document.xml"
+        path.write_text(synthetic_document(args.paragraphs), encoding="utf-8")
+        editor = DocxXMLEditor(path, rsid="00AB12CD")
+
+        start = time.perf_counter()
+        scanned = [
+            editor._scan_for_nodes("w:p", None, None, phrase)[0] for phrase in phrases
+        ]
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        looked_up = [editor.get_node(tag="w:p", contains=phrase) for phrase in phrases]
+        index_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pattern = "|".join(re.escape(phrase) for phrase in phrases)
+        matches = editor.find_text(pattern, regex=True)
+        find_time = time.perf_counter() - start
+
+    found = {match.paragraph for match in matches}
+    if set(scanned) != set(looked_up) or set(scanned) != found:
+        print("MISMATCH - find_text and get_node found different paragraphs")
+        return False
+
+    spans = sum(len(match.spans) for match in matches)
+    print(
+        f"{args.paragraphs} paragraphs, {args.phrases} phrases spanning two runs "
+        f"({spans} run spans found)"
+    )
+    print(f"{'Method':<32} {'Total s':>9}")
+    print(f"{'get_node per phrase (scan)':<32} {scan_time:>9.3f}")
+    print(f"{'get_node per phrase (index)':<32} {index_time:>9.3f}")
+    print(f"{'find_text, one call':<32} {find_time:>9.3f}")
+    return True
+
+
+def benchmark_comments(args):
+    # document.py imports the scripts package from the skill root
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from scripts.document import Document
+
+    # Every third edit is a comment on a paragraph, followed by a reply to it
+    # and a tracked deletion of the paragraph's second run
+    paragraphs = random.Random(0).sample(range(args.paragraphs), args.edits // 3)
+
+    def edit(editor, add_comment, reply_to_comment, suggest_deletion):
+        for paragraph in paragraphs:
+            elem = editor.get_node(tag="w:p", attrs={"w14:paraId": f"{paragraph:08X}"})
+            comment_id = add_comment(
+                start=elem, end=elem, text=f"Check clause {paragraph}"
+            )
+            reply_to_comment(
+                parent_comment_id=comment_id, text=f"Clause {paragraph} checked"
+            )
+            suggest_deletion(elem.getElementsByTagName("w:r")[1])
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        synthetic_package(temp_dir, args.paragraphs)
+        for mode in ("immediate", "batch"):
+            # Document prints the RSID it uses
+            with contextlib.redirect_stdout(io.StringIO()):
+                document = Document(temp_dir, rsid="00AB12CD")
+            editor = document["word/document.xml"]
+
+            start = time.perf_counter()
+            if mode == "immediate":
+                edit(
+                    editor,
+                    document.add_comment,
+                    document.reply_to_comment,
+                    editor.suggest_deletion,
+                )
+            else:
+                with document.batch() as batch:
+                    edit(
+                        editor,
+                        batch.add_comment,
+                        batch.reply_to_comment,
+                        batch.suggest_deletion,
+                    )
+            results[mode] = time.perf_counter() - start
+
+            comments = document["word/comments.xml"].dom.getElementsByTagName(
+                "w:comment"
+            )
+            results[f"{mode} comments"] = [
+                (elem.getAttribute("w:id"), t.firstChild.data)
+                for elem in comments
+                for t in elem.getElementsByTagName("w:t")
+            ]
+
+    if results["immediate comments"] != results["batch comments"]:
+        print("MISMATCH - the batch added different comments")
+        return False
+
+    print(
+        f"{args.paragraphs} paragraphs, {len(paragraphs)} comments with a reply and "
+        "a tracked deletion each"
+    )
+    print(f"{'Mode':<32} {'Total s':>9}")
+    print(f"{'Document methods, one by one':<32} {results['immediate']:>9.3f}")
+    print(f"{'Document.batch(), one commit':<32} {results['batch']:>9.3f}")
+    return True
+
+
+def benchmark_fragments(args):
+    fragments = [
+        fragment.format(id=comment_id)
+        for comment_id in range(args.comments)
+        for fragment in COMMENT_FRAGMENTS
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "document.xml"
+        path.write_text(synthetic_document(10), encoding="utf-8")
+        editor = XMLEditor(path)
+
+        start = time.perf_counter()
+        parsed = [
+            _FragmentCache(editor.dom).parse(fragment) for fragment in fragments
+        ]
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = [editor._parse_fragment(fragment) for fragment in fragments]
+        cache_time = time.perf_counter() - start
+
+    for parsed_nodes, cached_nodes in zip(parsed, cached):
+        if [node.toxml() for node in parsed_nodes] != [
+            node.toxml() for node in cached_nodes
+        ]:
+            print("MISMATCH - cached and parsed fragments differ")
+            return False
+
+    count = len(fragments)
+    print(f"{count} fragments ({args.comments} comments' ranges and reference runs)")
+    print(f"{'Method':<32} {'Total s':>9} {'Per fragment us':>16}")
+    print(
+        f"{'Parse every fragment':<32} {parse_time:>9.3f} "
+        f"{parse_time / count * 1e6:>16.1f}"
+    )
+    print(
+        f"{'Fragment cache':<32} {cache_time:>9.3f} "
+        f"{cache_time / count * 1e6:>16.1f}"
+    )
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the XML editors")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    lookups = subparsers.add_parser(
+        "lookups", help="Compare indexed get_node with a full scan while editing"
+    )
+    lookups.add_argument(
+        "--paragraphs", type=int, default=20000, help="Paragraphs in the document"
+    )
+    lookups.add_argument(
+        "--lookups", type=int, default=200, help="get_node calls in the session"
+    )
+    lookups.set_defaults(run=benchmark_lookups)
+
+    find = subparsers.add_parser(
+        "find", help="Compare find_text with one get_node per phrase"
+    )
+    find.add_argument(
+        "--paragraphs", type=int, default=20000, help="Paragraphs in the document"
+    )
+    find.add_argument("--phrases", type=int, default=100, help="Phrases to find")
+    find.set_defaults(run=benchmark_find)
+
+    comments = subparsers.add_parser(
+        "comments", help="Compare Document.batch() with adding comments one by one"
+    )
+    comments.add_argument(
+        "--paragraphs", type=int, default=20000, help="Paragraphs in the document"
+    )
+    comments.add_argument(
+        "--edits",
+        type=int,
+        default=300,
+        help="Comments, replies and deletions in total",
+    )
+    comments.set_defaults(run=benchmark_comments)
+
+    fragments = subparsers.add_parser(
+        "fragments", help="Compare cached fragment parsing with parsing every fragment"
+    )
+    fragments.add_argument(
+        "--comments", type=int, default=2000, help="Comments to parse fragments for"
+    )
+    fragments.set_defaults(run=benchmark_fragments)
+
+    args = parser.parse_args()
+    sys.exit(0 if args.run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
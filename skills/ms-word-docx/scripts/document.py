@@ -17,6 +17,11 @@ Usage:
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
 
+    # Queue many edits and apply them together
+    with doc.batch() as batch:
+        comment_id = batch.add_comment(start=node, end=node, text="Comment text")
+        batch.reply_to_comment(parent_comment_id=comment_id, text="Reply text")
+
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
@@ -26,23 +31,39 @@ Usage:
     doc.save()
 """
 
+import bisect
+import collections
 import html
 import random
+import re
 import shutil
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.assemble_ooxml import assemble_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import XMLEditor, edits_dom
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# A match of DocxXMLEditor.find_text: the w:p element, the match's offsets in
+# the paragraph text, the matched text and its TextSpans in document order
+TextMatch = collections.namedtuple("TextMatch", "paragraph start end text spans")
+
+# The part of a match inside one w:t: its w:r, the w:t and the match's offsets
+# in the w:t's text
+TextSpan = collections.namedtuple("TextSpan", "run t start end")
+
+# A comment being added: its w:id, the w14:paraId of its paragraph, its
+# w16cid:durableId, its text and the w14:paraId of the comment it replies to
+_Comment = collections.namedtuple(
+    "_Comment", "comment_id para_id durable_id text parent_para_id"
+)
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -52,8 +73,15 @@ class DocxXMLEditor(XMLEditor):
     - w:author and w:date (for w:ins, w:del, w:comment elements)
     - w:id (for w:ins and w:del elements)
 
+    Also records which paragraphs (by w14:paraId) its edits touched, so that
+    redlining validation can compare only those paragraphs with the original.
+
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+        dirty_para_ids (set or None): w14:paraIds of paragraphs whose text may
+            have changed, or None once an edit touched a paragraph without a
+            paraId or dom was edited directly, so that the whole document is
+            compared.
     """
 
     def __init__(
@@ -71,9 +99,142 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._dirty_para_ids = set()
+        self._text_index = None
+        # Next tracked change ID while a DocumentBatch commits, else None
+        self._next_change_id = None
+
+    @property
+    def dirty_para_ids(self):
+        """w14:paraIds of the edited paragraphs, or None to compare all of them."""
+        self._drop_stale_indexes()
+        return self._dirty_para_ids
+
+    def mark_dirty(self, node):
+        """Record the paragraphs whose text can change when a node is edited.
+
+        These are the paragraphs containing the node and the paragraphs inside
+        it. Editing methods call this themselves. Edits made through dom
+        directly need no call: they are detected and make redlining validation
+        compare the whole document. Also updates the lookup index of get_node
+        for the node (see invalidate_index()).
+
+        Args:
+            node: Edited DOM node
+        """
+        self.invalidate_index(node)
+        if self._dirty_para_ids is None:
+            return
+
+        paragraphs = []
+        if node.nodeType == node.ELEMENT_NODE:
+            paragraphs.extend(node.getElementsByTagName("w:p"))
+        else:
+            node = node.parentNode
+        while node is not None and node.nodeType == node.ELEMENT_NODE:
+            if node.tagName == "w:p":
+                paragraphs.append(node)
+            node = node.parentNode
+
+        for para in paragraphs:
+            para_id = para.getAttribute("w14:paraId")
+            if not para_id:
+                # Edits can no longer be scoped to paragraphs
+                self._dirty_para_ids = None
+                return
+            self._dirty_para_ids.add(para_id)
+
+    def _mark_nodes_dirty(self, nodes):
+        """Record the paragraphs touched by newly inserted nodes."""
+        for node in nodes:
+            self.mark_dirty(node)
+
+    def invalidate_index(self, node):
+        """Update the lookup index of get_node and the text index of find_text."""
+        super().invalidate_index(node)
+        if self._text_index is not None:
+            self._text_index.invalidate(node)
+
+    def _drop_stale_indexes(self):
+        """Also stop recording edited paragraphs if dom was edited directly."""
+        if self._dom_watch.changed():
+            self._dirty_para_ids = None
+        super()._drop_stale_indexes()
+
+    def _drop_indexes(self):
+        """Drop the lookup index of get_node and the text index of find_text."""
+        super()._drop_indexes()
+        self._text_index = None
+
+    def find_text(self, pattern, regex=False):
+        """Find text in every paragraph, including text split across runs.
+
+        Searches the text of each w:p (its w:t elements concatenated, without
+        deleted text) and maps every match back to the runs it spans. The
+        paragraph texts are indexed on the first call and only re-read for
+        paragraphs edited since, so marking up many matches takes one search
+        instead of a get_node scan per match.
+
+        Args:
+            pattern: Text to find, or a regular expression if regex is True
+                (a compiled pattern is also accepted)
+            regex: If True, pattern is a regular expression
+
+        Returns:
+            list[TextMatch]: Non-empty matches in document order, each with the
+                TextSpans (w:r, w:t, start, end) it covers
+
+        Example:
+            for match in editor.find_text("30 days"):
+                first_run = match.spans[0].run
+            for match in editor.find_text(r"Section \d+\.\d+", regex=True):
+                print(match.text, [span.t for span in match.spans])
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern if regex else re.escape(pattern))
+        self._drop_stale_indexes()
+        if self._text_index is None:
+            self._text_index = _ParagraphTextIndex(self.dom)
+            self._dom_watch.reset()
+
+        matches = []
+        for paragraph in self._text_index.paragraphs():
+            text, starts, t_elems = self._text_index.text(paragraph)
+            for match in pattern.finditer(text):
+                if not self._text_index.is_attached(paragraph):
+                    # Removed through dom without invalidate_index()
+                    break
+                start, end = match.span()
+                if start == end:
+                    continue
+                spans = []
+                i = bisect.bisect_right(starts, start) - 1
+                while i < len(t_elems) and starts[i] < end:
+                    t_start = starts[i]
+                    t_end = starts[i + 1] if i + 1 < len(starts) else len(text)
+                    if t_end > start:
+                        spans.append(
+                            TextSpan(
+                                t_elems[i].parentNode,
+                                t_elems[i],
+                                max(start, t_start) - t_start,
+                                min(end, t_end) - t_start,
+                            )
+                        )
+                    i += 1
+                matches.append(TextMatch(paragraph, start, end, match.group(), spans))
+        return matches
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
+        """Get the next available change ID by checking all tracked change elements.
+
+        While a DocumentBatch commits, IDs are counted on from a single check.
+        """
+        if self._next_change_id is not None:
+            change_id = self._next_change_id
+            self._next_change_id += 1
+            return change_id
+
         max_id = -1
         for tag in ("w:ins", "w:del"):
             elements = self.dom.getElementsByTagName(tag)
@@ -237,30 +398,40 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
+    @edits_dom
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
+        self.mark_dirty(elem)
         nodes = super().replace_node(elem, new_content)
         self._inject_attributes_to_nodes(nodes)
+        self._mark_nodes_dirty(nodes)
         return nodes
 
+    @edits_dom
     def insert_after(self, elem, xml_content):
         """Insert after with automatic attribute injection."""
         nodes = super().insert_after(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
+        self._mark_nodes_dirty(nodes)
         return nodes
 
+    @edits_dom
     def insert_before(self, elem, xml_content):
         """Insert before with automatic attribute injection."""
         nodes = super().insert_before(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
+        self._mark_nodes_dirty(nodes)
         return nodes
 
+    @edits_dom
     def append_to(self, elem, xml_content):
         """Append to with automatic attribute injection."""
         nodes = super().append_to(elem, xml_content)
         self._inject_attributes_to_nodes(nodes)
+        self._mark_nodes_dirty(nodes)
         return nodes
 
+    @edits_dom
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -304,6 +475,7 @@ class DocxXMLEditor(XMLEditor):
             runs = list(ins_elem.getElementsByTagName("w:r"))
             if not runs:
                 continue
+            self.mark_dirty(ins_elem)
 
             # Create deletion wrapper
             del_wrapper = self.dom.createElement("w:del")
@@ -339,6 +511,7 @@ class DocxXMLEditor(XMLEditor):
 
         return [elem]
 
+    @edits_dom
     def revert_deletion(self, elem):
         """Reject a deletion by re-inserting the deleted content.
 
@@ -479,6 +652,7 @@ class DocxXMLEditor(XMLEditor):
 
         return para.toxml()
 
+    @edits_dom
     def suggest_deletion(self, elem):
         """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
 
@@ -499,6 +673,7 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+            self.mark_dirty(elem)
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -535,6 +710,7 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing tracked changes
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
+            self.mark_dirty(elem)
 
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
@@ -593,6 +769,111 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class _ParagraphTextIndex:
+    """Text of every w:p with the offset of each of its w:t elements.
+
+    Paragraph texts are read on first use. Edited nodes are queued by
+    invalidate() and, before the next search, the paragraphs containing them
+    or inside them are re-read; the paragraph list itself is rebuilt only
+    when paragraphs were inserted or removed.
+    """
+
+    def __init__(self, dom):
+        self._dom = dom
+        # w:p elements in document order, or None to rebuild
+        self._paragraphs = None
+        self._known_paragraphs = set()
+        # w:p -> (text, start offset of each w:t, w:t elements)
+        self._texts = {}
+        # Edited nodes not processed yet -> None
+        self._pending = {}
+
+    def invalidate(self, node):
+        """Queue an inserted, changed or (about to be) removed node."""
+        # Paragraphs around the node are forgotten now, in case it is removed
+        self._drop_paragraphs_of(node)
+        self._pending[node] = None
+
+    def paragraphs(self):
+        """Get the w:p elements in document order."""
+        pending, self._pending = self._pending, {}
+        for node in pending:
+            self._drop_paragraphs_of(node)
+            if self._paragraphs is None or node.nodeType != node.ELEMENT_NODE:
+                continue
+            paragraphs = node.getElementsByTagName("w:p")
+            if node.tagName == "w:p":
+                paragraphs.append(node)
+            # Rebuild if a paragraph was inserted or removed
+            if any(
+                (paragraph in self._known_paragraphs) != self.is_attached(paragraph)
+                for paragraph in paragraphs
+            ):
+                self._paragraphs = None
+        if self._paragraphs is None:
+            self._paragraphs = self._dom.getElementsByTagName("w:p")
+            self._known_paragraphs = set(self._paragraphs)
+        return self._paragraphs
+
+    def is_attached(self, node):
+        """Check if a node is still in the document."""
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self._dom
+
+    def text(self, paragraph):
+        """Get (text, start offsets, w:t elements) of a paragraph, cached."""
+        entry = self._texts.get(paragraph)
+        if entry is None:
+            parts = []
+            starts = []
+            t_elems = []
+            offset = 0
+            for t_elem in _own_text_elements(paragraph):
+                t_text = "".join(
+                    child.data
+                    for child in t_elem.childNodes
+                    if child.nodeType == child.TEXT_NODE
+                )
+                parts.append(t_text)
+                starts.append(offset)
+                t_elems.append(t_elem)
+                offset += len(t_text)
+            entry = self._texts[paragraph] = ("".join(parts), starts, t_elems)
+        return entry
+
+    def _drop_paragraphs_of(self, node):
+        """Forget the text of the paragraphs containing a node or inside it."""
+        if node.nodeType == node.ELEMENT_NODE:
+            for paragraph in node.getElementsByTagName("w:p"):
+                self._texts.pop(paragraph, None)
+        else:
+            node = node.parentNode
+        while node is not None and node.nodeType == node.ELEMENT_NODE:
+            if node.tagName == "w:p":
+                self._texts.pop(node, None)
+            node = node.parentNode
+
+
+def _own_text_elements(paragraph):
+    """Get the w:t elements of a paragraph in document order, skipping nested paragraphs.
+
+    Paragraphs can contain other paragraphs (e.g. in text boxes), whose text
+    belongs to them only.
+    """
+    t_elems = []
+    stack = list(reversed(paragraph.childNodes))
+    while stack:
+        node = stack.pop()
+        if node.nodeType != node.ELEMENT_NODE or node.tagName == "w:p":
+            continue
+        if node.tagName == "w:t":
+            t_elems.append(node)
+        else:
+            stack.extend(reversed(node.childNodes))
+    return t_elems
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -641,9 +922,9 @@ class Document:
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
         shutil.copytree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        # Assemble original directory into temporary .docx for validation baseline (outside unpacked dir)
         self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        assemble_document(self.original_path, self.original_docx, validate=False)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -727,40 +1008,18 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        comment = self._new_comment(text)
 
         # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        self._insert_comment_ranges(comment.comment_id, start, end)
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        # Add to comments.xml, commentsExtended.xml, commentsIds.xml and
+        # commentsExtensible.xml immediately
+        self._add_comment_entries([comment])
 
         # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
-        return comment_id
+        self._register_comment(comment)
+        return comment.comment_id
 
     def reply_to_comment(
         self,
@@ -780,55 +1039,43 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
-            raise ValueError(f"Parent comment with id={parent_comment_id} not found")
-
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        comment = self._new_comment(text, parent_comment_id)
 
         # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
-        )
+        self._insert_reply_ranges(comment.comment_id, parent_comment_id)
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
-        )
+        # Add to comments.xml, commentsExtended.xml (with parent), commentsIds.xml
+        # and commentsExtensible.xml immediately
+        self._add_comment_entries([comment])
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        # Update existing_comments so replies work
+        self._register_comment(comment)
+        return comment.comment_id
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+    def batch(self, validate=False) -> "DocumentBatch":
+        """
+        Start a batch of comments, replies and deletions that are applied together.
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Edits queued on the batch are applied by its commit() in one ordered
+        pass over document.xml, new comments are added to each comments part
+        with a single append, and the document is validated at most once, at
+        the end. Used as a context manager, the batch commits when the block
+        ends and is discarded if the block raises.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Args:
+            validate: If True, commit() writes the parts and validates the
+                document once all edits are applied (default: False)
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Returns:
+            DocumentBatch: The batch to queue edits on
 
-        self.next_comment_id += 1
-        return comment_id
+        Example:
+            with doc.batch() as batch:
+                comment_id = batch.add_comment(start=node, end=node, text="Check")
+                batch.reply_to_comment(parent_comment_id=comment_id, text="Done")
+                batch.suggest_deletion(run)
+        """
+        return DocumentBatch(self, validate=validate)
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
@@ -842,12 +1089,22 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
+        # Create validators with current state. Only parts opened through an
+        # editor can differ from the original, so the rest are served from the
+        # validators' shared per-part results.
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            changed_parts=self._editors.keys(),
         )
+        # Only the paragraphs edited through the document.xml editor are
+        # compared, unless its dom was also edited directly
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            dirty_para_ids=self._document.dirty_para_ids,
         )
 
         # Run validations
@@ -866,14 +1123,7 @@ class Document:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
-
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        self._write_parts()
 
         # Validate by default
         if validate:
@@ -883,6 +1133,17 @@ class Document:
         target_path = Path(destination) if destination else self.original_path
         shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
 
+    def _write_parts(self):
+        """Write all modified XML files to the temporary directory."""
+        # Only ensure comment relationships and content types if comment files exist
+        if self.comments_path.exists():
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
+
+        # Save all modified XML files in temp directory
+        for editor in self._editors.values():
+            editor.save()
+
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
@@ -1063,33 +1324,126 @@ class Document:
                 rsid_xml = f'<{prefix}:rsid {prefix}:val="{self.rsid}"/>'
                 editor.append_to(rsids_elem, rsid_xml)
 
+    # ==================== Private: Comments ====================
+
+    def _new_comment(self, text, parent_comment_id=None):
+        """Take the next comment ID and generate the IDs of a new comment."""
+        parent_para_id = None
+        if parent_comment_id is not None:
+            if parent_comment_id not in self.existing_comments:
+                raise ValueError(
+                    f"Parent comment with id={parent_comment_id} not found"
+                )
+            parent_para_id = self.existing_comments[parent_comment_id]["para_id"]
+
+        return _Comment(
+            comment_id=self.next_comment_id,
+            para_id=_generate_hex_id(),
+            durable_id=_generate_hex_id(),
+            text=text,
+            parent_para_id=parent_para_id,
+        )
+
+    def _register_comment(self, comment):
+        """Record a new comment so that replies can refer to it."""
+        self.existing_comments[comment.comment_id] = {"para_id": comment.para_id}
+        self.next_comment_id = max(self.next_comment_id, comment.comment_id + 1)
+
+    def _insert_comment_ranges(self, comment_id, start, end):
+        """Insert the range of a comment into document.xml.
+
+        Returns:
+            tuple: The inserted w:commentRangeStart and reference run (w:r)
+        """
+        range_start = self._document.insert_before(
+            start, self._comment_range_start_xml(comment_id)
+        )
+
+        # If end node is a paragraph, append comment markup inside it
+        # Otherwise insert after it (for run-level anchors)
+        if end.tagName == "w:p":
+            range_end = self._document.append_to(
+                end, self._comment_range_end_xml(comment_id)
+            )
+        else:
+            range_end = self._document.insert_after(
+                end, self._comment_range_end_xml(comment_id)
+            )
+
+        # The reference run is the last node of the range end fragment
+        return range_start[0], range_end[-1]
+
+    def _insert_reply_ranges(self, comment_id, parent_comment_id, anchors=None):
+        """Insert the range of a reply into document.xml, inside its parent's.
+
+        Args:
+            comment_id: w:id of the reply
+            parent_comment_id: w:id of the comment replied to
+            anchors: Optional dict of comment ID -> (w:commentRangeStart,
+                reference run) for comments whose ranges were just inserted;
+                other parents are looked up with get_node
+
+        Returns:
+            tuple: The inserted w:commentRangeStart and reference run (w:r)
+        """
+        if anchors is not None and parent_comment_id in anchors:
+            parent_start_elem, parent_ref_run = anchors[parent_comment_id]
+        else:
+            parent_start_elem = self._document.get_node(
+                tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
+            )
+            parent_ref_elem = self._document.get_node(
+                tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+            )
+            parent_ref_run = parent_ref_elem.parentNode
+
+        range_start = self._document.insert_after(
+            parent_start_elem, self._comment_range_start_xml(comment_id)
+        )
+        self._document.insert_after(
+            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
+        )
+        ref_run = self._document.insert_after(
+            parent_ref_run, self._comment_ref_run_xml(comment_id)
+        )
+        return range_start[0], ref_run[0]
+
+    def _add_comment_entries(self, comments):
+        """Add comments to every comments part, with one append per part."""
+        self._add_to_comments_xml(comments)
+        self._add_to_comments_extended_xml(comments)
+        self._add_to_comments_ids_xml(comments)
+        self._add_to_comments_extensible_xml(comments)
+
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_to_comments_xml(self, comments):
+        """Add comments to comments.xml."""
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
+        comments_xml = []
+        for comment in comments:
+            escaped_text = (
+                comment.text.replace("&", "&amp;")
+                .replace("<", "&lt;")
+                .replace(">", "&gt;")
+            )
+            # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
+            # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
+            comments_xml.append(f'''<w:comment w:id="{comment.comment_id}">
+  <w:p w14:paraId="{comment.para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+</w:comment>''')
+        editor.append_to(root, "".join(comments_xml))
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, comments):
+        """Add comments to commentsExtended.xml."""
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
@@ -1098,25 +1452,31 @@ class Document:
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        comments_xml = []
+        for comment in comments:
+            if comment.parent_para_id:
+                xml = f'<w15:commentEx w15:paraId="{comment.para_id}" w15:paraIdParent="{comment.parent_para_id}" w15:done="0"/>'
+            else:
+                xml = f'<w15:commentEx w15:paraId="{comment.para_id}" w15:done="0"/>'
+            comments_xml.append(xml)
+        editor.append_to(root, "".join(comments_xml))
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+    def _add_to_comments_ids_xml(self, comments):
+        """Add comments to commentsIds.xml."""
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{comment.para_id}" w16cid:durableId="{comment.durable_id}"/>'
+            for comment in comments
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, comments):
+        """Add comments to commentsExtensible.xml."""
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
@@ -1125,7 +1485,10 @@ class Document:
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{comment.durable_id}"/>'
+            for comment in comments
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -1274,3 +1637,171 @@ class Document:
                 f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
             )
             editor.append_to(root, override_xml)
+
+
+class DocumentBatch:
+    """Comments, replies and deletions queued on a Document and applied together.
+
+    Created by Document.batch(). Comment IDs are taken when an edit is queued,
+    so replies can be queued to comments of the same batch. commit() applies
+    the edits to document.xml in the order they were queued, with tracked
+    change IDs counted on from a single check of the part and replies anchored
+    to the ranges inserted for their parents, then adds all new comments to
+    each comments part with one append.
+
+    Attributes:
+        document (Document): The document the edits are applied to
+        validate (bool): Whether commit() validates the document
+    """
+
+    def __init__(self, document, validate=False):
+        """Initialize an empty batch (use Document.batch()).
+
+        Args:
+            document: Document to apply the edits to
+            validate: If True, commit() validates the document (default: False)
+        """
+        self.document = document
+        self.validate = validate
+        # (kind, _Comment or None, target) in the order queued
+        self._edits = []
+        # First comment ID the batch can take, given back by discard()
+        self._first_comment_id = document.next_comment_id
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def add_comment(self, start, end, text: str) -> int:
+        """
+        Queue a comment spanning from one element to another.
+
+        Args:
+            start: DOM element for the starting point
+            end: DOM element for the ending point
+            text: Comment content
+
+        Returns:
+            The comment ID that commit() creates
+        """
+        comment = self._queue_comment(text)
+        self._edits.append(("comment", comment, (start, end)))
+        return comment.comment_id
+
+    def reply_to_comment(self, parent_comment_id: int, text: str) -> int:
+        """
+        Queue a reply to an existing comment or to a comment queued earlier.
+
+        Args:
+            parent_comment_id: The w:id of the parent comment to reply to
+            text: Reply text
+
+        Returns:
+            The comment ID that commit() creates for the reply
+        """
+        comment = self._queue_comment(text, parent_comment_id)
+        self._edits.append(("reply", comment, parent_comment_id))
+        return comment.comment_id
+
+    def suggest_deletion(self, elem):
+        """
+        Queue marking a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion().
+
+        Args:
+            elem: A w:r or w:p DOM element of document.xml
+        """
+        self._check_open()
+        if elem.nodeName not in ("w:r", "w:p"):
+            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+        self._edits.append(("deletion", None, elem))
+
+    def commit(self) -> None:
+        """
+        Apply the queued edits and, if enabled, validate the document once.
+
+        If an edit fails, the edits before it stay applied and their comments
+        are still added; the comments queued after it are dropped.
+
+        Raises:
+            ValueError: If an edit is invalid or validation fails
+        """
+        self._check_open()
+        self._closed = True
+
+        document = self.document
+        editor = document._document
+        # Comment ID -> (w:commentRangeStart, reference run) inserted so far
+        anchors = {}
+        applied = []
+        editor._next_change_id = editor._get_next_change_id()
+        try:
+            for kind, comment, target in self._edits:
+                if kind == "deletion":
+                    editor.suggest_deletion(target)
+                    continue
+                if kind == "comment":
+                    anchors[comment.comment_id] = document._insert_comment_ranges(
+                        comment.comment_id, *target
+                    )
+                else:
+                    anchors[comment.comment_id] = document._insert_reply_ranges(
+                        comment.comment_id, target, anchors
+                    )
+                applied.append(comment)
+        finally:
+            editor._next_change_id = None
+            if applied:
+                document._add_comment_entries(applied)
+            self._forget_comments(applied)
+
+        if self.validate:
+            document._write_parts()
+            document.validate()
+
+    def discard(self) -> None:
+        """Drop the queued edits without applying them, giving back their comment IDs."""
+        self._check_open()
+        self._closed = True
+        self._forget_comments([])
+
+    def _queue_comment(self, text, parent_comment_id=None):
+        """Take the ID of a queued comment and record it for replies."""
+        self._check_open()
+        comment = self.document._new_comment(text, parent_comment_id)
+        self.document._register_comment(comment)
+        return comment
+
+    def _forget_comments(self, kept):
+        """Remove the queued comments not in kept from the document's comments.
+
+        Their IDs are given back, unless the document took a later ID for
+        another comment, so dropped comments leave no gap in comment IDs.
+        """
+        document = self.document
+        kept_ids = {comment.comment_id for comment in kept}
+        for _, comment, _ in self._edits:
+            if comment is not None and comment.comment_id not in kept_ids:
+                document.existing_comments.pop(comment.comment_id, None)
+        self._edits = []
+
+        later_ids = [
+            comment_id
+            for comment_id in document.existing_comments
+            if comment_id >= self._first_comment_id
+        ]
+        document.next_comment_id = (
+            max(later_ids, default=self._first_comment_id - 1) + 1
+        )
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("Batch has already been committed or discarded")
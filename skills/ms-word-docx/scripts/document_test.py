@@ -0,0 +1,202 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.document import Document
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+PARAGRAPH = (
+    '<w:p w14:paraId="{:08X}" w:rsidR="00AB12CD"><w:r>'
+    '<w:t xml:space="preserve">Paragraph {} </w:t></w:r><w:r><w:t>text</w:t></w:r></w:p>'
+)
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+        "</Relationships>"
+    ),
+    "word/settings.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:settings xmlns:w="{W_NAMESPACE}"><w:compat/></w:settings>'
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NAMESPACE}" '
+        'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">'
+        "<w:body>{}<w:sectPr/></w:body></w:document>"
+    ),
+}
+
+
+def write_package(directory, paragraphs=4):
+    """Write a minimal unpacked document with numbered paragraphs."""
+    body = "".join(PARAGRAPH.format(i + 1, i) for i in range(paragraphs))
+    for name, content in PARTS.items():
+        path = Path(directory) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if name == "word/document.xml":
+            content = content.format(body)
+        path.write_text(content, encoding="utf-8")
+
+
+# Currently not executed automatically in CI; run from the skill root with
+# python -m unittest scripts.document_test
+class DocumentTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        write_package(temp_dir.name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.doc = Document(temp_dir.name, rsid="00112233")
+        self.editor = self.doc["word/document.xml"]
+
+    def paragraph(self, number):
+        return self.editor.get_node(tag="w:p", attrs={"w14:paraId": f"{number:08X}"})
+
+    def comment_ids(self):
+        """Get the IDs of the comments in comments.xml, in document order."""
+        if not self.doc.comments_path.exists():
+            return []
+        comments = self.doc["word/comments.xml"].dom.getElementsByTagName("w:comment")
+        return [int(comment.getAttribute("w:id")) for comment in comments]
+
+
+class TestDocumentBatch(DocumentTestCase):
+    def test_commit_applies_queued_edits(self):
+        """Test that edits are applied on commit only, in the order queued"""
+        paragraph = self.paragraph(1)
+        run = self.paragraph(2).getElementsByTagName("w:r")[1]
+
+        batch = self.doc.batch()
+        comment_id = batch.add_comment(start=paragraph, end=paragraph, text="Check")
+        reply_id = batch.reply_to_comment(parent_comment_id=comment_id, text="Done")
+        batch.suggest_deletion(run)
+        self.assertEqual(self.editor.dom.getElementsByTagName("w:del").length, 0)
+        self.assertEqual(self.comment_ids(), [])
+
+        batch.commit()
+        self.assertEqual((comment_id, reply_id), (0, 1))
+        self.assertEqual(self.comment_ids(), [0, 1])
+        self.assertEqual(
+            self.editor.dom.getElementsByTagName("w:commentRangeStart").length, 2
+        )
+        self.assertEqual(run.parentNode.tagName, "w:del")
+        self.assertEqual(
+            self.doc.reply_to_comment(parent_comment_id=reply_id, text="Ok"), 2
+        )
+
+    def test_context_manager_commits(self):
+        """Test that a batch used as a context manager commits when the block ends"""
+        paragraph = self.paragraph(1)
+        with self.doc.batch() as batch:
+            batch.add_comment(start=paragraph, end=paragraph, text="Check")
+        self.assertEqual(self.comment_ids(), [0])
+
+    def test_discard_gives_back_comment_ids(self):
+        """Test that a discarded batch applies nothing and leaves no gap in IDs"""
+        paragraph = self.paragraph(1)
+        batch = self.doc.batch()
+        comment_id = batch.add_comment(start=paragraph, end=paragraph, text="Check")
+        batch.reply_to_comment(parent_comment_id=comment_id, text="Done")
+        batch.discard()
+
+        self.assertEqual(self.comment_ids(), [])
+        self.assertNotIn(comment_id, self.doc.existing_comments)
+        self.assertEqual(
+            self.doc.add_comment(start=paragraph, end=paragraph, text="Check"), 0
+        )
+
+    def test_discard_keeps_later_comment_ids(self):
+        """Test that a discard does not give back IDs below a comment added meanwhile"""
+        paragraph = self.paragraph(1)
+        batch = self.doc.batch()
+        batch.add_comment(start=paragraph, end=paragraph, text="Queued")
+        self.assertEqual(
+            self.doc.add_comment(start=paragraph, end=paragraph, text="Added"), 1
+        )
+        batch.discard()
+        self.assertEqual(self.doc.next_comment_id, 2)
+
+    def test_exception_discards(self):
+        """Test that a block raising an exception discards the batch"""
+        paragraph = self.paragraph(1)
+        with self.assertRaises(RuntimeError):
+            with self.doc.batch() as batch:
+                batch.add_comment(start=paragraph, end=paragraph, text="Check")
+                batch.suggest_deletion(self.paragraph(2))
+                raise RuntimeError("stop")
+
+        self.assertEqual(self.comment_ids(), [])
+        self.assertEqual(self.editor.dom.getElementsByTagName("w:del").length, 0)
+        self.assertEqual(self.doc.next_comment_id, 0)
+
+    def test_closed_batch_rejects_edits(self):
+        """Test that a committed or discarded batch cannot be used again"""
+        paragraph = self.paragraph(1)
+        for close in ("commit", "discard"):
+            batch = self.doc.batch()
+            getattr(batch, close)()
+            with self.assertRaises(ValueError):
+                batch.add_comment(start=paragraph, end=paragraph, text="Check")
+            with self.assertRaises(ValueError):
+                batch.commit()
+
+    def test_unknown_parent_is_rejected(self):
+        """Test that a reply to an unknown comment is rejected when queued"""
+        batch = self.doc.batch()
+        with self.assertRaises(ValueError):
+            batch.reply_to_comment(parent_comment_id=5, text="Reply")
+
+
+class TestRedliningScope(DocumentTestCase):
+    def save(self):
+        destination = tempfile.TemporaryDirectory()
+        self.addCleanup(destination.cleanup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.doc.save(destination.name)
+
+    def test_editing_methods_record_paragraphs(self):
+        """Test that only the paragraph edited through the editor is recorded"""
+        self.editor.suggest_deletion(self.paragraph(2).getElementsByTagName("w:r")[1])
+        self.assertEqual(self.editor.dirty_para_ids, {"00000002"})
+        self.save()
+
+    def test_direct_edit_compares_whole_document(self):
+        """Test that an untracked edit through dom is found next to a recorded one"""
+        self.editor.suggest_deletion(self.paragraph(2).getElementsByTagName("w:r")[1])
+        self.paragraph(1).getElementsByTagName("w:t")[0].firstChild.appendData("X")
+        self.assertIsNone(self.editor.dirty_para_ids)
+        with self.assertRaises(ValueError):
+            self.save()
+
+    def test_direct_edit_before_editing_method_is_detected(self):
+        """Test that an editing method does not hide an earlier edit through dom"""
+        self.paragraph(1).removeChild(self.paragraph(1).firstChild)
+        self.editor.suggest_deletion(self.paragraph(2).getElementsByTagName("w:r")[1])
+        self.assertIsNone(self.editor.dirty_para_ids)
+        with self.assertRaises(ValueError):
+            self.save()
+
+
+if __name__ == "__main__":
+    unittest.main()
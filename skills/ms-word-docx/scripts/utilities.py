@@ -30,7 +30,11 @@ Example usage:
     editor.save()
 """
 
+import bisect
+import functools
 import html
+import re
+import xml.dom.minidom
 from pathlib import Path
 from typing import Optional, Union
 
@@ -38,6 +42,26 @@ import defusedxml.minidom
 import defusedxml.sax
 
 
+
+def edits_dom(method):
+    """Decorate an editing method of XMLEditor or a subclass.
+
+    The method must report every node it inserts or changes to
+    invalidate_index(). Indexes made stale by changes through dom before the
+    call are dropped first; the method's own changes keep the remaining
+    indexes current instead of counting as changes through dom.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._drop_stale_indexes()
+        result = method(self, *args, **kwargs)
+        self._dom_watch.reset()
+        return result
+
+    return wrapper
+
+
 class XMLEditor:
     """
     Editor for manipulating OOXML XML files with line-number-based node finding.
@@ -46,6 +70,14 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    get_node looks elements up in an index by tag, attribute value and line
+    number, built on the first call and updated by the editing methods, so
+    repeated lookups do not walk the whole DOM. Changes made through dom
+    directly are detected (see _DOMWatch) and make the next lookup rebuild
+    the index. Parsed XML fragments are likewise cached as templates, so
+    inserting fragments that differ only in attribute values does not parse
+    each one.
+
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
@@ -72,6 +104,9 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom_watch = _DOMWatch(self.dom)
+        self._index = None
+        self._fragments = _FragmentCache(self.dom)
 
     def get_node(
         self,
@@ -109,70 +144,22 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        index = self._get_index()
+        matches = [
+            elem
+            for elem in index.candidates(tag, attrs, line_number)
+            if _node_matches(
+                elem, attrs, line_number, normalized_contains, index.get_text
+            )
+            and index.verify(elem, normalized_contains)
+        ]
 
         if not matches:
-            # Build descriptive error message
-            filters = []
-            if line_number is not None:
-                line_str = (
-                    f"lines {line_number.start}-{line_number.stop - 1}"
-                    if isinstance(line_number, range)
-                    else f"line {line_number}"
-                )
-                filters.append(f"at {line_str}")
-            if attrs is not None:
-                filters.append(f"with attributes {attrs}")
-            if contains is not None:
-                filters.append(f"containing '{contains}'")
-
-            filter_desc = " ".join(filters) if filters else ""
-            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
-
-            # Add helpful hint based on filters used
-            if contains:
-                hint = "Text may be split across elements or use different wording."
-            elif line_number:
-                hint = "Line numbers may have changed if document was modified."
-            elif attrs:
-                hint = "Verify attribute values are correct."
-            else:
-                hint = "Try adding filters (attrs, line_number, or contains)."
-
-            raise ValueError(f"{base_msg}. {hint}")
+            raise _node_not_found_error(tag, attrs, line_number, contains)
         if len(matches) > 1:
             raise ValueError(
                 f"Multiple nodes found: <{tag}>. "
@@ -180,6 +167,46 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _scan_for_nodes(self, tag, attrs, line_number, contains):
+        """Find the elements matching get_node filters by walking the whole DOM."""
+        return [
+            elem
+            for elem in self.dom.getElementsByTagName(tag)
+            if _node_matches(elem, attrs, line_number, contains, self._get_element_text)
+        ]
+
+    def _get_index(self):
+        """Get the lookup index of get_node, building it on first use."""
+        self._drop_stale_indexes()
+        if self._index is None:
+            self._index = _NodeIndex(self.dom, self._get_element_text)
+            self._dom_watch.reset()
+        return self._index
+
+    def _drop_stale_indexes(self):
+        """Drop the indexes if dom was changed other than by the editing methods."""
+        if self._dom_watch.changed():
+            self._drop_indexes()
+
+    def _drop_indexes(self):
+        """Drop the lookup index of get_node, to be rebuilt on next use."""
+        self._index = None
+
+    def invalidate_index(self, node):
+        """
+        Update the lookup index of get_node for an inserted or changed node.
+
+        The editing methods call this for every node they insert or change
+        (its attributes, text or children); removed nodes are dropped
+        automatically. Changes made through dom directly need no call: they
+        are detected and rebuild the whole index on the next lookup.
+
+        Args:
+            node: Inserted or changed DOM node
+        """
+        if self._index is not None:
+            self._index.invalidate(node)
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -203,6 +230,7 @@ class XMLEditor:
                 text_parts.append(self._get_element_text(node))
         return "".join(text_parts)
 
+    @edits_dom
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -222,8 +250,11 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        for node in nodes:
+            self.invalidate_index(node)
         return nodes
 
+    @edits_dom
     def insert_after(self, elem, xml_content):
         """
         Insert XML content after a DOM element.
@@ -246,8 +277,10 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+            self.invalidate_index(node)
         return nodes
 
+    @edits_dom
     def insert_before(self, elem, xml_content):
         """
         Insert XML content before a DOM element.
@@ -266,8 +299,10 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+            self.invalidate_index(node)
         return nodes
 
+    @edits_dom
     def append_to(self, elem, xml_content):
         """
         Append XML content as a child of a DOM element.
@@ -285,6 +320,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+            self.invalidate_index(node)
         return nodes
 
     def get_next_rid(self):
@@ -322,27 +358,470 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
+        # Parsed with the namespace declarations of the root document element
+        nodes = self._fragments.parse(xml_content)
         elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
         assert elements, "Fragment must contain at least one element"
         return nodes
 
 
+# An attribute in XML source: leading whitespace, name and quoted value
+_ATTRIBUTE_PATTERN = re.compile(r"""\s([^\s=<>/"']+)\s*=\s*("[^"]*"|'[^']*')""")
+
+# Attribute values that a template can take as is: without entity or character
+# references and without whitespace that the parser would normalize
+_PLAIN_VALUE_PATTERN = re.compile(r"[^<&\t\n\r]*")
+
+
+class _FragmentCache:
+    """
+    Parsed XML fragments for XMLEditor._parse_fragment, reused across calls.
+
+    Fragments are parsed inside a wrapper element with the namespace
+    declarations of the document's root element. The wrapper is built once
+    and rebuilt only when the root's attributes change.
+
+    Each parsed fragment is kept as a template, keyed by its source with plain
+    attribute values left out (namespace declarations are always kept).
+    Fragments that differ only in those values, such as the comment ranges and
+    reference runs of different comments, share one template: its attribute
+    values are set and its nodes are imported into the document without
+    parsing. A fragment whose attributes cannot be matched with its source
+    (e.g. text that looks like an attribute) is always parsed.
+    """
+
+    def __init__(self, dom, max_templates=256):
+        """
+        Args:
+            dom: defusedxml.minidom.Document the fragments are imported into
+            max_templates: Number of templates kept, dropping the oldest first
+        """
+        self._dom = dom
+        self._max_templates = max_templates
+        # Root element attributes the wrapper was built from
+        self._root_attributes = None
+        self._wrapper_start = None
+        # Source with plain attribute values left out -> (wrapper child nodes,
+        # Attr nodes of the left out values), or None if always parsed
+        self._templates = {}
+
+    def parse(self, xml_content):
+        """
+        Parse a fragment and import its nodes into the document.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            List of defusedxml.minidom.Node objects imported into the document
+        """
+        root_attributes = self._dom.documentElement.attributes.items()
+        if root_attributes != self._root_attributes:
+            namespaces = [
+                f'{name}="{value}"'
+                for name, value in root_attributes
+                if name.startswith("xmlns")
+            ]
+            self._root_attributes = root_attributes
+            self._wrapper_start = f"<root {' '.join(namespaces)}>"
+            self._templates.clear()
+
+        # Left out values are replaced by a NUL character, which XML cannot contain
+        attributes = []
+
+        def leave_out_value(match):
+            name, quoted = match.groups()
+            value = quoted[1:-1]
+            # Namespace declarations are kept, as they decide the names parsed
+            plain = (
+                not name.startswith("xmlns")
+                and _PLAIN_VALUE_PATTERN.fullmatch(value) is not None
+            )
+            attributes.append((name, value, plain))
+            if not plain:
+                return match.group()
+            return match.group()[: match.start(2) - match.start()] + "\0"
+
+        key = _ATTRIBUTE_PATTERN.sub(leave_out_value, xml_content)
+        if key in self._templates:
+            template = self._templates.pop(key)
+            # Most recently used last
+            self._templates[key] = template
+        else:
+            template = self._parse_template(xml_content, attributes)
+            if len(self._templates) >= self._max_templates:
+                del self._templates[next(iter(self._templates))]
+            self._templates[key] = template
+
+        if template is None:
+            children = self._parse_wrapped(xml_content)
+        else:
+            children, slots = template
+            values = [value for _, value, plain in attributes if plain]
+            for attr, value in zip(slots, values):
+                attr.value = value
+
+        return [self._dom.importNode(child, deep=True) for child in children]
+
+    def _parse_template(self, xml_content, attributes):
+        """Parse a fragment into a template, or None if its attributes do not
+        match the ones found in its source."""
+        children = self._parse_wrapped(xml_content)
+
+        parsed = []
+        stack = list(reversed(children))
+        while stack:
+            node = stack.pop()
+            if node.nodeType == node.ELEMENT_NODE:
+                parsed.extend(node.attributes.values())
+                stack.extend(reversed(node.childNodes))
+
+        if len(parsed) != len(attributes):
+            return None
+        for attr, (name, value, plain) in zip(parsed, attributes):
+            if attr.name != name or (plain and attr.value != value):
+                return None
+
+        slots = [attr for attr, (_, _, plain) in zip(parsed, attributes) if plain]
+        return children, slots
+
+    def _parse_wrapped(self, xml_content):
+        """Parse a fragment in the wrapper and get the wrapper's child nodes."""
+        wrapper = f"{self._wrapper_start}{xml_content}</root>"
+        fragment_doc = defusedxml.minidom.parseString(wrapper)
+        return list(fragment_doc.documentElement.childNodes)  # type: ignore
+
+
+def _node_matches(elem, attrs, line_number, contains, get_text):
+    """
+    Check an element against the filters of XMLEditor.get_node.
+
+    Args:
+        elem: defusedxml.minidom.Element to check
+        attrs: Attribute name-value pairs to match, or None
+        line_number: Line number or range of the element's start tag, or None
+        contains: Normalized text the element must contain, or None
+        get_text: Function returning the text content of an element
+
+    Returns:
+        bool: True if the element passes all given filters
+    """
+    if line_number is not None:
+        elem_line = getattr(elem, "parse_position", (None,))[0]
+        # Handle both single line number and range
+        if isinstance(line_number, range):
+            if elem_line not in line_number:
+                return False
+        elif elem_line != line_number:
+            return False
+
+    if attrs is not None:
+        if not all(
+            elem.getAttribute(attr_name) == attr_value
+            for attr_name, attr_value in attrs.items()
+        ):
+            return False
+
+    return contains is None or contains in get_text(elem)
+
+
+class _WatchedText(xml.dom.minidom.Text):
+    """Text node that reports changes of its data to _DOMWatch."""
+
+    __slots__ = ()
+
+    def _set_data(self, data):
+        self._data = data
+        _DOMWatch.report(self.ownerDocument)
+
+    data = nodeValue = property(xml.dom.minidom.Text._get_data, _set_data)
+
+
+class _WatchedElement(xml.dom.minidom.Element):
+    """Element that reports every change of its children to _DOMWatch.
+
+    minidom itself only reports added and removed elements, not text nodes.
+    """
+
+    __slots__ = ()
+
+    def insertBefore(self, newChild, refChild):
+        result = super().insertBefore(newChild, refChild)
+        _DOMWatch.report(self.ownerDocument)
+        return result
+
+    def appendChild(self, node):
+        result = super().appendChild(node)
+        _DOMWatch.report(self.ownerDocument)
+        return result
+
+    def replaceChild(self, newChild, oldChild):
+        result = super().replaceChild(newChild, oldChild)
+        _DOMWatch.report(self.ownerDocument)
+        return result
+
+    def removeChild(self, oldChild):
+        result = super().removeChild(oldChild)
+        _DOMWatch.report(self.ownerDocument)
+        return result
+
+
+class _WatchedDocument(xml.dom.minidom.Document):
+    """Document whose new elements and text nodes report their changes to _DOMWatch."""
+
+    __slots__ = ()
+
+    def createElement(self, tagName):
+        node = super().createElement(tagName)
+        node.__class__ = _WatchedElement
+        return node
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        node = super().createElementNS(namespaceURI, qualifiedName)
+        node.__class__ = _WatchedElement
+        return node
+
+    def createTextNode(self, data):
+        node = super().createTextNode(data)
+        node.__class__ = _WatchedText
+        return node
+
+
+class _DOMWatch:
+    """
+    Detects changes to a minidom document, to find out when indexes are stale.
+
+    minidom clears the document's getElementById cache (_id_cache) whenever
+    an attribute or attribute value of a node in the document changes, or an
+    element is added or removed. A key of our own in that cache therefore
+    disappears on such changes. Elements and text nodes turned into
+    _WatchedElement and _WatchedText clear it too when any child is added or
+    removed and when text data changes. The constructor turns the parsed
+    nodes into them, and _WatchedDocument the nodes created later.
+    """
+
+    def __init__(self, dom):
+        """
+        Args:
+            dom: defusedxml.minidom.Document to watch
+        """
+        self._dom = dom
+        # Never equal to an ID, so getElementById cannot return it
+        self._key = object()
+        dom.__class__ = _WatchedDocument
+        stack = [dom]
+        while stack:
+            node = stack.pop()
+            for child in node.childNodes:
+                if type(child) is xml.dom.minidom.Text:
+                    child.__class__ = _WatchedText
+                elif type(child) is xml.dom.minidom.Element:
+                    child.__class__ = _WatchedElement
+                    stack.append(child)
+        self.reset()
+
+    @staticmethod
+    def report(dom):
+        """Record a change to a document, as minidom does for attributes and children."""
+        if dom is not None:
+            dom._id_cache.clear()
+
+    def changed(self):
+        """Check whether the document changed since the last reset()."""
+        return self._key not in self._dom._id_cache
+
+    def reset(self):
+        """Start watching for changes from now on."""
+        self._dom._id_cache[self._key] = None
+
+
+class _NodeIndex:
+    """
+    Lookup tables for XMLEditor.get_node, built lazily and kept current by edits.
+
+    Elements are grouped by tag name when the index is built. Within a tag,
+    elements are grouped by attribute value (per attribute name, on first
+    lookup with it) and sorted by original line number (on first lookup by
+    line), and element text is cached on first use.
+
+    Edited nodes are queued by invalidate() and re-indexed before the next
+    lookup, after the editor has finished changing them. Entries are never
+    removed eagerly: elements that were removed from the document or whose
+    attributes or text changed are filtered out by verify().
+    """
+
+    def __init__(self, dom, get_text):
+        """
+        Args:
+            dom: defusedxml.minidom.Document to index
+            get_text: Function returning the text content of an element
+        """
+        self._dom = dom
+        self._get_text = get_text
+        # tag -> {element: None}, an insertion-ordered set
+        self._by_tag = {}
+        # tag -> attribute name -> value -> {element: None}
+        self._by_attr = {}
+        # tag -> (sorted start lines, elements in the same order)
+        self._lines = {}
+        # element -> text content
+        self._text = {}
+        # Edited nodes not re-indexed yet -> None
+        self._pending = {}
+        for elem in dom.getElementsByTagName("*"):
+            self._by_tag.setdefault(elem.tagName, {})[elem] = None
+
+    def candidates(self, tag, attrs, line_number):
+        """
+        Get the elements that can match get_node filters, in no particular order.
+
+        Uses the tag, attribute and line tables; the caller still checks the
+        filters on every candidate (text is not pre-filtered).
+        """
+        self._apply_pending()
+        groups = []
+        if line_number is not None:
+            groups.append(self._on_lines(tag, line_number))
+        if attrs:
+            groups.extend(
+                self._with_attribute(tag, name, value) for name, value in attrs.items()
+            )
+        if not groups:
+            return list(self._by_tag.get(tag, ()))
+
+        groups.sort(key=len)
+        smallest, others = groups[0], groups[1:]
+        return [elem for elem in smallest if all(elem in group for group in others)]
+
+    def get_text(self, elem):
+        """Get the text content of an element, cached."""
+        text = self._text.get(elem)
+        if text is None:
+            text = self._text[elem] = self._get_text(elem)
+        return text
+
+    def verify(self, elem, contains):
+        """
+        Check that a matching element is still in the document and contains the text.
+
+        Drops elements that were removed from the document from the index.
+        The text is re-read, since it can change without the editor knowing.
+        """
+        node = elem
+        while node.parentNode is not None:
+            node = node.parentNode
+        if node is not self._dom:
+            self._by_tag.get(elem.tagName, {}).pop(elem, None)
+            self._text.pop(elem, None)
+            return False
+        if contains is None:
+            return True
+        self._text[elem] = self._get_text(elem)
+        return contains in self._text[elem]
+
+    def invalidate(self, node):
+        """Queue an inserted or changed node for re-indexing."""
+        self._drop_ancestor_text(node)
+        self._pending[node] = None
+
+    def _apply_pending(self):
+        """Re-index the queued nodes where they are now in the document."""
+        pending, self._pending = self._pending, {}
+        for node in pending:
+            # Ancestors may have changed since the node was queued (e.g. a
+            # run wrapped in a new w:del after being marked)
+            self._drop_ancestor_text(node)
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            elements = [node, *node.getElementsByTagName("*")]
+            parent = node.parentNode
+            if parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+                elements.append(parent)
+            for elem in elements:
+                self._text.pop(elem, None)
+                self._add(elem)
+
+    def _drop_ancestor_text(self, node):
+        """Forget the cached text of the elements containing a node."""
+        parent = node.parentNode
+        while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+            self._text.pop(parent, None)
+            parent = parent.parentNode
+
+    def _add(self, elem):
+        """Add an element to the tag table and to the attribute tables built so far."""
+        tag = elem.tagName
+        self._by_tag.setdefault(tag, {})[elem] = None
+        for name, by_value in self._by_attr.get(tag, {}).items():
+            by_value.setdefault(elem.getAttribute(name), {})[elem] = None
+
+    def _with_attribute(self, tag, name, value):
+        """Get the elements with a tag whose attribute had a value when last indexed."""
+        by_name = self._by_attr.setdefault(tag, {})
+        by_value = by_name.get(name)
+        if by_value is None:
+            by_value = by_name[name] = {}
+            for elem in self._by_tag.get(tag, ()):
+                by_value.setdefault(elem.getAttribute(name), {})[elem] = None
+        return by_value.get(value, {})
+
+    def _on_lines(self, tag, line_number):
+        """Get the elements with a tag whose start tag is on a line (or in a range)."""
+        if tag not in self._lines:
+            # Inserted elements have no position, so the table never grows
+            positioned = sorted(
+                (elem.parse_position[0], i, elem)
+                for i, elem in enumerate(self._by_tag.get(tag, ()))
+                if hasattr(elem, "parse_position")
+            )
+            self._lines[tag] = (
+                [line for line, _, _ in positioned],
+                [elem for _, _, elem in positioned],
+            )
+        lines, elements = self._lines[tag]
+
+        if isinstance(line_number, range):
+            if not line_number:
+                return {}
+            first, last = sorted((line_number[0], line_number[-1]))
+        else:
+            first = last = line_number
+        start = bisect.bisect_left(lines, first)
+        stop = bisect.bisect_right(lines, last)
+        return dict.fromkeys(elements[start:stop])
+
+
+def _node_not_found_error(tag, attrs, line_number, contains):
+    """Build the ValueError raised by get_node when no element matches the filters."""
+    filters = []
+    if line_number is not None:
+        line_str = (
+            f"lines {line_number.start}-{line_number.stop - 1}"
+            if isinstance(line_number, range)
+            else f"line {line_number}"
+        )
+        filters.append(f"at {line_str}")
+    if attrs is not None:
+        filters.append(f"with attributes {attrs}")
+    if contains is not None:
+        filters.append(f"containing '{contains}'")
+
+    filter_desc = " ".join(filters) if filters else ""
+    base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+    # Add helpful hint based on filters used
+    if contains:
+        hint = "Text may be split across elements or use different wording."
+    elif line_number:
+        hint = "Line numbers may have changed if document was modified."
+    elif attrs:
+        hint = "Verify attribute values are correct."
+    else:
+        hint = "Try adding filters (attrs, line_number, or contains)."
+
+    return ValueError(f"{base_msg}. {hint}")
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
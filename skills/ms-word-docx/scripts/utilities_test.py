@@ -0,0 +1,283 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from xml.parsers.expat import ExpatError
+
+import defusedxml.minidom
+
+from scripts.utilities import XMLEditor, _FragmentCache
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+# Pretty-printed, so that elements are on different lines
+PARAGRAPH = """
+    <w:p w14:paraId="{0:08X}" w:rsidR="00AB12CD">
+      <w:r>
+        <w:t xml:space="preserve">Paragraph {0} </w:t>
+      </w:r>
+      <w:r w:rsidR="00112233">
+        <w:t>text</w:t>
+      </w:r>
+    </w:p>"""
+
+DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}" xmlns:w14="{W14_NAMESPACE}">
+  <w:body>{{}}
+  </w:body>
+</w:document>
+"""
+
+FRAGMENTS = [
+    "<w:r><w:t>new text</w:t></w:r>",
+    '<w:ins w:id="1"><w:r><w:t>inserted</w:t></w:r></w:ins>',
+    '<w:p w14:paraId="0000FFFF"><w:r><w:t>new paragraph</w:t></w:r></w:p>',
+]
+
+
+def write_document(path, paragraphs=12):
+    """Write a word/document.xml with numbered paragraphs of two runs each."""
+    body = "".join(PARAGRAPH.format(i) for i in range(paragraphs))
+    Path(path).write_text(DOCUMENT.format(body), encoding="utf-8")
+
+
+# Currently not executed automatically in CI; run from the skill root with
+# python -m unittest scripts.utilities_test
+class TestNodeIndex(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "document.xml"
+        write_document(self.path)
+        self.editor = XMLEditor(self.path)
+
+    def assert_lookup_matches_scan(
+        self, tag, attrs=None, line_number=None, contains=None
+    ):
+        """Check that get_node finds what a full DOM scan finds."""
+        expected = self.editor._scan_for_nodes(tag, attrs, line_number, contains)
+        try:
+            found = [self.editor.get_node(tag, attrs, line_number, contains)]
+        except ValueError:
+            found = []
+        if len(expected) == 1:
+            self.assertEqual(len(found), 1, (tag, attrs, line_number, contains))
+            self.assertIs(found[0], expected[0])
+        else:
+            self.assertEqual(found, [], (tag, attrs, line_number, contains))
+
+    def random_query(self, rng):
+        """Get random get_node filters, most of them matching a few elements."""
+        query = {"tag": rng.choice(["w:p", "w:r", "w:t", "w:ins"])}
+        if rng.random() < 0.4:
+            start = rng.randint(1, 90)
+            query["line_number"] = rng.choice([start, range(start, start + 12)])
+        if rng.random() < 0.4:
+            query["attrs"] = rng.choice(
+                [
+                    {"w14:paraId": f"{rng.randint(0, 12):08X}"},
+                    {"w:rsidR": "00112233"},
+                    {"w:rsidR": "00AB12CD"},
+                    {"xml:space": "preserve"},
+                    {"w:id": "1"},
+                ]
+            )
+        if rng.random() < 0.5:
+            query["contains"] = rng.choice(
+                [f"Paragraph {rng.randint(0, 11)} ", "new", "text", "changed"]
+            )
+        return query
+
+    def random_edit(self, rng, node):
+        """Edit a found element through an editing method or dom directly."""
+        editor = self.editor
+        fragment = rng.choice(FRAGMENTS)
+        text = next(
+            (t.firstChild for t in node.getElementsByTagName("w:t") if t.firstChild),
+            None,
+        )
+        edit = rng.choice(
+            [
+                "replace_node",
+                "insert_after",
+                "insert_before",
+                "append_to",
+                "setAttribute",
+                "removeAttribute",
+                "removeChild",
+                "appendChild",
+                "data",
+                "appendData",
+            ]
+        )
+        if edit == "replace_node":
+            editor.replace_node(node, fragment)
+        elif edit == "insert_after":
+            editor.insert_after(node, fragment)
+        elif edit == "insert_before":
+            editor.insert_before(node, fragment)
+        elif edit == "append_to":
+            editor.append_to(node, fragment)
+        elif edit == "setAttribute":
+            node.setAttribute("w:rsidR", rng.choice(["00112233", "00AB12CD"]))
+        elif edit == "removeAttribute" and node.hasAttribute("w14:paraId"):
+            node.removeAttribute("w14:paraId")
+        elif edit == "removeChild":
+            node.parentNode.removeChild(node)
+        elif edit == "appendChild":
+            # Move the element to the end of the body
+            editor.dom.getElementsByTagName("w:body")[0].appendChild(node)
+        elif edit == "data" and text is not None:
+            text.data = "changed"
+        elif edit == "appendData" and text is not None:
+            text.appendData(" text")
+
+    def test_lookups_match_scan_while_editing(self):
+        """Test indexed lookups against full scans across random edits"""
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                write_document(self.path)
+                self.editor = XMLEditor(self.path)
+                rng = random.Random(seed)
+                for _ in range(150):
+                    query = self.random_query(rng)
+                    self.assert_lookup_matches_scan(**query)
+                    if rng.random() < 0.5:
+                        matches = self.editor._scan_for_nodes(
+                            query["tag"],
+                            query.get("attrs"),
+                            query.get("line_number"),
+                            query.get("contains"),
+                        )
+                        if matches:
+                            self.random_edit(rng, rng.choice(matches))
+
+    def test_direct_attribute_change_is_found(self):
+        """Test a lookup by an attribute value set through dom"""
+        paragraph = self.editor.get_node(tag="w:p", attrs={"w14:paraId": "00000003"})
+        paragraph.setAttribute("w14:paraId", "0000ABCD")
+        self.assertIs(
+            self.editor.get_node(tag="w:p", attrs={"w14:paraId": "0000ABCD"}),
+            paragraph,
+        )
+        self.assert_lookup_matches_scan("w:p", attrs={"w14:paraId": "00000003"})
+
+    def test_direct_text_change_is_found(self):
+        """Test a lookup by text appended to a text node through dom"""
+        t = self.editor.get_node(tag="w:t", contains="Paragraph 4 ")
+        t.firstChild.appendData("appended")
+        self.assertIs(self.editor.get_node(tag="w:t", contains="appended"), t)
+
+    def test_removed_element_is_not_found(self):
+        """Test that an element removed through dom is no longer found"""
+        paragraph = self.editor.get_node(tag="w:p", contains="Paragraph 5 ")
+        paragraph.parentNode.removeChild(paragraph)
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:p", contains="Paragraph 5 ")
+
+
+def describe(node):
+    """Get the structure of a node: names, namespaces, values and children."""
+    if node.nodeType != node.ELEMENT_NODE:
+        return (node.nodeType, node.nodeValue)
+    attributes = sorted(
+        (attr.name, attr.namespaceURI, attr.value)
+        for attr in node.attributes.values()
+    )
+    return (
+        node.tagName,
+        node.namespaceURI,
+        attributes,
+        [describe(child) for child in node.childNodes],
+    )
+
+
+class TestFragmentCache(unittest.TestCase):
+    def setUp(self):
+        self.dom = defusedxml.minidom.parseString(DOCUMENT.format(""))
+        self.cache = _FragmentCache(self.dom)
+
+    def assert_parsed_as_fresh(self, xml_content):
+        """Check that the cache parses a fragment as a new cache does."""
+        nodes = self.cache.parse(xml_content)
+        fresh = _FragmentCache(self.dom).parse(xml_content)
+        self.assertEqual([describe(n) for n in nodes], [describe(n) for n in fresh])
+        for node in nodes:
+            self.assertIs(node.ownerDocument, self.dom)
+        return nodes
+
+    def assert_all_parsed_as_fresh(self, template, values):
+        """Parse a fragment with each value twice, in turns."""
+        for value in values + values:
+            with self.subTest(value=value):
+                self.assert_parsed_as_fresh(template.format(value))
+
+    def test_plain_values(self):
+        """Test fragments that share a template, including an empty value"""
+        self.assert_all_parsed_as_fresh(
+            '<w:commentRangeStart w:id="{}"/><w:r><w:t>Text</w:t></w:r>',
+            ["0", "1", "", "12345"],
+        )
+
+    def test_escaped_values(self):
+        """Test values with entity and character references next to plain ones"""
+        self.assert_all_parsed_as_fresh(
+            '<w:comment w:author="{}" w:id="1"/>',
+            ["A", "A &amp; B", "&quot;Q&quot;", "A &#38; B", ""],
+        )
+
+    def test_normalized_whitespace_values(self):
+        """Test values with whitespace that the parser normalizes to spaces"""
+        self.assert_all_parsed_as_fresh(
+            '<w:comment w:author="{}"/>', ["A B", "A\tB", "A\nB", "A&#9;B"]
+        )
+
+    def test_nul_placeholder_in_source(self):
+        """Test text like a left out value or an attribute, and a NUL value"""
+        self.assert_all_parsed_as_fresh("<w:t>{}</w:t>", ["\\0", ' x="1"', ' x="2"'])
+        self.assert_all_parsed_as_fresh(
+            '<w:r w:rsidR="00AB"><w:t> a="{}"</w:t></w:r>', ["1", "2"]
+        )
+        with self.assertRaises(ExpatError):
+            self.cache.parse('<w:t w:val="\0"/>')
+
+    def test_namespaced_attributes(self):
+        """Test attributes in the root's namespaces and in declared namespaces"""
+        self.assert_all_parsed_as_fresh(
+            '<w:p w14:paraId="{}"><w:r><w:t xml:space="preserve"> x </w:t></w:r></w:p>',
+            ["00000001", "00000002"],
+        )
+        self.assert_all_parsed_as_fresh(
+            '<w:r xmlns:x="{}" x:a="1" w:rsidR="2"/>', ["urn:one", "urn:two"]
+        )
+        nodes = self.assert_parsed_as_fresh('<w:r xmlns:x="urn:two" x:a="1"/>')
+        self.assertEqual(nodes[0].getAttributeNode("x:a").namespaceURI, "urn:two")
+
+    def test_root_namespace_change(self):
+        """Test that namespaces declared on the root after parsing are used"""
+        root = self.dom.documentElement
+        root.setAttribute("xmlns:x", "urn:one")
+        self.assert_parsed_as_fresh('<w:r x:a="1"/>')
+        root.setAttribute("xmlns:x", "urn:two")
+        nodes = self.assert_parsed_as_fresh('<w:r x:a="1"/>')
+        self.assertEqual(nodes[0].getAttributeNode("x:a").namespaceURI, "urn:two")
+
+    def test_result_changes_do_not_affect_template(self):
+        """Test that editing returned nodes does not change later results"""
+        fragment = '<w:r w:rsidR="{}"><w:t>Text</w:t></w:r>'
+        nodes = self.assert_parsed_as_fresh(fragment.format("1"))
+        nodes[0].setAttribute("w:rsidR", "changed")
+        nodes[0].setAttribute("w:new", "added")
+        nodes[0].firstChild.firstChild.appendData(" changed")
+        nodes[0].appendChild(self.dom.createElement("w:tab"))
+
+        again = self.assert_parsed_as_fresh(fragment.format("1"))
+        self.assertIsNot(again[0], nodes[0])
+        self.assertEqual(nodes[0].getAttribute("w:rsidR"), "changed")
+        self.assert_parsed_as_fresh(fragment.format("2"))
+        self.assertEqual(nodes[0].getAttribute("w:rsidR"), "changed")
+
+
+if __name__ == "__main__":
+    unittest.main()